@@ -0,0 +1,54 @@
+# Latency percentiles of single add() calls while a set grows, for OrderedSet
+# and ShardedOrderedSet. The maximum latency of OrderedSet grows with the size
+# of the set, since resizing its dict copies all elements, while
+# ShardedOrderedSet only resizes one of its shards at a time.
+#
+# Usage: python add_latency.py [--sizes 100000 10000000] [--shards 64]
+#
+# Large sizes need several GB of memory.
+
+from __future__ import annotations
+
+from argparse import ArgumentParser
+from time import perf_counter_ns
+from typing import Any
+
+from orderedsets import OrderedSet
+from orderedsets.sharded import ShardedOrderedSet
+
+PERCENTILES = [50, 99, 99.9, 99.99]
+
+
+def add_latencies(s: Any, n: int) -> list[int]:
+    """Return the duration in ns of each of *n* calls of ``s.add``."""
+    add = s.add
+    latencies = [0] * n
+    for i in range(n):
+        start = perf_counter_ns()
+        add(i)
+        latencies[i] = perf_counter_ns() - start
+    return latencies
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000])
+    parser.add_argument("--shards", type=int, default=64)
+    args = parser.parse_args()
+
+    header = "".join(f"{'p' + str(p):>10}" for p in PERCENTILES)
+    print(f"{'class':<20}{'size':>10}{header}{'max':>12}  [us]")
+    for size in args.sizes:
+        sets: list[tuple[str, Any]] = [
+            ("OrderedSet", OrderedSet()),
+            ("ShardedOrderedSet", ShardedOrderedSet(shards=args.shards))]
+        for name, s in sets:
+            latencies = sorted(add_latencies(s, size))
+            values = "".join(
+                f"{latencies[min(size - 1, int(size * p / 100))] / 1000:>10.2f}"
+                for p in PERCENTILES)
+            print(f"{name:<20}{size:>10}{values}{latencies[-1] / 1000:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# Multi-threaded throughput of ConcurrentOrderedSet, compared to an OrderedSet
+# protected by a single global lock.
+#
+# Usage: python concurrent_speed.py [--ops N] [--threads 1 2 4 8]
+#
+# On builds with the GIL, threads do not run in parallel, so this mostly
+# measures locking overhead; on free-threaded builds it also measures contention.
+
+from argparse import ArgumentParser
+from threading import Barrier, Lock, Thread
+from time import perf_counter
+from typing import Any, Callable
+
+from orderedsets import OrderedSet
+from orderedsets.concurrent import ConcurrentOrderedSet
+
+
+def locked_ops(s: "OrderedSet[int]", lock: Lock) -> Callable[[int, int], None]:
+    def run(start: int, n: int) -> None:
+        for i in range(start, start + n):
+            with lock:
+                if i not in s:
+                    s.add(i)
+            with lock:
+                i - 1 in s  # noqa: B015
+            with lock:
+                s.discard(i - 2)
+    return run
+
+
+def concurrent_ops(s: "ConcurrentOrderedSet[int]") -> Callable[[int, int], None]:
+    def run(start: int, n: int) -> None:
+        for i in range(start, start + n):
+            s.add_if_absent(i)
+            i - 1 in s  # noqa: B015
+            s.discard(i - 2)
+    return run
+
+
+def measure(run: Callable[[int, int], None], nthreads: int, ops: int) -> float:
+    per_thread = ops // nthreads
+    barrier = Barrier(nthreads + 1)
+
+    def target(i: int) -> None:
+        barrier.wait()
+        run(i * per_thread, per_thread)
+
+    threads = [Thread(target=target, args=(i,)) for i in range(nthreads)]
+    for t in threads:
+        t.start()
+    barrier.wait()
+    start = perf_counter()
+    for t in threads:
+        t.join()
+    elapsed = perf_counter() - start
+
+    return 3 * per_thread * nthreads / elapsed
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("--ops", type=int, default=100_000)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    print("threads\tglobal lock [ops/s]\tConcurrentOrderedSet [ops/s]")
+    for nthreads in args.threads:
+        oset: OrderedSet[Any] = OrderedSet()
+        global_lock = measure(locked_ops(oset, Lock()), nthreads, args.ops)
+        striped = measure(concurrent_ops(ConcurrentOrderedSet()), nthreads, args.ops)
+        print(f"{nthreads}\t{global_lock:,.0f}\t\t{striped:,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+# Speed of membership tests that miss, for SharedFrozenOrderedSet with and
+# without a Bloom filter, and for FrozenOrderedSet as a reference.
+#
+# Usage: python filter_speed.py [--sizes 10000 1000000] [--error-rate 0.01]
+#
+# The sets contain strs. Half of the probes of "contains_mixed" are hits.
+
+from __future__ import annotations
+
+from argparse import ArgumentParser
+from timeit import Timer
+from typing import Any
+
+from orderedsets import FrozenOrderedSet
+from orderedsets.shared import SharedFrozenOrderedSet
+
+STATEMENTS = {
+    "contains_miss": "for x in misses: x in s",
+    "contains_mixed": "for x in mixed: x in s",
+    "isdisjoint": "s.isdisjoint(misses)",
+}
+PROBES = 10_000
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000])
+    parser.add_argument("--error-rate", type=float, default=0.01)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'class':<30}{'size':>10}  {'statement':<16}{'per probe [ns]':>16}")
+    for size in args.sizes:
+        items = [f"key{i}" for i in range(size)]
+        misses = [f"miss{i}" for i in range(PROBES)]
+        mixed = [x for pair in zip(misses, items) for x in pair][:PROBES]
+        with SharedFrozenOrderedSet(items) as plain, \
+                SharedFrozenOrderedSet(items,
+                                       filter_error_rate=args.error_rate) \
+                as filtered:
+            sets: list[tuple[str, Any]] = [
+                ("FrozenOrderedSet", FrozenOrderedSet(items)),
+                ("SharedFrozenOrderedSet", plain),
+                ("SharedFrozenOrderedSet+filter", filtered)]
+            for name, s in sets:
+                namespace = {"s": s, "misses": misses, "mixed": mixed}
+                for label, statement in STATEMENTS.items():
+                    timer = Timer(statement, globals=namespace)
+                    t = min(timer.repeat(args.repeat, number=1)) / PROBES
+                    print(f"{name:<30}{size:>10}  {label:<16}{t * 1e9:>16.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# Import time of orderedsets, measured with "python -X importtime".
+#
+# Usage: python import_time.py [--runs N]
+#
+# Reports the median time to import orderedsets in a fresh interpreter, both
+# including its (standard library) dependencies and on its own, i.e., with
+# the dependencies already imported, as well as the modules imported by it.
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from argparse import ArgumentParser
+from statistics import median
+
+# Dependencies of orderedsets/__init__.py (and typing on Python < 3.9)
+DEPENDENCIES = "import os, sys, collections.abc"
+if sys.version_info < (3, 9):
+    DEPENDENCIES += ", typing"
+
+
+def import_times(code: str) -> dict[str, tuple[int, int]]:
+    """Return the self and cumulative import times in microseconds of each \
+        module imported when running *code* in a new interpreter."""
+    stderr = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                            stderr=subprocess.PIPE, text=True,
+                            check=True).stderr
+    times = {}
+    for line in stderr.splitlines():
+        if line.startswith("import time:") and "self [us]" not in line:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|")
+            times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    total = []
+    alone = []
+    for _ in range(args.runs):
+        total.append(import_times("import orderedsets")["orderedsets"][1])
+        alone.append(import_times(f"{DEPENDENCIES}; import orderedsets")
+                     ["orderedsets"][1])
+
+    print(f"import orderedsets (median of {args.runs} runs):")
+    print(f"  including dependencies:   {median(total) / 1000:.2f} ms")
+    print(f"  excluding dependencies:   {median(alone) / 1000:.2f} ms")
+
+    before = set(import_times(DEPENDENCIES))
+    after = import_times(f"{DEPENDENCIES}; import orderedsets")
+    print("\nModules imported by orderedsets beyond its dependencies:")
+    for name, (self_us, cumulative_us) in after.items():
+        if name not in before:
+            print(f"  {name:<30}{self_us:>8} us self{cumulative_us:>8} us cumulative")
+
+    metadata = import_times("import orderedsets; orderedsets.__version__")
+    print("\nAccessing orderedsets.__version__ additionally takes "
+          f"{metadata.get('importlib.metadata', (0, 0))[1] / 1000:.2f} ms "
+          "to import importlib.metadata.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# Memory used by many sets of the same string identifiers, each parsed into
+# new str objects, for OrderedSet and InternedOrderedSet (and their frozen
+# variants), measured with tracemalloc, and the time of membership tests with
+# interned strings.
+#
+# Usage: python intern_memory.py [--names 10000] [--sets 10] [--length 20]
+#
+# With interning, the sets share one object per distinct identifier, so the
+# memory of the strings is only counted once instead of once per set.
+
+from __future__ import annotations
+
+import platform
+import sys
+import tracemalloc
+from argparse import ArgumentParser
+from functools import partial
+from timeit import timeit
+from typing import Any, Callable
+
+from orderedsets import FrozenOrderedSet, OrderedSet
+from orderedsets.interning import InternedFrozenOrderedSet, InternedOrderedSet
+
+CLASSES: dict[str, Callable[..., Any]] = {
+    "OrderedSet": OrderedSet,
+    "InternedOrderedSet": InternedOrderedSet,
+    "FrozenOrderedSet": FrozenOrderedSet,
+    "InternedFrozenOrderedSet": InternedFrozenOrderedSet,
+}
+
+
+def parsed_names(n: int, length: int) -> list[str]:
+    """Return *n* distinct identifiers of *length* characters, as new str \
+        objects."""
+    return [f"name_{i:0{length - 5}d}" for i in range(n)]
+
+
+def build(cls: Callable[..., Any], nsets: int, n: int, length: int) \
+        -> list[Any]:
+    """Return *nsets* sets of the same *n* identifiers."""
+    return [cls(parsed_names(n, length)) for _ in range(nsets)]
+
+
+def count(s: Any, probes: list[str]) -> int:
+    """Return the number of *probes* that are in *s*."""
+    return sum(map(s.__contains__, probes))
+
+
+def traced(func: Callable[[], Any]) -> tuple[Any, int]:
+    """Return the result of calling *func* and the memory it retains."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = func()
+        current = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return result, current - before
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("--names", type=int, default=10_000)
+    parser.add_argument("--sets", type=int, default=10)
+    parser.add_argument("--length", type=int, default=20)
+    args = parser.parse_args()
+
+    if platform.python_implementation() == "PyPy":
+        sys.exit("tracemalloc does not track object memory on PyPy.")
+
+    # Lookups with interned strings, e.g. identifiers from the source code.
+    probes = [sys.intern(name) for name in parsed_names(args.names, args.length)]
+
+    print(f"{'class':<26}{'MB':>10}{'bytes/elem':>12}{'in [ns]':>10}")
+    for name, cls in CLASSES.items():
+        sets, size = traced(partial(build, cls, args.sets, args.names,
+                                    args.length))
+        t = timeit(partial(count, sets[-1], probes), number=10)
+        per_elem = size / (args.names * args.sets)
+        print(f"{name:<26}{size / 2**20:>10.1f}{per_elem:>12.1f}"
+              f"{t / (10 * args.names) * 1e9:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
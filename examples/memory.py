@@ -0,0 +1,93 @@
+# Memory footprint of the set classes, compared to set, frozenset and dict,
+# measured with tracemalloc.
+#
+# Usage: python memory.py [--sizes 0 1 10 1000 100000]
+#
+# The first table shows the memory used by a set with the given number of
+# elements (not counting the elements themselves), the per-element cost, and
+# the overhead of an empty instance. The second table shows the memory
+# retained by the result and the peak memory allocated while computing it, for
+# operations between two sets that share half of their elements.
+
+from __future__ import annotations
+
+import platform
+import sys
+import tracemalloc
+from argparse import ArgumentParser
+from functools import partial
+from operator import iand, ior, isub, ixor
+from typing import Any, Callable
+
+from orderedsets import FrozenIndexSet, FrozenOrderedSet, IndexSet, OrderedSet
+
+CLASSES: dict[str, Callable[..., Any]] = {
+    "set": set,
+    "frozenset": frozenset,
+    "dict": dict.fromkeys,
+    "OrderedSet": OrderedSet,
+    "FrozenOrderedSet": FrozenOrderedSet,
+    "IndexSet": IndexSet,
+    "FrozenIndexSet": FrozenIndexSet,
+}
+
+IN_PLACE_OPERATORS = {"|=": ior, "&=": iand, "-=": isub, "^=": ixor}
+
+MUTABLE = ("set", "OrderedSet", "IndexSet")
+FROZEN = ("frozenset", "FrozenOrderedSet", "FrozenIndexSet")
+
+
+def traced(func: Callable[[], Any]) -> tuple[int, int]:
+    """Return the memory retained after calling *func* and the peak memory \
+        allocated during the call."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        # Keep the result alive until the memory is measured.
+        result = func()  # noqa: F841
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return current - before, peak - before
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        default=[0, 1, 10, 1000, 100_000])
+    args = parser.parse_args()
+
+    if platform.python_implementation() == "PyPy":
+        sys.exit("tracemalloc does not track object memory on PyPy.")
+
+    print(f"{'class':<18}{'size':>9}{'bytes':>12}{'bytes/elem':>12}"
+          f"{'overhead':>10}")
+    for size in args.sizes:
+        items = list(range(size))
+        for name, cls in CLASSES.items():
+            empty, _ = traced(partial(cls, ()))
+            total, _ = traced(partial(cls, items))
+            per_elem = f"{(total - empty) / size:.1f}" if size else "-"
+            print(f"{name:<18}{size:>9}{total:>12}{per_elem:>12}{empty:>10}")
+
+    print(f"\n{'class':<18}{'size':>9}{'operation':>14}{'result':>12}"
+          f"{'peak':>12}")
+    for size in args.sizes:
+        items = list(range(size))
+        other = list(range(size // 2, size + size // 2))
+        for name in MUTABLE + FROZEN:
+            cls = CLASSES[name]
+            s, o = cls(items), cls(other)
+            for op in ("union", "intersection"):
+                result, peak = traced(partial(getattr(s, op), o))
+                print(f"{name:<18}{size:>9}{op:>14}{result:>12}{peak:>12}")
+            if name in MUTABLE:
+                result, peak = traced(partial(cls(items).update, o))
+                print(f"{name:<18}{size:>9}{'update':>14}{result:>12}{peak:>12}")
+                for op, func in IN_PLACE_OPERATORS.items():
+                    result, peak = traced(partial(func, cls(items), o))
+                    print(f"{name:<18}{size:>9}{op:>14}{result:>12}{peak:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+# Scaling of the parallel set operations in orderedsets.parallel over the
+# number of workers, compared to the serial OrderedSet methods.
+#
+# Usage: python parallel_speed.py [--size N] [--workers 1 2 4 8] [--threads]
+#
+# The times include starting the pool of workers, which receive the operands
+# when they start. A speedup above 1 needs several CPUs and large operands;
+# without them, the parallel functions are slower than the serial methods,
+# which they therefore use by default on builds with the global interpreter
+# lock.
+
+from argparse import ArgumentParser
+from time import perf_counter
+
+from orderedsets import OrderedSet, parallel
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("--size", type=int, default=200_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--threads", action="store_true",
+                        help="use threads instead of processes")
+    args = parser.parse_args()
+
+    a = OrderedSet(range(args.size))
+    b = OrderedSet(range(args.size // 2, args.size + args.size // 2))
+
+    print(f"size={args.size}, {'threads' if args.threads else 'processes'}")
+
+    for op in ("union", "intersection", "difference", "symmetric_difference"):
+        start = perf_counter()
+        expected = getattr(a, op)(b)
+        serial = perf_counter() - start
+        print(f"\n{op}\n  serial\t\t{serial:.3f}s")
+
+        for workers in args.workers:
+            start = perf_counter()
+            result = getattr(parallel, op)(a, b, workers,
+                                           use_threads=args.threads)
+            elapsed = perf_counter() - start
+
+            assert list(result) == list(expected)
+            print(f"  workers={workers}\t{elapsed:.3f}s"
+                  f"\tspeedup={serial / elapsed:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# Speed of OrderedSet.sort() and FrozenOrderedSet.sorted(), compared to the
+# round trip through a list, OrderedSet(sorted(s)).
+#
+# Usage: python sort_speed.py [--sizes 1000 10000] [--repeat 5]
+#
+# The sets contain ints or strs that are already sorted, reverse sorted, or
+# shuffled. Sorting an already sorted set only checks the order and does not
+# rebuild the set.
+
+from __future__ import annotations
+
+import random
+from argparse import ArgumentParser
+from timeit import Timer
+from typing import Any
+
+from orderedsets import FrozenOrderedSet, OrderedSet
+
+# Since s.sort() modifies s, each statement is timed once after a fresh setup.
+STATEMENTS = [
+    "OrderedSet(sorted(s))",
+    "s.sort()",
+    "FrozenOrderedSet(sorted(f))",
+    "f.sorted()",
+]
+SETUP = "s = OrderedSet(items); f = FrozenOrderedSet(items)"
+
+
+def make_items(kind: str, order: str, size: int) -> list[Any]:
+    items: list[Any] = (list(range(size)) if kind == "int"
+                        else [f"{i:09d}" for i in range(size)])
+    if order == "reversed":
+        items.reverse()
+    elif order == "shuffled":
+        random.Random(0).shuffle(items)
+    return items
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    namespace: dict[str, Any] = {
+        "OrderedSet": OrderedSet, "FrozenOrderedSet": FrozenOrderedSet}
+
+    print(f"{'type':<6}{'order':<10}{'size':>8}  {'statement':<28}{'time [s]':>10}")
+    for kind in ("int", "str"):
+        for order in ("sorted", "reversed", "shuffled"):
+            for size in args.sizes:
+                namespace["items"] = make_items(kind, order, size)
+                for statement in STATEMENTS:
+                    timer = Timer(statement, SETUP, globals=namespace)
+                    t = min(timer.repeat(args.repeat, number=1))
+                    print(f"{kind:<6}{order:<10}{size:>8}  {statement:<28}"
+                          f"{t:>10.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,90 +1,343 @@
-# Simple speed test for various set implementations
+# Benchmark suite for tracking the performance of the set classes over time.
+#
+# Usage:
+#   python speed.py [run] [--sizes 1 1000 ...] [--types int str tuple]
+#                   [--classes ...] [--operations ...] [--output run.json]
+#   python speed.py compare base.json new.json [--threshold 0.1]
+#
+# "run" times every public operation of OrderedSet, FrozenOrderedSet, IndexSet
+# and FrozenIndexSet (and of the builtin set and frozenset as a reference) for
+# each combination of set size and element type, prints the results, and
+# optionally saves them as JSON. The default sizes are small enough to finish
+# in about a minute; for a full run, use e.g.
+#   python speed.py run --sizes 1 10 100 1000 10000 100000 1000000 10000000
+#
+# "compare" matches the results of two saved runs and reports every
+# measurement whose best time changed by more than the threshold (a fraction,
+# 0.1 means 10%). It exits with status 1 if any measurement regressed, so it
+# can be used in scripts. Runs should be compared on the same machine. With
+# --normalize, each time is divided by the time of the same measurement for
+# the builtin set or frozenset of the same run, which makes the comparison
+# robust against changes in machine speed between the runs.
 
-from timeit import timeit
+from __future__ import annotations
 
-import ordered_set  # type: ignore[import-not-found,unused-ignore]
-import orderedset  # type: ignore[import-not-found,unused-ignore]
+import json
+import platform
+import sys
+from argparse import ArgumentParser, Namespace
+from datetime import datetime, timezone
+from fnmatch import fnmatch
+from pickle import dumps, loads
+from statistics import median
+from timeit import Timer
+from typing import Any, Callable, NamedTuple, Tuple
 
-# https://github.com/idanmiara/ordered-set (pip install stableset), v5.2.1:
-from ordered_set import OrderedSet as list_set  # noqa: F401, N813
+import orderedsets
+from orderedsets import FrozenIndexSet, FrozenOrderedSet, IndexSet, OrderedSet
 
-# https://github.com/simonpercivall/orderedset (pip install orderedset), v2.0.3:
-from orderedset import OrderedSet as cython_ordered_set  # noqa: F401, N813
+SCHEMA_VERSION = 1
 
-import orderedsets
-from orderedsets import FrozenOrderedSet, OrderedSet  # noqa: F401
-
-print(f"Versions:\norderedsets={orderedsets.__version__},\n"
-      f"orderedset={orderedset.__version__},\n"
-      f"ordered_set={ordered_set.__version__}")
-
-
-for base_set in [{1}, set(range(1000))]:
-    print("\nbase_set length:", len(base_set), "\n=====================")
-
-    for set_impl in ("set", "frozenset", "OrderedSet", "FrozenOrderedSet",
-                     "cython_ordered_set", "list_set"):
-
-        print(set_impl)
-
-        print("  creation\t", timeit(f"{set_impl}({base_set})",
-                                     number=10000, globals=globals()))
-
-        try:
-            print("  hash\t\t", timeit(f"hash({set_impl}({base_set}))",
-                                       number=10000, globals=globals()))
-        except (AttributeError, TypeError):
-            print("  hash MISSING")
-
-        try:
-            print("  hash2\t\t", timeit("for i in range(1000): hash(x)",
-                                        setup=f"x={set_impl}({base_set})",
-                                        number=10000, globals=globals()))
-        except (AttributeError, TypeError):
-            print("  hash2 MISSING")
-
-        print("  elem_access\t", timeit("next(iter(x))",
-                                        setup=f"x={set_impl}({base_set})",
-                                        number=10000, globals=globals()))
-
-        print("  list(keys)\t", timeit(f"list({set_impl}({base_set}))",
-                                       number=10000, globals=globals()))
-
-        print("  union\t\t", timeit("x.union(y)",
-                                    setup=f"x={set_impl}({base_set});"
-                                          f"y={set_impl}({base_set})",
-                                    number=10000, globals=globals()))
-
-        print("  intersection\t", timeit("x.intersection(y)",
-                                         setup=f"x={set_impl}({base_set});"
-                                               f"y={set_impl}({base_set})",
-                                         number=10000, globals=globals()))
-
-        try:
-            print("  add\t\t", timeit("x.add(y)",
-                                      setup=f"x={set_impl}({base_set});"
-                                            f"y={next(iter(base_set))}",
-                                      number=10000, globals=globals()))
-        except AttributeError:
-            print("  add MISSING")
-
-        try:
-            # discards nonexisting element
-            print("  discard\t", timeit("x.discard(y)",
-                                        setup=f"x={set_impl}({base_set});"
-                                              f"y={next(iter(base_set))}",
-                                        number=10000, globals=globals()))
-        except AttributeError:
-            print("  discard MISSING")
-
-        try:
-            print("  pop\t\t", timeit(f"for i in {base_set}: x.pop(); x.add(i)",
-                                      setup=f"x={set_impl}({base_set})",
-                                      number=10000, globals=globals()))
-        except AttributeError:
-            print("  pop MISSING")
-
-        print("  difference\t", timeit("x.difference(y)",
-                                       setup=f"x={set_impl}({base_set});"
-                                             f"y={next(iter(base_set)), }",
-                                       number=10000, globals=globals()))
+
+class Operation(NamedTuple):
+    name: str
+    statement: str
+    # Which classes the operation applies to: "all", "mutable", "frozen",
+    # "sortable" (mutable ordered sets), "frozen_ordered", "indexed" or
+    # "mutable_indexed".
+    kind: str = "all"
+    # The element types the operation supports, or None for all.
+    element_types: tuple[str, ...] | None = None
+
+
+# The element types that have a stable encoding, see orderedsets.merkle.
+STABLE_TYPES = ("int", "str")
+
+# In the statements, "s" is the set under test, "o" a set of the same class
+# that overlaps with half of "s", "t" an equal copy of "s", "x" an element of
+# "s", "y" an element that is not in "s", "m" the middle index and "items"
+# the list of elements of "s".
+OPERATIONS = [
+    Operation("init", "cls(items)"),
+    Operation("len", "len(s)"),
+    Operation("contains_hit", "x in s"),
+    Operation("contains_miss", "y in s"),
+    Operation("iter", "for _ in s: pass"),
+    Operation("repr", "repr(s)"),
+    Operation("eq", "s == t"),
+    Operation("copy", "s.copy()"),
+    Operation("pickle", "loads(dumps(s))"),
+    Operation("union", "s.union(o)"),
+    Operation("intersection", "s.intersection(o)"),
+    Operation("difference", "s.difference(o)"),
+    Operation("symmetric_difference", "s.symmetric_difference(o)"),
+    Operation("or", "s | o"),
+    Operation("and", "s & o"),
+    Operation("sub", "s - o"),
+    Operation("xor", "s ^ o"),
+    Operation("isdisjoint", "s.isdisjoint(o)"),
+    Operation("issubset", "s.issubset(t)"),
+    Operation("issuperset", "s.issuperset(t)"),
+    Operation("le", "s <= t"),
+    Operation("lt", "s < o"),
+    Operation("ge", "s >= t"),
+    Operation("gt", "s > o"),
+    Operation("hash", "hash(s)", "frozen"),
+    Operation("init+hash", "hash(cls(items))", "frozen"),
+    Operation("sorted", "s.sorted()", "frozen_ordered"),
+    Operation("sorted_reverse", "s.sorted(reverse=True)", "frozen_ordered"),
+    Operation("ordered_hash", "s.ordered_hash()", "frozen_ordered"),
+    Operation("init+ordered_hash", "cls(items).ordered_hash()",
+              "frozen_ordered"),
+    Operation("init+ordered_hash_stable", "cls(items).ordered_hash(stable=True)",
+              "frozen_ordered", STABLE_TYPES),
+    Operation("ordered_key_eq", "s.ordered_key() == t.ordered_key()",
+              "frozen_ordered"),
+    Operation("digest", "s.digest()", "frozen_ordered", STABLE_TYPES),
+    Operation("init+digest", "cls(items).digest()", "frozen_ordered",
+              STABLE_TYPES),
+    Operation("add_existing", "s.add(x)", "mutable"),
+    Operation("add+discard", "s.add(y); s.discard(y)", "mutable"),
+    Operation("discard_missing", "s.discard(y)", "mutable"),
+    Operation("remove+add", "s.remove(x); s.add(x)", "mutable"),
+    Operation("pop+add", "s.add(s.pop())", "mutable"),
+    Operation("copy+clear", "s.copy().clear()", "mutable"),
+    Operation("copy+update", "s.copy().update(o)", "mutable"),
+    Operation("copy+difference_update", "s.copy().difference_update(o)",
+              "mutable"),
+    Operation("copy+intersection_update", "s.copy().intersection_update(o)",
+              "mutable"),
+    Operation("copy+symmetric_difference_update",
+              "s.copy().symmetric_difference_update(o)", "mutable"),
+    Operation("copy+ior", "u = s.copy(); u |= o", "mutable"),
+    Operation("copy+iand", "u = s.copy(); u &= o", "mutable"),
+    Operation("copy+isub", "u = s.copy(); u -= o", "mutable"),
+    Operation("copy+ixor", "u = s.copy(); u ^= o", "mutable"),
+    Operation("copy+sort", "s.copy().sort()", "sortable"),
+    Operation("copy+sort_reverse", "s.copy().sort(reverse=True)", "sortable"),
+    Operation("getitem_first", "s[0]", "indexed"),
+    Operation("getitem_middle", "s[m]", "indexed"),
+    Operation("getitem_last", "s[-1]", "indexed"),
+    Operation("slice_head", "s[:10]", "indexed"),
+    Operation("slice_tail", "s[-10:]", "indexed"),
+    Operation("index", "s.index(x)", "indexed"),
+    Operation("insert+remove", "s.insert(m, y); s.remove(y)",
+              "mutable_indexed"),
+    Operation("move", "s.move(x, 0); s.move(x, m)", "mutable_indexed"),
+    Operation("move_to_end+move", "s.move_to_end(x); s.move(x, m)",
+              "mutable_indexed"),
+]
+
+CLASSES: dict[str, tuple[Callable[..., Any], tuple[str, ...]]] = {
+    "OrderedSet": (OrderedSet, ("all", "mutable", "sortable")),
+    "FrozenOrderedSet": (FrozenOrderedSet, ("all", "frozen", "frozen_ordered")),
+    "IndexSet": (IndexSet,
+                 ("all", "mutable", "sortable", "indexed", "mutable_indexed")),
+    "FrozenIndexSet": (FrozenIndexSet,
+                       ("all", "frozen", "frozen_ordered", "indexed")),
+    "set": (set, ("all", "mutable")),
+    "frozenset": (frozenset, ("all", "frozen")),
+}
+
+ELEMENT_TYPES: dict[str, Callable[[int], Any]] = {
+    "int": lambda i: i,
+    "str": lambda i: f"s{i}",
+    "tuple": lambda i: (i, i % 7),
+}
+
+Key = Tuple[str, str, str, int]
+
+
+def key(result: dict[str, Any]) -> Key:
+    return (result["class"], result["operation"], result["element_type"],
+            result["size"])
+
+
+# {{{ run
+
+def measure(statement: str, namespace: dict[str, Any], min_time: float,
+            repeat: int) -> tuple[int, list[float]]:
+    # Returns the number of executions per repetition and the time per
+    # execution of each repetition.
+    timer = Timer(statement, globals=namespace)
+    # Calibrate (this also serves as a warmup).
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+    return number, [timer.timeit(number) / number for _ in range(repeat)]
+
+
+def run(args: Namespace) -> None:
+    results = []
+    print(f"{'class':<18}{'operation':<34}{'type':<7}{'size':>10}"
+          f"{'best [s]':>12}{'median [s]':>12}")
+
+    for size in args.sizes:
+        for type_name in args.types:
+            make = ELEMENT_TYPES[type_name]
+            # The first 'size' elements are in "s", the last 'size' elements
+            # in "o".
+            all_items = [make(i) for i in range(size + size // 2)]
+            items = all_items[:size]
+
+            for cls_name in args.classes:
+                cls, kinds = CLASSES[cls_name]
+                namespace = {
+                    "cls": cls, "items": items,
+                    "s": cls(items), "t": cls(items),
+                    "o": cls(all_items[size // 2:]),
+                    "x": items[size // 2], "y": make(-1), "m": size // 2,
+                    "dumps": dumps, "loads": loads,
+                }
+                for op in OPERATIONS:
+                    if op.kind not in kinds or not any(
+                            fnmatch(op.name, p) for p in args.operations):
+                        continue
+                    if (op.element_types is not None
+                            and type_name not in op.element_types):
+                        continue
+
+                    number, times = measure(op.statement, namespace,
+                                            args.min_time, args.repeat)
+                    results.append({
+                        "class": cls_name, "operation": op.name,
+                        "element_type": type_name, "size": size,
+                        "number": number, "times": times,
+                    })
+                    print(f"{cls_name:<18}{op.name:<34}{type_name:<7}{size:>10}"
+                          f"{min(times):>12.3g}{median(times):>12.3g}")
+
+    if args.output:
+        data = {
+            "schema_version": SCHEMA_VERSION,
+            "metadata": {
+                "label": args.label,
+                "date": datetime.now(timezone.utc).isoformat(),
+                "orderedsets_version": orderedsets.__version__,
+                "python_implementation": platform.python_implementation(),
+                "python_version": platform.python_version(),
+                "platform": platform.platform(),
+                "machine": platform.machine(),
+                "processor": platform.processor(),
+                "min_time": args.min_time,
+                "repeat": args.repeat,
+            },
+            "results": results,
+        }
+        with open(args.output, "w") as f:
+            json.dump(data, f, indent=1)
+        print(f"\nSaved {len(results)} results to {args.output}")
+
+# }}}
+
+
+# {{{ compare
+
+def load(filename: str) -> dict[str, Any]:
+    with open(filename) as f:
+        data: dict[str, Any] = json.load(f)
+    if data.get("schema_version") != SCHEMA_VERSION:
+        sys.exit(f"{filename}: unsupported schema version "
+                 f"{data.get('schema_version')}")
+    return data
+
+
+def best_times(results: list[dict[str, Any]], normalize: bool) -> dict[Key, float]:
+    times = {key(r): min(r["times"]) for r in results}
+    if not normalize:
+        return times
+
+    # Divide by the time of the builtin reference class for the same
+    # measurement, which cancels out changes in the speed of the machine.
+    normalized = {}
+    for (cls_name, op, type_name, size), t in times.items():
+        reference = times.get(
+            ("frozenset" if "Frozen" in cls_name else "set", op, type_name, size))
+        if reference is not None and cls_name not in ("set", "frozenset"):
+            normalized[cls_name, op, type_name, size] = t / reference
+    return normalized
+
+
+def compare(args: Namespace) -> int:
+    base = load(args.base)
+    new = load(args.new)
+
+    for field in ("python_implementation", "python_version", "machine",
+                  "processor"):
+        if base["metadata"][field] != new["metadata"][field]:
+            print(f"Warning: {field} differs: {base['metadata'][field]!r} vs. "
+                  f"{new['metadata'][field]!r}")
+
+    base_times = best_times(base["results"], args.normalize)
+    new_times = best_times(new["results"], args.normalize)
+    rows = [(new_times[k] / base_times[k], k, base_times[k], new_times[k])
+            for k in new_times if k in base_times]
+
+    regressions = [row for row in rows if row[0] > 1 + args.threshold]
+    improvements = [row for row in rows if row[0] < 1 / (1 + args.threshold)]
+
+    for title, selected in (("Regressions", regressions),
+                            ("Improvements", improvements)):
+        print(f"\n{title} (threshold {args.threshold:.0%}): {len(selected)}")
+        if selected:
+            unit = "" if args.normalize else " [s]"
+            print(f"  {'class':<18}{'operation':<34}{'type':<7}{'size':>10}"
+                  f"{'base' + unit:>12}{'new' + unit:>12}{'ratio':>8}")
+        for ratio, (cls_name, op, type_name, size), b_time, n_time in sorted(
+                selected, reverse=title == "Regressions"):
+            print(f"  {cls_name:<18}{op:<34}{type_name:<7}{size:>10}"
+                  f"{b_time:>12.3g}{n_time:>12.3g}{ratio:>8.2f}")
+
+    print(f"\nCompared {len(rows)} measurements.")
+
+    return 1 if regressions else 0
+
+# }}}
+
+
+def main() -> None:
+    parser = ArgumentParser(description="orderedsets benchmark suite")
+    subparsers = parser.add_subparsers(dest="command")
+
+    run_parser = subparsers.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("--sizes", type=int, nargs="+", default=[1, 1000])
+    run_parser.add_argument("--types", nargs="+", choices=list(ELEMENT_TYPES),
+                            default=list(ELEMENT_TYPES))
+    run_parser.add_argument("--classes", nargs="+", choices=list(CLASSES),
+                            default=list(CLASSES))
+    run_parser.add_argument("--operations", nargs="+", default=["*"],
+                            help="glob patterns of operations to run "
+                                 f"(out of: {', '.join(o.name for o in OPERATIONS)})")
+    run_parser.add_argument("--min-time", type=float, default=0.01,
+                            help="minimum duration of one repetition [s]")
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument("--output", help="save the results to this JSON file")
+    run_parser.add_argument("--label", default="",
+                            help="a description of this run, saved in the output")
+
+    compare_parser = subparsers.add_parser(
+        "compare", help="compare two saved runs and report regressions")
+    compare_parser.add_argument("base")
+    compare_parser.add_argument("new")
+    compare_parser.add_argument("--threshold", type=float, default=0.1,
+                                help="relative change to report (default: 0.1)")
+    compare_parser.add_argument(
+        "--normalize", action="store_true",
+        help="compare times relative to the builtin set/frozenset of the same "
+             "run (requires that both runs include them)")
+
+    argv = sys.argv[1:]
+    if not argv or argv[0] not in ("run", "compare", "-h", "--help"):
+        argv = ["run", *argv]
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        sys.exit(compare(args))
+    run(args)
+
+
+if __name__ == "__main__":
+    main()
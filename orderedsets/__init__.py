@@ -27,21 +27,20 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-try:
-    import importlib.metadata as importlib_metadata
-except ModuleNotFoundError:  # pragma: no cover
-    # Python 3.7
-    import importlib_metadata  # type: ignore[no-redef]
-
-__version__ = importlib_metadata.version(__package__ or __name__)
-
+import os
 import sys
 from collections.abc import (
     Hashable,
     Iterable,
     Iterator,
 )
-from typing import Any, TypeVar
+from itertools import islice, tee
+from operator import eq, lt
+
+# Importing typing takes several times as long as this module, so it is only
+# imported for type checking, and on Python versions whose collections.abc
+# classes cannot be subscripted.
+TYPE_CHECKING = False
 
 if sys.version_info >= (3, 9):  # pragma: no cover
     from collections.abc import MutableSet, Set  # noqa: PYI025
@@ -49,14 +48,49 @@ else:  # pragma: no cover
     from typing import AbstractSet as Set
     from typing import MutableSet
 
-T = TypeVar("T", bound=Hashable)
-T_co = TypeVar("T_co", covariant=True, bound=Hashable)
+# reversed() on dicts requires Python 3.8.
+_HAVE_REVERSED_DICT = sys.version_info >= (3, 8)
+
+if not TYPE_CHECKING and sys.version_info >= (3, 9):  # pragma: no cover
+    # Placeholder parameters of the generic base classes below, which are
+    # replaced by TypeVars on first access (see __getattr__).
+    T = "T"
+    T_co = "T_co"
+else:  # pragma: no cover
+    from typing import TypeVar
+
+    T = TypeVar("T", bound=Hashable)
+    T_co = TypeVar("T_co", covariant=True, bound=Hashable)
+
+if TYPE_CHECKING:
+    from typing import Any, Callable
+
+    from orderedsets._slots import SlotIndex
+    from orderedsets.merkle import MerkleDigest
 
 
 class _NotProvided:
     pass
 
 
+def _is_sorted(elements: Iterable[Any], key: Callable[[Any], Any] | None,
+               reverse: bool) -> bool:
+    # Whether sorted(elements, key=key, reverse=reverse) would not change the
+    # order of *elements*, checked in one pass without building a list. Like
+    # sorted(), this only uses "<", and equal elements keep their order.
+    it = iter(elements) if key is None else map(key, elements)
+    a, b = tee(it)
+    next(b, None)
+    return not any(map(lt, a, b) if reverse else map(lt, b, a))
+
+
+def _sorted(elements: Iterable[T], key: Callable[[T], Any] | None,
+            reverse: bool) -> list[T]:
+    # type-ignore-reason: typeshed's overloads of sorted() require either
+    # comparable elements or a key, not an optional key.
+    return sorted(elements, key=key, reverse=reverse)  # type: ignore[type-var,arg-type]
+
+
 class OrderedSet(MutableSet[T]):
     """A set class that preserves insertion order.
 
@@ -146,7 +180,8 @@ class OrderedSet(MutableSet[T]):
 
         common_keys = list(self._dict.keys())
         for other in others:
-            common_keys = [key for key in common_keys if key in set(other)]
+            other_elems = set(other)
+            common_keys = [key for key in common_keys if key in other_elems]
 
         self._dict = dict.fromkeys(common_keys)
 
@@ -156,6 +191,8 @@ class OrderedSet(MutableSet[T]):
 
     def issubset(self, s: Iterable[T]) -> bool:
         """Return whether this set is a subset of *s*."""
+        if not isinstance(s, Set):
+            s = set(s)
         return all(i in s for i in self)
 
     def issuperset(self, s: Iterable[T]) -> bool:
@@ -170,11 +207,30 @@ class OrderedSet(MutableSet[T]):
         """Remove *element* from this set, raising :exc:`KeyError` if not present."""
         del self._dict[element]
 
+    def sort(self, *, key: Callable[[T], Any] | None = None,
+             reverse: bool = False) -> None:
+        """Sort the elements of this set in place, like :meth:`list.sort`.
+
+        The set is left unchanged if it is already sorted, which is detected in
+        a single pass.
+
+        .. doctest::
+
+            >>> oset = OrderedSet([3, 1, 2])
+            >>> oset.sort()
+            >>> oset
+            OrderedSet({1, 2, 3})
+        """
+        if not _is_sorted(self._dict, key, reverse):
+            self._dict = dict.fromkeys(_sorted(self._dict, key, reverse))
+
     def symmetric_difference(self, s: Iterable[T]) -> OrderedSet[T]:
         """Return the symmetric difference of this set and *s*."""
+        # Sets can be iterated twice and contain no duplicates.
+        other = s if isinstance(s, Set) else dict.fromkeys(s)
         return self.__class__(
-            dict.fromkeys([e for e in self._dict if e not in s]
-                          + [e for e in s if e not in self._dict]))
+            dict.fromkeys([e for e in self._dict if e not in other]
+                          + [e for e in other if e not in self._dict]))
 
     def symmetric_difference_update(self, s: Iterable[T]) -> None:
         """Update this set to be the symmetric difference of itself and *s*."""
@@ -271,8 +327,18 @@ class FrozenOrderedSet(Set[T_co]):
         FrozenOrderedSet({'a', 'b', 'c', 'd'})
         >>> foset == set(["a", "b", "c", "d"])
         True
+
+    .. automethod:: ordered_hash
+    .. automethod:: ordered_key
+    .. automethod:: digest
     """
 
+    # The cached digest of this set, or of a set whose elements this set
+    # starts with, see digest().
+    _digest: MerkleDigest | None = None
+    # The cached result of ordered_hash().
+    _my_ordered_hash: int | None = None
+
     def __init__(self, items: Iterable[T_co] | type[_NotProvided] = _NotProvided)\
             -> None:
         """Create a new :class:`FrozenOrderedSet`, optionally initialized \
@@ -308,6 +374,39 @@ class FrozenOrderedSet(Set[T_co]):
         self._my_hash = hash(frozenset(self))
         return self._my_hash
 
+    def ordered_hash(self, *, stable: bool = False) -> int:
+        """Return a hash of this set that depends on the order of its elements.
+
+        Unlike :meth:`__hash__`, sets with the same elements in different
+        orders usually have different ordered hashes. The hash is cached after
+        the first call.
+
+        If *stable* is true, the hash is a 64-bit integer that does not depend
+        on the process (e.g. on ``PYTHONHASHSEED``), so that it can be stored,
+        e.g. as a key of an on-disk cache. It is derived from the cached
+        :meth:`digest`, so that the elements must be :class:`int`,
+        :class:`str` or :class:`bytes`.
+        """
+        if stable:
+            return int.from_bytes(self.digest().root[:8], "little")
+        if self._my_ordered_hash is None:
+            self._my_ordered_hash = hash(tuple(self._dict))
+        return self._my_ordered_hash
+
+    def ordered_key(self) -> OrderedKey:
+        """Return a key for the elements of this set in their order, e.g. for \
+            dicts that must distinguish sets with different orders.
+
+        .. doctest::
+
+            >>> memo = {FrozenOrderedSet("ab").ordered_key(): 1}
+            >>> FrozenOrderedSet("ab").ordered_key() in memo
+            True
+            >>> FrozenOrderedSet("ba").ordered_key() in memo
+            False
+        """
+        return OrderedKey(self)
+
     def __eq__(self, other: object) -> bool:
         """Return whether this set is equal to *other*."""
         return (isinstance(other, Set)
@@ -335,7 +434,26 @@ class FrozenOrderedSet(Set[T_co]):
 
     def copy(self) -> FrozenOrderedSet[T_co]:
         """Return a shallow copy of this set."""
-        return self.__class__(self._dict)
+        result = self.__class__(self._dict)
+        if self._digest is not None:
+            result._digest = self._digest
+        return result
+
+    def digest(self, chunk_size: int = 1024) -> MerkleDigest:
+        """Return an order-sensitive digest of this set that does not depend on \
+            the process, see :mod:`orderedsets.merkle`.
+
+        The digest is cached. The sets returned by :meth:`union` and
+        :meth:`copy` reuse the cached digest of this set for the elements that
+        they start with, so that only the added elements are hashed.
+        """
+        from orderedsets.merkle import MerkleDigest
+        digest = self._digest
+        if (digest is None or digest.length != len(self._dict)
+                or digest.chunk_size != chunk_size):
+            digest = self._digest = MerkleDigest(self._dict, chunk_size,
+                                                 prefix=digest)
+        return digest
 
     def difference(self, *others: Iterable[T_co]) -> FrozenOrderedSet[T_co]:
         """Return the difference of this set and *others*."""
@@ -357,9 +475,11 @@ class FrozenOrderedSet(Set[T_co]):
 
     def symmetric_difference(self, s: Iterable[T_co]) -> FrozenOrderedSet[T_co]:
         """Return the symmetric difference of this set and *s*."""
+        # Sets can be iterated twice and contain no duplicates.
+        other = s if isinstance(s, Set) else dict.fromkeys(s)
         return self.__class__(
-            dict.fromkeys([e for e in self._dict if e not in s]
-                          + [e for e in s if e not in self._dict]))
+            dict.fromkeys([e for e in self._dict if e not in other]
+                          + [e for e in other if e not in self._dict]))
 
     def isdisjoint(self, s: Iterable[T_co]) -> bool:
         """Return whether this set is disjoint with *s*."""
@@ -367,16 +487,38 @@ class FrozenOrderedSet(Set[T_co]):
 
     def issubset(self, s: Iterable[T_co]) -> bool:
         """Return whether this set is a subset of *s*."""
+        if not isinstance(s, Set):
+            s = set(s)
         return all(i in s for i in self)
 
     def issuperset(self, s: Iterable[T_co]) -> bool:
         """Return whether this set is a superset of *s*."""
         return set(self).issuperset(set(s))
 
+    def sorted(self, *, key: Callable[[T_co], Any] | None = None,
+               reverse: bool = False) -> FrozenOrderedSet[T_co]:
+        """Return a set with the elements of this set in sorted order, like \
+            :func:`sorted`.
+
+        Returns this set itself if it is already sorted, which is detected in a
+        single pass.
+
+        .. doctest::
+
+            >>> FrozenOrderedSet([3, 1, 2]).sorted(reverse=True)
+            FrozenOrderedSet({3, 2, 1})
+        """
+        if _is_sorted(self._dict, key, reverse):
+            return self
+        return self.__class__(_sorted(self._dict, key, reverse))
+
     def union(self, *others: Iterable[T_co]) -> FrozenOrderedSet[T_co]:
         """Return the union of this set and *others*."""
-        return self.__class__(list(self._dict)
+        result = self.__class__(list(self._dict)
                                 + [e for other in others for e in other])
+        if self._digest is not None:
+            result._digest = self._digest
+        return result
 
     def __and__(self, s: Set[T_co]) -> FrozenOrderedSet[T_co]:
         """Return the intersection of this set and *s*."""
@@ -395,15 +537,175 @@ class FrozenOrderedSet(Set[T_co]):
         return self.symmetric_difference(s)
 
 
+class OrderedKey:
+    """A hashable key for the elements of a :class:`FrozenOrderedSet` in their \
+        order, returned by :meth:`FrozenOrderedSet.ordered_key`.
+
+    Keys are equal if their sets have the same elements in the same order.
+    Their hash is the cached :meth:`FrozenOrderedSet.ordered_hash` of the set,
+    so that, unlike ``tuple(s)``, a key does not copy the elements and its hash
+    is only computed once per set.
+
+    .. attribute:: set
+
+        The set of this key.
+    """
+
+    __slots__ = ("set",)
+
+    def __init__(self, s: FrozenOrderedSet[Any]) -> None:
+        """Create a key for *s*."""
+        self.set = s
+
+    def __hash__(self) -> int:
+        """Return the ordered hash of the set of this key."""
+        return self.set.ordered_hash()
+
+    def __eq__(self, other: object) -> bool:
+        """Return whether *other* is a key for the same elements in the same \
+            order."""
+        if not isinstance(other, OrderedKey):
+            return False
+        a, b = self.set, other.set
+        return a is b or (len(a) == len(b)
+                          and a.ordered_hash() == b.ordered_hash()
+                          and all(map(eq, a, b)))
+
+    def __repr__(self) -> str:
+        """Return a string representation of this key."""
+        return f"{self.__class__.__name__}({self.set!r})"
+
+
+# Elements that are at most this many positions further from the nearer end
+# of an IndexSet or FrozenIndexSet than the number of requested elements are
+# reached by iterating over the dict, without building a position index.
+_MAX_SCAN = 32
+
+
+def _positions(n: int, index: int | slice) -> range:
+    # The positions selected by *index* in a sequence of length *n*.
+    if isinstance(index, int):
+        if index < 0:
+            index = n + index
+
+        if index >= n or index < 0:
+            raise IndexError("Index out of range.")
+
+        return range(index, index + 1)
+
+    elif isinstance(index, slice):
+        return range(*index.indices(n))
+
+    else:
+        raise TypeError("Index must be an integer or slice.")
+
+
+def _is_near_end(n: int, positions: range) -> bool:
+    # Whether the elements at *positions* are cheap to reach by iterating over
+    # a dict of length *n* from its nearer end.
+    if not positions:
+        return True
+    lo = min(positions[0], positions[-1])
+    hi = max(positions[0], positions[-1])
+    distance = min(hi + 1, n - lo) if _HAVE_REVERSED_DICT else hi + 1
+    return distance <= hi - lo + 1 + _MAX_SCAN
+
+
+def _getitem(d: dict[T, Any], index: int | slice) -> T | list[T]:
+    # Implements __getitem__ of IndexSet and FrozenIndexSet for elements near
+    # the ends. Elements are reached by iterating from the nearer end of the
+    # dict, so that the cost is the distance of the requested elements from
+    # that end (plus their number times the step for slices).
+    n = len(d)
+    positions = _positions(n, index)
+
+    if isinstance(index, int):
+        index = positions[0]
+        if index <= n // 2 or not _HAVE_REVERSED_DICT:
+            return next(islice(d, index, None))
+        return next(islice(reversed(d), n - 1 - index, None))
+
+    if not positions:
+        return []
+
+    step = abs(positions.step)
+    lo = min(positions[0], positions[-1])
+    hi = max(positions[0], positions[-1])
+
+    if hi + 1 <= n - lo or not _HAVE_REVERSED_DICT:
+        result = list(islice(d, lo, hi + 1, step))
+        forward = True
+    else:
+        result = list(islice(reversed(d), n - 1 - hi, n - lo, step))
+        forward = False
+
+    if forward != (positions.step > 0):
+        result.reverse()
+    return result
+
+
 class IndexSet(OrderedSet[T]):
     """A set class that preserves insertion order and allows indexing.
 
-    The only change in API from :class:`set` is the addition of the
-    :meth:`__getitem__` method.
+    The only changes in API from :class:`set` are the addition of the
+    :meth:`__getitem__` and :meth:`index` methods, and of methods to insert and
+    move elements at given positions.
+
+    Elements near either end are reached by iterating over the set. The first
+    access further inside (or the first insertion or move) builds a position
+    index in O(n), after which indexing, :meth:`index` and removing elements
+    take O(log n) under any mix of additions and removals. Removed elements
+    leave gaps in the index, which is compacted once fewer than half of its
+    slots are in use. :meth:`insert` and :meth:`move` take amortized
+    O(sqrt(n)), and the first iteration after them takes an additional O(n).
+    Operations that rebuild the set, such as :meth:`clear`, drop the index.
+
+    .. doctest::
+
+        >>> iset = IndexSet(["a", "b", "c", "d"])
+        >>> iset.insert(1, "X")
+        >>> iset.move("d", 0)
+        >>> iset.move_to_end("a")
+        >>> iset
+        IndexSet({'d', 'X', 'b', 'c', 'a'})
 
     .. automethod:: __getitem__
+    .. automethod:: index
+    .. automethod:: insert
+    .. automethod:: move
+    .. automethod:: move_to_end
     """
 
+    # While the index exists, the values of the dict are the slots of the
+    # elements in the index.
+    _dict: dict[T, Any]
+
+    def __init__(self, items: Iterable[T] | type[_NotProvided] = _NotProvided)\
+            -> None:
+        """Create a new :class:`IndexSet`, optionally initialized with *items*."""
+        super().__init__(items)
+        self._index: SlotIndex | None = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state of this set for pickling."""
+        self._sync()
+        return {"_dict": dict.fromkeys(self._dict)}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the state of this set from *state*."""
+        self._dict = state["_dict"]
+        self._index = None
+
+    def _build_index(self) -> SlotIndex:
+        from orderedsets._slots import SlotIndex
+        self._index = SlotIndex(self._dict)
+        return self._index
+
+    def _sync(self) -> None:
+        # Sort the dict in the order of the set after insertions or moves.
+        if self._index is not None:
+            self._index.sync()
+
     def __getitem__(self, index: int | slice) -> T | list[T]:
         """Return the element at *index* or a list of elements for a slice.
 
@@ -417,34 +719,257 @@ class IndexSet(OrderedSet[T]):
             >>> iset[-2:-8:-2]
             ['h', 'f', 'd']
         """
+        n = len(self._dict)
+        positions = _positions(n, index)
+        slot_index = self._index
+        if slot_index is None:
+            if _is_near_end(n, positions):
+                return _getitem(self._dict, index)
+            slot_index = self._build_index()
+
         if isinstance(index, int):
-            if index < 0:
-                index = len(self) + index
+            element: T = slot_index.element_at(positions[0])
+            return element
+        if not positions:
+            return []
+        return slot_index.select(positions)
 
-            if index >= len(self) or index < 0:
-                raise IndexError("Index out of range.")
+    def index(self, element: T) -> int:
+        """Return the position of *element*.
 
-            from itertools import islice
-            return next(islice(self._dict.keys(), index, index + 1))
+        Raises :exc:`ValueError` if *element* is not in this set.
 
-        elif isinstance(index, slice):
-            from more_itertools import islice_extended
-            return list(
-                islice_extended(self._dict.keys(), index.start, index.stop, index.step))
+        .. doctest::
 
+            >>> IndexSet(["a", "b", "c"]).index("c")
+            2
+        """
+        if element not in self._dict:
+            raise ValueError(f"{element!r} is not in set")
+        slot_index = self._index
+        if slot_index is None:
+            if len(self._dict) <= _MAX_SCAN:
+                return list(self._dict).index(element)
+            slot_index = self._build_index()
+        return slot_index.index_of(self._dict[element])
+
+    # {{{ operations that use the order of the dict
+
+    def __iter__(self) -> Iterator[T]:
+        """Return an iterator over the elements of this set."""
+        self._sync()
+        return iter(self._dict)
+
+    def __repr__(self) -> str:
+        """Return a string representation of this set."""
+        self._sync()
+        return super().__repr__()
+
+    def copy(self) -> IndexSet[T]:
+        """Return a shallow copy of this set."""
+        self._sync()
+        return self.__class__(self._dict)
+
+    def difference(self, *others: Iterable[T]) -> OrderedSet[T]:
+        """Return all elements that are in this set but not in *others*."""
+        self._sync()
+        return super().difference(*others)
+
+    def intersection(self, *others: Iterable[T]) -> OrderedSet[T]:
+        """Return a new set with elements common to this set and all *others*."""
+        self._sync()
+        return super().intersection(*others)
+
+    def symmetric_difference(self, s: Iterable[T]) -> OrderedSet[T]:
+        """Return the symmetric difference of this set and *s*."""
+        self._sync()
+        return super().symmetric_difference(s)
+
+    def union(self, *others: Iterable[T]) -> OrderedSet[T]:
+        """Return a new set with elements from this set and *others*."""
+        self._sync()
+        return super().union(*others)
+
+    # }}}
+
+    # {{{ mutations
+
+    def insert(self, index: int, element: T) -> None:
+        """Insert *element* before position *index*, like :meth:`list.insert`.
+
+        Does nothing if *element* is already in this set.
+        """
+        if element in self._dict:
+            return
+        n = len(self._dict)
+        index = max(0, n + index) if index < 0 else min(index, n)
+        if index == n:
+            self.add(element)
         else:
-            raise TypeError("Index must be an integer or slice.")
+            (self._index or self._build_index()).insert(index, element)
+
+    def move(self, element: T, index: int) -> None:
+        """Move *element* to position *index*.
+
+        Raises :exc:`KeyError` if *element* is not in this set and
+        :exc:`IndexError` if *index* is out of range.
+        """
+        if element not in self._dict:
+            raise KeyError(element)
+        index = _positions(len(self._dict), index)[0]
+        slot_index = self._index or self._build_index()
+        slot_index.remove(self._dict.pop(element))
+        slot_index.insert(index, element)
+
+    def sort(self, *, key: Callable[[T], Any] | None = None,
+             reverse: bool = False) -> None:
+        """Sort the elements of this set in place, like :meth:`list.sort`."""
+        self._sync()
+        d = self._dict
+        super().sort(key=key, reverse=reverse)
+        if self._dict is not d:
+            self._index = None
+
+    def move_to_end(self, element: T, last: bool = True) -> None:
+        """Move *element* to the end of this set, or to the beginning if \
+            *last* is false, like :meth:`collections.OrderedDict.move_to_end`.
+
+        Raises :exc:`KeyError` if *element* is not in this set.
+        """
+        if not last:
+            self.move(element, 0)
+            return
+        slot = self._dict.pop(element)
+        if self._index is None:
+            self._dict[element] = None
+        else:
+            self._index.remove(slot)
+            self._index.append(element)
+
+    def add(self, element: T) -> None:
+        """Add *element* to this set."""
+        if self._index is None:
+            self._dict[element] = None
+        elif element not in self._dict:
+            self._index.append(element)
+
+    def discard(self, element: T) -> None:
+        """Remove *element* from this set if it is present."""
+        if element in self._dict:
+            slot = self._dict.pop(element)
+            if self._index is not None:
+                self._index.remove(slot)
+
+    def remove(self, element: T) -> None:
+        """Remove *element* from this set, raising :exc:`KeyError` if not present."""
+        if element not in self._dict:
+            raise KeyError(element)
+        self.discard(element)
+
+    def pop(self) -> T:
+        """Remove and return the last element of this set."""
+        if self._index is None or not self._dict:
+            return super().pop()
+        element: T = self._index.last()
+        self._index.remove(self._dict.pop(element))
+        return element
+
+    def clear(self) -> None:
+        """Remove all elements from this set."""
+        self._dict.clear()
+        self._index = None
+
+    def update(self, *others: Iterable[T]) -> None:
+        """Update this set to be the union of itself and *others*."""
+        if self._index is None:
+            super().update(*others)
+            return
+        for other in others:
+            for e in other:
+                self.add(e)
+
+    def difference_update(self, *others: Iterable[T]) -> None:
+        """Update this set to remove all items that are in *others*."""
+        for other in others:
+            for e in list(other) if other is self else other:
+                self.discard(e)
+
+    def intersection_update(self, *others: Iterable[T]) -> None:
+        """Update this set to be the intersection of itself and *others*."""
+        if self._index is None:
+            super().intersection_update(*others)
+            return
+        keep = [other if isinstance(other, Set) else set(other)
+                for other in others]
+        for e in [e for e in self._dict if not all(e in k for k in keep)]:
+            self.discard(e)
+
+    def symmetric_difference_update(self, s: Iterable[T]) -> None:
+        """Update this set to be the symmetric difference of itself and *s*."""
+        if self._index is None:
+            super().symmetric_difference_update(s)
+            return
+        for e in dict.fromkeys(s):
+            if e in self._dict:
+                self.discard(e)
+            else:
+                self.add(e)
+
+    def __iand__(self, s: Set[T]) -> IndexSet[T]:
+        """Update this set to be the intersection of itself and *s*."""
+        self.intersection_update(s)
+        return self
+
+    def __ior__(self, s: Set[Any]) -> IndexSet[T]:
+        """Update this set to be the union of itself and *s*."""
+        self.update(s)
+        return self
+
+    def __isub__(self, s: Set[T]) -> IndexSet[T]:
+        """Update this set to be the difference of itself and *s*."""
+        self.difference_update(s)
+        return self
+
+    def __ixor__(self, s: Set[Any]) -> IndexSet[T]:
+        """Update this set to be the symmetric difference of itself and *s*."""
+        self.symmetric_difference_update(s)
+        return self
+
+    # }}}
 
 
 class FrozenIndexSet(FrozenOrderedSet[T_co]):
     """A frozen set class that preserves insertion order and allows indexing.
 
-    The only change in API from :class:`frozenset` is the addition of the
-    :meth:`__getitem__` method.
+    The only changes in API from :class:`frozenset` are the addition of the
+    :meth:`__getitem__` and :meth:`index` methods.
+
+    Elements near either end are reached by iterating over the set. The first
+    access further inside builds a list of the elements in O(n), after which
+    indexing is O(1). The first call of :meth:`index` stores the positions of
+    the elements, after which it is O(1) as well.
 
     .. automethod:: __getitem__
+    .. automethod:: index
     """
 
+    # After the first call of index(), the values of the dict are the positions
+    # of the elements.
+    _dict: dict[T_co, Any]
+
+    def __init__(self, items: Iterable[T_co] | type[_NotProvided] = _NotProvided)\
+            -> None:
+        """Create a new :class:`FrozenIndexSet`, optionally initialized \
+            with *items*."""
+        super().__init__(items)
+        self._elements: list[T_co] | None = None
+        self._have_positions = False
+
+    def _element_list(self) -> list[T_co]:
+        if self._elements is None:
+            self._elements = list(self._dict)
+        return self._elements
+
     def __getitem__(self, index: int | slice) -> T_co | list[T_co]:
         """Return the element at *index* or a list of elements for a slice.
 
@@ -458,20 +983,86 @@ class FrozenIndexSet(FrozenOrderedSet[T_co]):
             >>> fiset[-2:-8:-2]
             ['h', 'f', 'd']
         """
-        if isinstance(index, int):
-            if index < 0:
-                index = len(self) + index
+        n = len(self._dict)
+        positions = _positions(n, index)
+        if self._elements is None and _is_near_end(n, positions):
+            return _getitem(self._dict, index)
+        return self._element_list()[index]
 
-            if index >= len(self) or index < 0:
-                raise IndexError("Index out of range.")
+    def index(self, element: Any) -> int:
+        """Return the position of *element*.
 
-            from itertools import islice
-            return next(islice(self._dict.keys(), index, index + 1))
+        Raises :exc:`ValueError` if *element* is not in this set.
 
-        elif isinstance(index, slice):
-            from more_itertools import islice_extended
-            return list(
-                islice_extended(self._dict.keys(), index.start, index.stop, index.step))
+        .. doctest::
 
-        else:
-            raise TypeError("Index must be an integer or slice.")
+            >>> FrozenIndexSet(["a", "b", "c"]).index("c")
+            2
+        """
+        if element not in self._dict:
+            raise ValueError(f"{element!r} is not in set")
+        if not self._have_positions:
+            for i, e in enumerate(self._element_list()):
+                self._dict[e] = i
+            self._have_positions = True
+        position: int = self._dict[element]
+        return position
+
+
+if not TYPE_CHECKING and sys.version_info >= (3, 9):  # pragma: no cover
+    # Replace the placeholders on first access.
+    del T, T_co
+
+# Submodules that can be accessed as attributes without importing them first.
+_SUBMODULES = frozenset({"asyncqueue", "concurrent", "diffing", "interning",
+                         "io", "merkle", "parallel", "profiling", "sharded",
+                         "shared", "sortedindex", "spill", "tracking",
+                         "versioned", "weak"})
+
+# Functions that can be accessed as attributes, from the given submodules.
+_FUNCTIONS = {"diff": "diffing", "patch": "diffing"}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve ``__version__``, submodules and their functions, and the \
+        :class:`~typing.TypeVar` instances ``T`` and ``T_co`` lazily on first \
+        access.
+
+    This keeps ``import orderedsets`` fast, since looking up the version scans
+    the installed distributions, and importing :mod:`typing` takes several
+    times as long as this module.
+    """
+    if name == "__version__":
+        try:
+            import importlib.metadata as importlib_metadata
+        except ModuleNotFoundError:  # pragma: no cover
+            # Python 3.7
+            import importlib_metadata  # type: ignore[no-redef]
+
+        version = importlib_metadata.version(__package__ or __name__)
+        globals()["__version__"] = version
+        return version
+
+    if name in ("T", "T_co"):
+        from typing import TypeVar
+        globals().update(T=TypeVar("T", bound=Hashable),
+                         T_co=TypeVar("T_co", covariant=True, bound=Hashable))
+        return globals()[name]
+
+    if name in _SUBMODULES:
+        import importlib
+        return importlib.import_module(f"{__name__}.{name}")
+
+    if name in _FUNCTIONS:
+        import importlib
+        func = getattr(importlib.import_module(f"{__name__}.{_FUNCTIONS[name]}"),
+                       name)
+        globals()[name] = func
+        return func
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+if os.environ.get("ORDEREDSETS_PROFILE"):  # pragma: no cover
+    from orderedsets.profiling import _enable_from_environment
+    _enable_from_environment(os.environ["ORDEREDSETS_PROFILE"])
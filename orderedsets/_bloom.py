@@ -0,0 +1,184 @@
+"""A blocked Bloom filter over 64-bit hashes.
+
+It answers whether an element may have been added with a tunable false
+positive rate, and never rejects an added element. Elements are passed as
+hashes, so that the callers choose the hash function (e.g. :func:`hash` for
+process-local sets, :func:`~orderedsets._encoding.stable_hash` for stored
+ones).
+
+All bits of an element are set in a single 64-bit word, chosen by the hash,
+using one of a fixed table of masks with *k* bits each, also chosen by the
+hash. A lookup thus reads one word instead of *k* scattered bits, which
+matters more in Python than the higher false positive rate of blocked
+filters. The filter compensates with more bits per element, chosen from the
+expected false positive rate given the Poisson-distributed number of elements
+per word.
+"""
+
+from __future__ import annotations
+
+__copyright__ = """
+Copyright (C) 2026 University of Illinois Board of Trustees
+"""
+
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from array import array
+from math import ceil, exp, sqrt
+
+_MASK64 = (1 << 64) - 1
+# Odd multiplier that, followed by an xorshift, mixes the bits of the hash,
+# so that hashes that only differ in their low bits (such as those of small
+# ints) choose unrelated words.
+_MIX = 0x9E3779B97F4A7C15
+# Multiplier of a second mix of the result of the first, which chooses the
+# mask independently of the word.
+_MIX_MASK = 0xBF58476D1CE4E5B9
+_MASK_TABLE_BITS = 12
+# A mask from the table is rotated by 6 more bits of the second mix, so that
+# two elements rarely get the same mask, which would make a probe that
+# shares a word with one of them a false positive.
+_MASK_SHIFT = 64 - _MASK_TABLE_BITS
+_ROTATE_SHIFT = _MASK_SHIFT - 6
+
+_mask_tables: dict[int, list[int]] = {}
+
+
+def _masks(k: int) -> list[int]:
+    # The masks with k distinct bits each, from a fixed splitmix64 sequence.
+    table = _mask_tables.get(k)
+    if table is None:
+        table = []
+        state = 0
+        for _ in range(1 << _MASK_TABLE_BITS):
+            mask = nbits = 0
+            while nbits < k:
+                state = (state + _MIX) & _MASK64
+                z = state
+                z = (z ^ (z >> 30)) * 0xBF58476D1CE4E5B9 & _MASK64
+                z = (z ^ (z >> 27)) * 0x94D049BB133111EB & _MASK64
+                bit = 1 << ((z ^ (z >> 31)) >> 58)
+                if not mask & bit:
+                    mask |= bit
+                    nbits += 1
+            table.append(mask)
+        _mask_tables[k] = table
+    return table
+
+
+def _false_positive_rate(load: float, k: int) -> float:
+    # The expected false positive rate for an average of *load* elements per
+    # word and *k* bits per element.
+    unset = 1 - k / 64
+    total = 0.
+    p = exp(-load)
+    j = 0
+    while j < load + 12 * sqrt(load) + 12:
+        total += p * (1 - unset ** j) ** k
+        j += 1
+        p *= load / j
+    return total
+
+
+_sizes: dict[float, tuple[float, int]] = {}
+
+
+def _size(error_rate: float) -> tuple[float, int]:
+    # The number of bits per element (within 5% of the minimum) and bits per
+    # mask that achieve *error_rate*.
+    size = _sizes.get(error_rate)
+    if size is None:
+        bits = 2.
+        while size is None:
+            for k in range(1, 17):
+                if _false_positive_rate(64 / bits, k) <= error_rate:
+                    size = bits, k
+                    break
+            bits *= 1.05
+        _sizes[error_rate] = size
+    return size
+
+
+def filter_words(capacity: int, error_rate: float) -> int:
+    """Return the number of 64-bit words of a filter for *capacity* elements \
+        at *error_rate*."""
+    return ceil(_size(error_rate)[0] * max(capacity, 1) / 64)
+
+
+class BloomFilter:
+    """A Bloom filter sized for *capacity* elements at *error_rate*.
+
+    If *words* is given, the filter uses it as its bits instead of allocating
+    them, e.g. a read-only view of the :meth:`tobytes` of another filter.
+    """
+
+    __slots__ = ("_masks", "_nwords", "_words", "capacity", "count",
+                 "error_rate")
+
+    def __init__(self, capacity: int, error_rate: float = 0.01,
+                 words: memoryview | None = None) -> None:
+        """Create an empty filter, or one with the bits in *words*."""
+        if not 0 < error_rate < 1:
+            raise ValueError(f"invalid error rate: {error_rate}")
+        self.capacity = max(capacity, 1)
+        self.error_rate = error_rate
+        self.count = 0
+        self._masks = _masks(_size(error_rate)[1])
+        self._nwords = filter_words(capacity, error_rate)
+        self._words: array[int] | memoryview
+        if words is None:
+            self._words = array("Q", bytes(8 * self._nwords))
+        else:
+            if words.format != "Q" or len(words) != self._nwords:
+                raise ValueError("invalid filter words")
+            self._words = words
+
+    def tobytes(self) -> bytes:
+        """Return the bits of this filter."""
+        return self._words.tobytes()
+
+    def add(self, h: int) -> None:
+        """Add the element with hash *h*."""
+        g = h * _MIX & _MASK64
+        g ^= g >> 32
+        b = g * _MIX_MASK & _MASK64
+        b ^= b >> 29
+        mask = self._masks[b >> _MASK_SHIFT]
+        r = b >> _ROTATE_SHIFT & 63
+        self._words[g % self._nwords] |= (mask << r | mask >> (64 - r)) & _MASK64
+        self.count += 1
+
+    def __contains__(self, h: int) -> bool:
+        """Return whether the element with hash *h* may have been added."""
+        g = h * _MIX & _MASK64
+        g ^= g >> 32
+        b = g * _MIX_MASK & _MASK64
+        b ^= b >> 29
+        mask = self._masks[b >> _MASK_SHIFT]
+        r = b >> _ROTATE_SHIFT & 63
+        mask = (mask << r | mask >> (64 - r)) & _MASK64
+        return self._words[g % self._nwords] & mask == mask
+
+    @property
+    def full(self) -> bool:
+        """Whether more than :attr:`capacity` elements have been added."""
+        return self.count > self.capacity
@@ -0,0 +1,91 @@
+"""Stable binary encoding and hashing of set elements.
+
+The encoding and the hash derived from it do not depend on the interpreter
+instance (in particular not on ``PYTHONHASHSEED``), so they can be shared
+between processes.
+"""
+
+from __future__ import annotations
+
+__copyright__ = """
+Copyright (C) 2026 University of Illinois Board of Trustees
+"""
+
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from hashlib import blake2b
+from typing import Any
+
+_TAG_INT = b"i"
+_TAG_STR = b"s"
+_TAG_BYTES = b"b"
+
+
+def encode(element: Any) -> bytes:
+    """Return the stable encoding of *element*.
+
+    Supported element types are :class:`int`, :class:`str` and :class:`bytes`.
+    Raises :exc:`TypeError` for all other types.
+    """
+    if isinstance(element, str):
+        return _TAG_STR + str.encode(element, "utf-8", "surrogatepass")
+    if isinstance(element, int):
+        value = int(element)
+        length = (value + (value < 0)).bit_length() // 8 + 1
+        return _TAG_INT + value.to_bytes(length, "little", signed=True)
+    if isinstance(element, bytes):
+        return _TAG_BYTES + bytes(element)
+    raise TypeError(f"cannot encode element of type '{type(element).__name__}'")
+
+
+def encode_lookup(element: object) -> bytes | None:
+    """Return the encoding of *element* for a membership test, or *None*.
+
+    Unlike :func:`encode`, this maps elements that compare equal to an
+    encodable element (such as ``1.0`` and ``1``) to the same encoding, and
+    returns *None* for elements that cannot be contained in an encoded set.
+    """
+    if isinstance(element, float):
+        if not element.is_integer():
+            return None
+        element = int(element)
+    try:
+        return encode(element)
+    except TypeError:
+        return None
+
+
+def decode(data: bytes | memoryview) -> Any:
+    """Return the element encoded in *data*."""
+    tag = data[:1]
+    if tag == _TAG_STR:
+        return bytes(data[1:]).decode("utf-8", "surrogatepass")
+    if tag == _TAG_INT:
+        return int.from_bytes(data[1:], "little", signed=True)
+    if tag == _TAG_BYTES:
+        return bytes(data[1:])
+    raise ValueError(f"invalid element tag {bytes(tag)!r}")
+
+
+def stable_hash(data: bytes) -> int:
+    """Return a 64-bit hash of the encoded element *data*."""
+    return int.from_bytes(blake2b(data, digest_size=8).digest(), "little")
@@ -0,0 +1,111 @@
+"""A Fenwick tree (binary indexed tree) of counts.
+
+It maintains prefix sums of a list of non-negative integers under point
+updates, and finds the position of the k-th unit, both in O(log n). The index
+classes use it to map between the positions of their elements and the slots
+in which they are stored.
+"""
+
+from __future__ import annotations
+
+__copyright__ = """
+Copyright (C) 2026 University of Illinois Board of Trustees
+"""
+
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from collections.abc import Iterable
+
+
+class FenwickTree:
+    """Prefix sums over a growable list of non-negative integers."""
+
+    __slots__ = ("_tree",)
+
+    def __init__(self, values: Iterable[int] = ()) -> None:
+        """Create a tree over *values* in O(n)."""
+        # 1-based: node i holds the sum of the values in (i - lowbit(i), i].
+        tree = [0, *values]
+        n = len(tree) - 1
+        for i in range(1, n + 1):
+            parent = i + (i & -i)
+            if parent <= n:
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def append(self, value: int) -> None:
+        """Append *value* in O(log n)."""
+        tree = self._tree
+        i = len(tree)
+        total = value
+        # Add the nodes that cover (i - lowbit(i), i - 1].
+        j = i - 1
+        lowest = i - (i & -i)
+        while j > lowest:
+            total += tree[j]
+            j -= j & -j
+        tree.append(total)
+
+    def pop(self) -> int:
+        """Remove the last value and return it in O(log n)."""
+        n = len(self._tree) - 1
+        value = self.prefix_sum(n) - self.prefix_sum(n - 1)
+        # No other node covers the last position.
+        self._tree.pop()
+        return value
+
+    def add(self, i: int, delta: int) -> None:
+        """Add *delta* to the value at index *i* in O(log n)."""
+        tree = self._tree
+        n = len(tree) - 1
+        i += 1
+        while i <= n:
+            tree[i] += delta
+            i += i & -i
+
+    def prefix_sum(self, i: int) -> int:
+        """Return the sum of the first *i* values in O(log n)."""
+        tree = self._tree
+        total = 0
+        while i > 0:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+    def find(self, k: int) -> int:
+        """Return the smallest index *i* such that the sum of the first \
+            ``i + 1`` values exceeds *k*, in O(log n).
+
+        If the values are 0 or 1, this is the index of the (0-based) *k*-th
+        one. *k* must be less than the sum of all values.
+        """
+        tree = self._tree
+        n = len(tree) - 1
+        pos = 0
+        step = 1 << (n.bit_length() - 1) if n else 0
+        while step:
+            nxt = pos + step
+            if nxt <= n and tree[nxt] <= k:
+                pos = nxt
+                k -= tree[nxt]
+            step >>= 1
+        return pos
@@ -0,0 +1,202 @@
+"""The position index of :class:`~orderedsets.IndexSet`.
+
+The elements are stored in a list of slots in the order of the set. Removing
+an element leaves a gap in its slot instead of shifting the following
+elements, and a :class:`~orderedsets._fenwick.FenwickTree` counts the occupied
+slots, so that the element at a position and the position of an element are
+found in O(log n). The dict of the set maps each element to its slot. When the
+fraction of occupied slots drops below :attr:`SlotIndex.min_load`, the slots
+are compacted in O(n), which is amortized over the removals that created the
+gaps.
+
+An element is inserted in the middle by shifting the elements between its
+position and the nearest gap by one slot. If there is no gap within
+O(sqrt(n)) slots, all elements are spread out again with a gap before every
+:attr:`SlotIndex.spacing` elements, so that insertions take amortized
+O(sqrt(n)). Since inserted elements are added to the end of the dict, the
+order of the dict no longer matches the order of the slots after an insertion
+in the middle (:attr:`SlotIndex.reordered`), until :meth:`SlotIndex.sync` sorts
+the dict in O(n).
+"""
+
+from __future__ import annotations
+
+__copyright__ = """
+Copyright (C) 2026 University of Illinois Board of Trustees
+"""
+
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from itertools import islice
+from typing import Any
+
+from orderedsets._fenwick import FenwickTree
+
+# Marks an empty slot.
+_GAP: Any = object()
+
+
+class SlotIndex:
+    """Slots and their occupancy counts for the elements of a dict."""
+
+    __slots__ = ("_dict", "_slots", "_tree", "reordered")
+
+    # Compact the slots when fewer than this fraction of them is occupied.
+    min_load = 0.5
+
+    # When spreading out the elements, leave a gap before every this many.
+    spacing = 8
+
+    def __init__(self, d: dict[Any, Any]) -> None:
+        """Index the keys of *d*, replacing its values with their slots."""
+        self._dict = d
+        self._slots: list[Any] = []
+        self._tree = FenwickTree()
+        self.reordered = False
+        self._fill(list(d))
+
+    def _fill(self, elements: list[Any], spacing: int = 0) -> None:
+        # Store *elements* in order in new slots, with a gap before every
+        # *spacing* elements if it is nonzero, and sort the dict to match.
+        d = self._dict
+        if self.reordered:
+            d.clear()
+            self.reordered = False
+        if spacing:
+            slots: list[Any] = []
+            for i, e in enumerate(elements):
+                if i % spacing == 0:
+                    slots.append(_GAP)
+                d[e] = len(slots)
+                slots.append(e)
+        else:
+            slots = elements
+            for i, e in enumerate(slots):
+                d[e] = i
+        self._slots = slots
+        self._tree = FenwickTree([e is not _GAP for e in slots])
+
+    def _elements(self) -> list[Any]:
+        return [e for e in self._slots if e is not _GAP]
+
+    def sync(self) -> None:
+        """Sort the dict in the order of the slots, if it is :attr:`reordered`."""
+        if self.reordered:
+            self._fill(self._elements(), self.spacing)
+
+    def last(self) -> Any:
+        """Return the last element, which must exist."""
+        # Gaps at the end are removed immediately.
+        return self._slots[-1]
+
+    def append(self, element: Any) -> None:
+        """Add *element*, which must not be in the dict, at the end."""
+        self._dict[element] = len(self._slots)
+        self._slots.append(element)
+        self._tree.append(1)
+
+    def insert(self, index: int, element: Any) -> None:
+        """Add *element*, which must not be in the dict, at position *index*."""
+        if index == len(self._dict):
+            self.append(element)
+            return
+
+        slot = self._tree.find(index)
+        gap = self._find_gap(slot)
+        if gap is None:
+            self._fill(self._elements(), self.spacing)
+            slot = self._tree.find(index)
+            gap = self._find_gap(slot)
+            assert gap is not None
+
+        slots, d = self._slots, self._dict
+        if gap < slot:
+            # Shift the elements in (gap, slot) to the left.
+            slots[gap:slot - 1] = slots[gap + 1:slot]
+            for i in range(gap, slot - 1):
+                d[slots[i]] = i
+            slot -= 1
+        else:
+            # Shift the elements in [slot, gap) to the right.
+            if gap == len(slots):
+                slots.append(_GAP)
+                self._tree.append(0)
+            slots[slot + 1:gap + 1] = slots[slot:gap]
+            for i in range(slot + 1, gap + 1):
+                d[slots[i]] = i
+
+        # Only the occupancy of the gap changes.
+        self._tree.add(gap, 1)
+        slots[slot] = element
+        d[element] = slot
+        self.reordered = True
+
+    def _find_gap(self, slot: int) -> int | None:
+        # Return the gap nearest to *slot* (the end of the slots counts as a
+        # gap), searching up to O(sqrt(n)) slots in each direction.
+        slots = self._slots
+        n = len(slots)
+        for distance in range(1, max(int(n ** 0.5), 2 * self.spacing) + 1):
+            if slot - distance >= 0 and slots[slot - distance] is _GAP:
+                return slot - distance
+            right = slot + distance
+            if right >= n:
+                return n
+            if slots[right] is _GAP:
+                return right
+        return None
+
+    def remove(self, slot: int) -> None:
+        """Empty *slot*, whose element must have been removed from the dict."""
+        slots, tree = self._slots, self._tree
+        if slot == len(slots) - 1:
+            slots.pop()
+            tree.pop()
+            while slots and slots[-1] is _GAP:
+                slots.pop()
+                tree.pop()
+        else:
+            slots[slot] = _GAP
+            tree.add(slot, -1)
+            if len(self._dict) < self.min_load * len(slots):
+                self._fill(self._elements())
+
+    def element_at(self, index: int) -> Any:
+        """Return the element at position *index*."""
+        return self._slots[self._tree.find(index)]
+
+    def index_of(self, slot: int) -> int:
+        """Return the position of the element in *slot*."""
+        return self._tree.prefix_sum(slot)
+
+    def select(self, positions: range) -> list[Any]:
+        """Return the elements at *positions*, which must not be empty."""
+        lo = min(positions[0], positions[-1])
+        hi = max(positions[0], positions[-1])
+        slots = self._slots
+        # islice() would iterate over the slots before the start.
+        occupied = (slots[i] for i in range(self._tree.find(lo), len(slots))
+                    if slots[i] is not _GAP)
+        result = list(islice(occupied, 0, hi - lo + 1, abs(positions.step)))
+        if positions.step < 0:
+            result.reverse()
+        return result
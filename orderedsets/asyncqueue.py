@@ -0,0 +1,254 @@
+"""An asyncio FIFO queue that ignores items that are already queued."""
+
+from __future__ import annotations
+
+__copyright__ = """
+Copyright (C) 2026 University of Illinois Board of Trustees
+"""
+
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+from collections import OrderedDict, deque
+from typing import Generic
+
+from orderedsets import T
+
+
+class AsyncOrderedSetQueue(Generic[T]):
+    """A FIFO :mod:`asyncio` queue whose pending items form an ordered set.
+
+    Putting an item that is already pending is a no-op, so that each item is
+    queued at most once and is stored only once. If *dedup_in_flight* is true,
+    items that were retrieved with :meth:`get` but not yet marked as processed
+    with :meth:`task_done` are also ignored by :meth:`put`.
+
+    The API follows :class:`asyncio.Queue`: if *maxsize* is greater than zero,
+    :meth:`put` blocks while *maxsize* items are pending. In addition,
+    :meth:`get_many` retrieves several items at once, and :meth:`put` returns
+    whether the item was added.
+
+    .. doctest::
+
+        >>> async def crawl():
+        ...     queue = AsyncOrderedSetQueue()
+        ...     for url in ["a", "b", "a", "c", "b"]:
+        ...         await queue.put(url)
+        ...     return await queue.get_many(10)
+        >>> asyncio.run(crawl())
+        ['a', 'b', 'c']
+    """
+
+    def __init__(self, maxsize: int = 0, *, dedup_in_flight: bool = False) -> None:
+        """Create a new queue holding at most *maxsize* pending items."""
+        self._maxsize = maxsize
+        # OrderedDict (rather than dict) makes removing the oldest item O(1).
+        self._pending: OrderedDict[T, None] = OrderedDict()
+        self._in_flight: dict[T, None] | None = {} if dedup_in_flight else None
+        self._getters: deque[asyncio.Future[None]] = deque()
+        self._putters: deque[asyncio.Future[None]] = deque()
+        # Putters blocked on a full queue, by item.
+        self._blocked_puts: dict[T, list[asyncio.Future[None]]] = {}
+        self._joiners: list[asyncio.Future[None]] = []
+        self._unfinished_tasks = 0
+
+    def __repr__(self) -> str:
+        """Return a string representation of this queue."""
+        return (f"<{self.__class__.__name__} maxsize={self._maxsize} "
+                f"pending={list(self._pending)!r} unfinished={self._unfinished_tasks}>")
+
+    @property
+    def maxsize(self) -> int:
+        """The maximum number of pending items (0 means unlimited)."""
+        return self._maxsize
+
+    def qsize(self) -> int:
+        """Return the number of pending items."""
+        return len(self._pending)
+
+    def __len__(self) -> int:
+        """Return the number of pending items."""
+        return len(self._pending)
+
+    def empty(self) -> bool:
+        """Return whether no items are pending."""
+        return not self._pending
+
+    def full(self) -> bool:
+        """Return whether *maxsize* items are pending."""
+        return 0 < self._maxsize <= len(self._pending)
+
+    def __contains__(self, item: object) -> bool:
+        """Return whether *item* is pending (or in flight, if tracked)."""
+        return item in self._pending or (
+            self._in_flight is not None and item in self._in_flight)
+
+    # {{{ waiting
+
+    @staticmethod
+    def _wakeup_next(waiters: deque[asyncio.Future[None]]) -> None:
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    async def _wait(self, waiters: deque[asyncio.Future[None]],
+                    item_waiters: list[asyncio.Future[None]] | None = None) -> None:
+        waiter = asyncio.get_running_loop().create_future()
+        waiters.append(waiter)
+        if item_waiters is not None:
+            item_waiters.append(waiter)
+        try:
+            await waiter
+        except BaseException:
+            waiter.cancel()
+            try:
+                waiters.remove(waiter)
+            except ValueError:
+                # Another waiter needs to be woken up in our place.
+                self._wakeup_next(waiters)
+            raise
+        finally:
+            if item_waiters is not None:
+                item_waiters.remove(waiter)
+
+    # }}}
+
+    # {{{ put
+
+    def put_nowait(self, item: T) -> bool:
+        """Add *item* to the queue without blocking and return whether it was \
+            added.
+
+        Raises :exc:`asyncio.QueueFull` if the queue is full and *item* is not
+        already queued.
+        """
+        if item in self:
+            return False
+        if self.full():
+            raise asyncio.QueueFull
+        self._pending[item] = None
+        self._unfinished_tasks += 1
+        self._wakeup_next(self._getters)
+        # Blocked puts of the same item are now no-ops.
+        for putter in self._blocked_puts.get(item, ()):
+            if not putter.done():
+                putter.set_result(None)
+        return True
+
+    async def put(self, item: T) -> bool:
+        """Add *item* to the queue and return whether it was added.
+
+        If *item* is not already queued and the queue is full, wait until a
+        slot is available.
+        """
+        while item not in self and self.full():
+            item_waiters = self._blocked_puts.setdefault(item, [])
+            try:
+                await self._wait(self._putters, item_waiters)
+            finally:
+                if not item_waiters:
+                    del self._blocked_puts[item]
+        if item in self:
+            if not self.full():
+                # Pass on the free slot we were woken up for.
+                self._wakeup_next(self._putters)
+            return False
+        return self.put_nowait(item)
+
+    # }}}
+
+    # {{{ get
+
+    def _take(self, n: int) -> list[T]:
+        items = [self._pending.popitem(last=False)[0]
+                 for _ in range(min(n, len(self._pending)))]
+        if self._in_flight is not None:
+            self._in_flight.update(dict.fromkeys(items))
+        for _ in items:
+            self._wakeup_next(self._putters)
+        return items
+
+    def get_nowait(self) -> T:
+        """Remove and return the oldest pending item without blocking.
+
+        Raises :exc:`asyncio.QueueEmpty` if no items are pending.
+        """
+        if not self._pending:
+            raise asyncio.QueueEmpty
+        return self._take(1)[0]
+
+    async def get(self) -> T:
+        """Remove and return the oldest pending item, waiting for one if \
+            necessary."""
+        while not self._pending:
+            await self._wait(self._getters)
+        return self._take(1)[0]
+
+    async def get_many(self, n: int) -> list[T]:
+        """Remove and return up to *n* of the oldest pending items.
+
+        Waits until at least one item is pending, but not for further items.
+        """
+        if n < 1:
+            raise ValueError("n must be at least 1")
+        while not self._pending:
+            await self._wait(self._getters)
+        items = self._take(n)
+        if self._pending:
+            # Items are left over for other getters.
+            self._wakeup_next(self._getters)
+        return items
+
+    # }}}
+
+    # {{{ task tracking
+
+    def task_done(self, item: T | None = None) -> None:
+        """Indicate that a retrieved item has been processed.
+
+        If the queue was created with *dedup_in_flight*, *item* must be the
+        processed item, and it can be queued again afterwards.
+        """
+        if self._unfinished_tasks <= 0:
+            raise ValueError("task_done() called too many times")
+        if self._in_flight is not None:
+            if item not in self._in_flight:
+                raise ValueError(f"{item!r} is not in flight")
+            del self._in_flight[item]
+
+        self._unfinished_tasks -= 1
+        if self._unfinished_tasks == 0:
+            for joiner in self._joiners:
+                if not joiner.done():
+                    joiner.set_result(None)
+            self._joiners.clear()
+
+    async def join(self) -> None:
+        """Wait until all queued items have been processed."""
+        if self._unfinished_tasks > 0:
+            joiner = asyncio.get_running_loop().create_future()
+            self._joiners.append(joiner)
+            await joiner
+
+    # }}}
@@ -0,0 +1,284 @@
+"""A thread-safe ordered set."""
+
+from __future__ import annotations
+
+__copyright__ = """
+Copyright (C) 2026 University of Illinois Board of Trustees
+"""
+
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from collections.abc import Iterable, Iterator, Set  # noqa: PYI025
+from threading import Lock
+from typing import Any, Callable
+
+from orderedsets import OrderedSet, T, _is_sorted, _NotProvided, _sorted
+
+
+class _AllLocks:
+    """Context manager that acquires all stripe locks in a fixed order."""
+
+    __slots__ = ("_locks",)
+
+    def __init__(self, locks: tuple[Lock, ...]) -> None:
+        self._locks = locks
+
+    def __enter__(self) -> None:
+        for lock in self._locks:
+            lock.acquire()
+
+    def __exit__(self, *exc_info: object) -> None:
+        for lock in reversed(self._locks):
+            lock.release()
+
+
+class ConcurrentOrderedSet(OrderedSet[T]):
+    """An :class:`~orderedsets.OrderedSet` that can be shared between threads.
+
+    All operations are atomic, including compound operations such as
+    :meth:`update`, :meth:`intersection_update` and :meth:`pop`, which is
+    required for correctness on free-threaded Python builds. Single-element
+    mutations (:meth:`add`, :meth:`add_if_absent`, :meth:`discard`,
+    :meth:`remove`) only lock one of *stripes* locks, selected by the hash of the
+    element, so that mutations of different elements rarely contend. Operations
+    on the whole set lock all stripes.
+
+    Membership tests and :func:`len` do not lock. Iteration and the operations
+    that return new sets work on a snapshot of the set taken atomically at the
+    start of the operation, so they never fail because of concurrent
+    modifications.
+
+    Mutating operations always modify the set in place; in particular,
+    ``s |= other`` and similar operators return *s* itself.
+
+    .. doctest::
+
+        >>> cset = ConcurrentOrderedSet(["a", "b"])
+        >>> cset.add_if_absent("c"), cset.add_if_absent("a")
+        (True, False)
+        >>> cset
+        ConcurrentOrderedSet({'a', 'b', 'c'})
+
+    .. automethod:: add_if_absent
+    """
+
+    def __init__(self, items: Iterable[T] | type[_NotProvided] = _NotProvided,
+                 *, stripes: int = 16) -> None:
+        """Create a new :class:`ConcurrentOrderedSet`, optionally initialized \
+            with *items*, using *stripes* locks."""
+        if stripes < 1:
+            raise ValueError(f"invalid number of stripes: {stripes}")
+        super().__init__(items)
+        self._init_locks(stripes)
+
+    def _init_locks(self, stripes: int) -> None:
+        self._locks = tuple(Lock() for _ in range(stripes))
+        self._all_locks = _AllLocks(self._locks)
+
+    def _new(self, items: Iterable[T]) -> ConcurrentOrderedSet[T]:
+        return self.__class__(items, stripes=len(self._locks))
+
+    def _lock(self, element: object) -> Lock:
+        return self._locks[hash(element) % len(self._locks)]
+
+    def _snapshot(self) -> dict[T, None]:
+        # dict.copy() is atomic, also on free-threaded builds.
+        return self._dict.copy()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state of this set for pickling."""
+        return {"_dict": self._snapshot(), "stripes": len(self._locks)}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the state of this set from *state*."""
+        self._dict = state["_dict"]
+        self._init_locks(state["stripes"])
+
+    # {{{ single-element operations
+
+    def add(self, element: T) -> None:
+        """Add *element* to this set."""
+        with self._lock(element):
+            self._dict[element] = None
+
+    def add_if_absent(self, element: T) -> bool:
+        """Add *element* if it is not present and return whether it was added."""
+        with self._lock(element):
+            if element in self._dict:
+                return False
+            self._dict[element] = None
+            return True
+
+    def discard(self, element: T) -> None:
+        """Remove *element* from this set if it is present."""
+        with self._lock(element):
+            self._dict.pop(element, None)
+
+    def remove(self, element: T) -> None:
+        """Remove *element* from this set, raising :exc:`KeyError` if not present."""
+        with self._lock(element):
+            del self._dict[element]
+
+    # }}}
+
+    # {{{ whole-set mutations
+
+    def clear(self) -> None:
+        """Remove all elements from this set."""
+        with self._all_locks:
+            self._dict.clear()
+
+    def pop(self) -> T:
+        """Remove and return the most recently added element from this set."""
+        with self._all_locks:
+            return self._dict.popitem()[0]
+
+    def update(self, *others: Iterable[T]) -> None:
+        """Update this set to be the union of itself and *others*."""
+        new = {e: None for other in others for e in other}
+        with self._all_locks:
+            self._dict.update(new)
+
+    def difference_update(self, *others: Iterable[T]) -> None:
+        """Update this set to remove all items that are in *others*."""
+        remove = [e for other in others for e in other]
+        with self._all_locks:
+            d = self._dict
+            for e in remove:
+                d.pop(e, None)
+
+    def intersection_update(self, *others: Iterable[T]) -> None:
+        """Update this set to be the intersection of itself and *others*."""
+        keep = [other if isinstance(other, Set) else set(other)
+                for other in others]
+        with self._all_locks:
+            d = self._dict
+            for e in [e for e in d if not all(e in k for k in keep)]:
+                del d[e]
+
+    def symmetric_difference_update(self, s: Iterable[T]) -> None:
+        """Update this set to be the symmetric difference of itself and *s*."""
+        other = list(dict.fromkeys(s))
+        with self._all_locks:
+            d = self._dict
+            for e in other:
+                if e in d:
+                    del d[e]
+                else:
+                    d[e] = None
+
+    def sort(self, *, key: Callable[[T], Any] | None = None,
+             reverse: bool = False) -> None:
+        """Sort the elements of this set in place, like :meth:`list.sort`.
+
+        The elements are sorted outside of the locks. Elements that are added
+        concurrently are kept after the sorted ones.
+        """
+        snapshot = self._snapshot()
+        if _is_sorted(snapshot, key, reverse):
+            return
+        order = _sorted(snapshot, key, reverse)
+        with self._all_locks:
+            d = self._dict
+            new = dict.fromkeys([e for e in order if e in d])
+            new.update(d)
+            self._dict = new
+
+    def __iand__(self, s: Set[T]) -> ConcurrentOrderedSet[T]:
+        """Update this set to be the intersection of itself and *s*."""
+        self.intersection_update(s)
+        return self
+
+    def __ior__(self, s: Set[Any]) -> ConcurrentOrderedSet[T]:
+        """Update this set to be the union of itself and *s*."""
+        self.update(s)
+        return self
+
+    def __isub__(self, s: Set[T]) -> ConcurrentOrderedSet[T]:
+        """Update this set to be the difference of itself and *s*."""
+        self.difference_update(s)
+        return self
+
+    def __ixor__(self, s: Set[Any]) -> ConcurrentOrderedSet[T]:
+        """Update this set to be the symmetric difference of itself and *s*."""
+        self.symmetric_difference_update(s)
+        return self
+
+    # }}}
+
+    # {{{ read-only operations on a snapshot
+
+    def __iter__(self) -> Iterator[T]:
+        """Return an iterator over a snapshot of the elements of this set."""
+        return iter(self._snapshot())
+
+    def __repr__(self) -> str:
+        """Return a string representation of this set."""
+        cls_name = self.__class__.__name__
+        items = self._snapshot()
+        if len(items) == 0:
+            return f"{cls_name}()"
+        return f"{cls_name}({{" + ", ".join([repr(k) for k in items]) + "})"
+
+    def copy(self) -> ConcurrentOrderedSet[T]:
+        """Return a shallow copy of this set."""
+        return self._new(self._snapshot())
+
+    def difference(self, *others: Iterable[T]) -> ConcurrentOrderedSet[T]:
+        """Return all elements that are in this set but not in *others*."""
+        items = self._snapshot()
+        if not others:
+            return self._new(items)
+        other_elems = set.union(*map(set, others))
+        return self._new([e for e in items if e not in other_elems])
+
+    def intersection(self, *others: Iterable[T]) -> ConcurrentOrderedSet[T]:
+        """Return a new set with elements common to this set and all *others*."""
+        items = self._snapshot()
+        if not others:
+            return self._new(items)
+        common = set(items).intersection(*others)
+        return self._new([e for e in items if e in common])
+
+    def symmetric_difference(self, s: Iterable[T]) -> ConcurrentOrderedSet[T]:
+        """Return the symmetric difference of this set and *s*."""
+        result = self._new(self._snapshot())
+        result.symmetric_difference_update(s)
+        return result
+
+    def union(self, *others: Iterable[T]) -> ConcurrentOrderedSet[T]:
+        """Return a new set with elements from this set and *others*."""
+        result = self._new(self._snapshot())
+        result.update(*others)
+        return result
+
+    def isdisjoint(self, s: Iterable[T]) -> bool:
+        """Return whether this set is disjoint with *s*."""
+        return self._snapshot().keys().isdisjoint(s)
+
+    def issubset(self, s: Iterable[T]) -> bool:
+        """Return whether this set is a subset of *s*."""
+        if not isinstance(s, Set):
+            s = set(s)
+        return all(i in s for i in self._snapshot())
+
+    # }}}
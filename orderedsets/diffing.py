@@ -0,0 +1,212 @@
+"""Edit scripts between ordered sets.
+
+:func:`diff` computes the positional edits that turn one ordered set into
+another, and :func:`patch` applies them. Since the elements of a set are
+unique, each element of the target is either new or has exactly one position
+in the source, so that the elements that do not need to move are a longest
+increasing subsequence of their source positions, found in O(n log n) instead
+of with an O(n m) sequence diff. Both functions are also available as
+``orderedsets.diff`` and ``orderedsets.patch``.
+
+.. autofunction:: diff
+.. autofunction:: patch
+.. autoclass:: Delete()
+.. autoclass:: Move()
+.. autoclass:: Insert()
+
+.. doctest::
+
+    >>> a = IndexSet(["a", "b", "c", "d", "e"])
+    >>> b = IndexSet(["c", "a", "b", "X", "e"])
+    >>> script = diff(a, b)
+    >>> script
+    [Delete(position=3, element='d'), Move(source=2, target=0, element='c'),\
+ Insert(position=3, element='X')]
+    >>> patch(a, script) == b and list(patch(a, script)) == list(b)
+    True
+"""
+
+from __future__ import annotations
+
+__copyright__ = """
+Copyright (C) 2026 University of Illinois Board of Trustees
+"""
+
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from bisect import bisect_left
+from collections.abc import Iterable, Sequence
+from typing import Any, NamedTuple, TypeVar, Union
+
+from orderedsets import IndexSet
+from orderedsets._fenwick import FenwickTree
+
+# The bound is a string since collections.abc.Iterable cannot be subscripted
+# before Python 3.9.
+S = TypeVar("S", bound="Iterable[Any]")
+
+
+class Delete(NamedTuple):
+    """Remove *element*, which is at *position*."""
+
+    position: int
+    element: Any
+
+
+class Move(NamedTuple):
+    """Move *element* from position *source* to position *target*.
+
+    *target* is the position of *element* after the move, like for
+    :meth:`orderedsets.IndexSet.move`.
+    """
+
+    source: int
+    target: int
+    element: Any
+
+
+class Insert(NamedTuple):
+    """Insert *element* before *position*, like \
+        :meth:`orderedsets.IndexSet.insert`."""
+
+    position: int
+    element: Any
+
+
+Edit = Union[Delete, Move, Insert]
+
+
+def _increasing_run(values: Sequence[int]) -> set[int]:
+    # The indices of a longest strictly increasing subsequence of values.
+    tails: list[int] = []  # smallest last value of a run of each length
+    tail_indices: list[int] = []
+    previous = [-1] * len(values)
+    for i, v in enumerate(values):
+        k = bisect_left(tails, v)
+        if k:
+            previous[i] = tail_indices[k - 1]
+        if k == len(tails):
+            tails.append(v)
+            tail_indices.append(i)
+        else:
+            tails[k] = v
+            tail_indices[k] = i
+
+    run = set()
+    i = tail_indices[-1] if tail_indices else -1
+    while i >= 0:
+        run.add(i)
+        i = previous[i]
+    return run
+
+
+def diff(a: Iterable[Any], b: Iterable[Any]) -> list[Edit]:
+    """Return a minimal edit script that turns *a* into *b*, in O(n log n).
+
+    *a* and *b* are iterables of unique elements, usually ordered sets. The
+    script is a list of :class:`Delete`, :class:`Move` and :class:`Insert`
+    edits, whose positions refer to the state after the preceding edits. It
+    first deletes the elements that are not in *b*, from the last to the first,
+    then moves the elements that are out of order, and finally inserts the new
+    elements in the order of *b*. The number of deletions and insertions is
+    that of the elements only in *a* or *b*, and the number of moves is
+    minimal.
+    """
+    b_pos = {e: i for i, e in enumerate(b)}
+    a_list = list(a)
+
+    script: list[Edit] = [Delete(i, a_list[i])
+                          for i in range(len(a_list) - 1, -1, -1)
+                          if a_list[i] not in b_pos]
+    # The common elements in the order of a, and their positions in b.
+    common = [e for e in a_list if e in b_pos]
+    targets = [b_pos[e] for e in common]
+    stay = _increasing_run(targets)
+
+    if len(stay) < len(common):
+        _add_moves(script, common, targets, stay)
+
+    a_set = dict.fromkeys(common)
+    script.extend(Insert(i, e) for e, i in b_pos.items() if e not in a_set)
+    return script
+
+
+def _add_moves(script: list[Edit], common: list[Any], targets: list[int],
+               stay: set[int]) -> None:
+    # Elements that do not stay are moved in the order of b to just after the
+    # element that precedes them in b (among the common elements), whose
+    # chain of predecessors ends at an element that stays. Both their initial
+    # and final positions are thus known in advance, as slots in a total
+    # order: (index in common, 0, 0) for initial positions and elements that
+    # stay, and (index in common of the anchor that stays, 1, position in b)
+    # for final positions.
+    order = sorted(range(len(common)), key=targets.__getitem__)
+    slots: list[tuple[int, int, int]] = []
+    final: dict[int, tuple[int, int, int]] = {}
+    anchor = -1
+    for i in order:
+        if i in stay:
+            anchor = i
+        else:
+            final[i] = (anchor, 1, targets[i])
+            slots.append(final[i])
+    slots.extend((i, 0, 0) for i in range(len(common)))
+    slots.sort()
+    rank = {slot: r for r, slot in enumerate(slots)}
+
+    occupied = FenwickTree(int(not phase) for _, phase, _ in slots)
+    for i in order:
+        if i not in stay:
+            start = rank[i, 0, 0]
+            source = occupied.prefix_sum(start)
+            occupied.add(start, -1)
+            end = rank[final[i]]
+            script.append(Move(source, occupied.prefix_sum(end), common[i]))
+            occupied.add(end, 1)
+
+
+def patch(a: S, script: Iterable[Edit]) -> S:
+    """Return a new set of the type of *a* with the edits in *script* applied.
+
+    Raises :exc:`ValueError` if an edit does not match *a*, e.g. if *script*
+    was computed from a different set. Each edit takes amortized O(sqrt(n)),
+    see :class:`~orderedsets.IndexSet`.
+    """
+    result: IndexSet[Any] = IndexSet(a)
+    for edit in script:
+        if isinstance(edit, Insert):
+            if edit.element in result or not 0 <= edit.position <= len(result):
+                raise ValueError(f"cannot apply {edit!r}")
+            result.insert(edit.position, edit.element)
+        else:
+            index = edit.position if isinstance(edit, Delete) else edit.source
+            if (edit.element not in result
+                    or result.index(edit.element) != index
+                    or (isinstance(edit, Move)
+                        and not 0 <= edit.target < len(result))):
+                raise ValueError(f"cannot apply {edit!r}")
+            if isinstance(edit, Delete):
+                result.remove(edit.element)
+            else:
+                result.move(edit.element, edit.target)
+    # type-ignore-reason: mypy does not know the constructor of S
+    return result if type(a) is IndexSet else type(a)(result)  # type: ignore[return-value,call-arg]
@@ -0,0 +1,120 @@
+"""Ordered sets that intern their string elements."""
+
+from __future__ import annotations
+
+__copyright__ = """
+Copyright (C) 2026 University of Illinois Board of Trustees
+"""
+
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from collections.abc import Iterable
+from sys import intern
+from typing import Any, cast
+
+from orderedsets import FrozenOrderedSet, OrderedSet, T, T_co, _NotProvided
+
+
+def _intern(element: T) -> T:
+    # sys.intern() only accepts exact str instances.
+    if type(element) is str:
+        return cast(T, intern(cast(str, element)))
+    return element
+
+
+def _interned(items: Iterable[T] | type[_NotProvided]) \
+        -> Iterable[T] | type[_NotProvided]:
+    if items is _NotProvided:
+        return items
+    # type-ignore-reason:
+    # mypy thinks 'items' can still be Type[_NotProvided] here.
+    return map(_intern, items)  # type: ignore[arg-type]
+
+
+class InternedOrderedSet(OrderedSet[T]):
+    """An :class:`~orderedsets.OrderedSet` that interns its string elements.
+
+    Elements of type :class:`str` are passed through :func:`sys.intern` when
+    they are added, so that equal strings in all interned sets (and in the rest
+    of the program, e.g. identifiers) share a single object. Sets that hold
+    many strings that were created separately, e.g. by a parser, thus keep
+    only one copy of each distinct string, and membership tests with an
+    interned string find the key by identity without comparing characters.
+    Interned strings are released once they are no longer referenced, so the
+    interpreter's intern table does not grow without bound.
+
+    Interning costs a dict lookup per added string; use
+    :class:`~orderedsets.OrderedSet` for sets whose strings are already
+    shared. Subclasses of :class:`str` and other elements are stored as is.
+
+    .. doctest::
+
+        >>> import sys
+        >>> a, b = "".join(["ab", "c"]), "".join(["a", "bc"])
+        >>> a is b
+        False
+        >>> iset = InternedOrderedSet([a, 1])
+        >>> iset.add(b)
+        >>> iset
+        InternedOrderedSet({'abc', 1})
+        >>> next(iter(iset)) is sys.intern(b)
+        True
+    """
+
+    def __init__(self, items: Iterable[T] | type[_NotProvided] = _NotProvided)\
+            -> None:
+        """Create a new :class:`InternedOrderedSet`, optionally initialized \
+            with *items*."""
+        super().__init__(_interned(items))
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the state of this set from *state*."""
+        # Unpickled strings are new objects.
+        self.__dict__.update(state)
+        self._dict = dict.fromkeys(map(_intern, self._dict))
+
+    def add(self, element: T) -> None:
+        """Add *element* to this set."""
+        self._dict[_intern(element)] = None
+
+
+class InternedFrozenOrderedSet(FrozenOrderedSet[T_co]):
+    """A :class:`~orderedsets.FrozenOrderedSet` that interns its string \
+        elements.
+
+    See :class:`InternedOrderedSet`.
+
+    .. doctest::
+
+        >>> import sys
+        >>> ifset = InternedFrozenOrderedSet(["".join(["ab", "c"]), 1])
+        >>> ifset
+        InternedFrozenOrderedSet({'abc', 1})
+        >>> next(iter(ifset)) is sys.intern("".join(["a", "bc"]))
+        True
+    """
+
+    def __init__(self, items: Iterable[T_co] | type[_NotProvided] = _NotProvided)\
+            -> None:
+        """Create a new :class:`InternedFrozenOrderedSet`, optionally \
+            initialized with *items*."""
+        super().__init__(_interned(items))
@@ -0,0 +1,189 @@
+"""Streaming serialization of ordered sets.
+
+:func:`dump` writes the elements of a set to a file in chunks, and :func:`load`
+reads them back in chunks into a new set, so that neither needs a list or a
+string of all elements in memory. Two formats are supported:
+
+- ``"jsonl"`` (JSON Lines): one JSON value per line, in a file opened in text
+  mode. Elements must be :class:`str`, :class:`int`, :class:`float`,
+  :class:`bool` or *None*.
+- ``"binary"``: a header followed by one record per element, each a 4-byte
+  little-endian length and the stable encoding of the element, in a file
+  opened in binary mode. Elements must be :class:`int`, :class:`str` or
+  :class:`bytes`. Unlike JSON, this preserves the exact type of bytes and
+  does not need to escape strings.
+
+.. autofunction:: dump
+.. autofunction:: load
+
+.. doctest::
+
+    >>> import io
+    >>> from orderedsets import OrderedSet
+    >>> buf = io.BytesIO()
+    >>> dump(OrderedSet(["b", 1, b"a"]), buf, format="binary")
+    >>> _ = buf.seek(0)
+    >>> load(buf, format="binary")
+    OrderedSet({'b', 1, b'a'})
+"""
+
+from __future__ import annotations
+
+__copyright__ = """
+Copyright (C) 2026 University of Illinois Board of Trustees
+"""
+
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import json
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from json.encoder import encode_basestring
+from struct import Struct
+from typing import IO, Any, Callable, TypeVar
+
+from orderedsets import OrderedSet
+from orderedsets._encoding import _TAG_INT, _TAG_STR, decode, encode
+
+S = TypeVar("S")
+
+_MAGIC = b"OSETS\x00\x01\n"
+_LENGTH = Struct("<I")
+_READ_SIZE = 1 << 20
+_STR = _TAG_STR[0]
+_INT = _TAG_INT[0]
+
+FORMATS = ("jsonl", "binary")
+# Types of the elements that are decoded from JSON as equal, hashable values
+# (bool is a subclass of int).
+_JSON_TYPES = (str, int, float, type(None))
+
+
+def _check_format(format: str) -> None:
+    if format not in FORMATS:
+        raise ValueError(f"unknown format {format!r}, expected one of {FORMATS}")
+
+
+def _chunks(elements: Iterable[Any], chunk_size: int) -> Iterator[list[Any]]:
+    it = iter(elements)
+    while True:
+        chunk = list(islice(it, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def dump(s: Iterable[Any], fp: IO[Any], *, format: str = "jsonl",
+         chunk_size: int = 10_000) -> None:
+    """Write the elements of *s* to the file object *fp* in *format*.
+
+    Elements are serialized and written *chunk_size* at a time. Raises
+    :exc:`TypeError` if an element is not of a type supported by *format*.
+    """
+    _check_format(format)
+    if format == "jsonl":
+        dumps = json.JSONEncoder(ensure_ascii=False).encode
+        for chunk in _chunks(s, chunk_size):
+            # JSON escapes line breaks in strings, so that each element is
+            # written as one line.
+            lines = []
+            for e in chunk:
+                # Shortcuts of dumps() for str and int, the most common types.
+                if type(e) is str:
+                    lines.append(encode_basestring(e))
+                elif type(e) is int:
+                    lines.append(repr(e))
+                elif isinstance(e, _JSON_TYPES):
+                    lines.append(dumps(e))
+                else:
+                    raise TypeError(f"cannot write element of type "
+                                    f"'{type(e).__name__}' as JSON Lines")
+            fp.write("\n".join(lines) + "\n")
+    else:
+        fp.write(_MAGIC)
+        pack = _LENGTH.pack
+        for chunk in _chunks(s, chunk_size):
+            parts: list[bytes] = []
+            for e in chunk:
+                # Inlined encode() for str, the most common type.
+                data = (_TAG_STR + e.encode("utf-8", "surrogatepass")
+                        if type(e) is str else encode(e))
+                parts.extend((pack(len(data)), data))
+            fp.write(b"".join(parts))
+
+
+def _jsonl_elements(fp: IO[str], chunk_size: int) -> Iterator[Any]:
+    # Decoding a chunk of lines as a single JSON array avoids calling the
+    # decoder once per element.
+    lines = (line for line in fp if not line.isspace())
+    for chunk in _chunks(lines, chunk_size):
+        yield from json.loads("[" + ",".join(chunk) + "]")
+
+
+def _binary_elements(fp: IO[bytes]) -> Iterator[Any]:
+    if fp.read(len(_MAGIC)) != _MAGIC:
+        raise ValueError("not a binary ordered set file")
+    unpack_from = _LENGTH.unpack_from
+    header = _LENGTH.size
+    buf = b""
+    while True:
+        data = fp.read(_READ_SIZE)
+        if not data:
+            break
+        # Keep the incomplete record at the end of the previous read.
+        buf += data
+        pos, n = 0, len(buf)
+        while pos + header <= n:
+            start = pos + header
+            end = start + unpack_from(buf, pos)[0]
+            if end > n:
+                break
+            # Inlined decode() for str and int.
+            tag = buf[start]
+            if tag == _STR:
+                yield buf[start + 1:end].decode("utf-8", "surrogatepass")
+            elif tag == _INT:
+                yield int.from_bytes(buf[start + 1:end], "little", signed=True)
+            else:
+                yield decode(buf[start:end])
+            pos = end
+        buf = buf[pos:]
+    if buf:
+        raise ValueError("truncated binary ordered set file")
+
+
+# type-ignore-reason: mypy cannot infer S from the default of cls
+def load(fp: IO[Any], cls: Callable[[Iterable[Any]], S] = OrderedSet,  # type: ignore[assignment]
+         *, format: str = "jsonl", chunk_size: int = 10_000) -> S:
+    """Return a new set of type *cls* with the elements read from the file \
+        object *fp* in *format*.
+
+    *cls* is called with an iterator over the elements, which are read and
+    decoded in chunks while the set is built, so that the set classes insert
+    them with their bulk fast paths. It can be any set class of this package,
+    or e.g. a :func:`functools.partial` that passes additional arguments.
+    Raises :exc:`ValueError` if *fp* is not in *format*.
+    """
+    _check_format(format)
+    if format == "jsonl":
+        return cls(_jsonl_elements(fp, chunk_size))
+    return cls(_binary_elements(fp))
@@ -0,0 +1,187 @@
+"""Order-sensitive content digests of ordered sets.
+
+A :class:`MerkleDigest` hashes the elements of a set in runs of *chunk_size*
+consecutive elements, and combines the hashes of the runs in a binary tree.
+Its :attr:`~MerkleDigest.root` identifies the elements and their order, and
+does not depend on the process (in particular, not on ``PYTHONHASHSEED``), so
+that two processes can compare sets by exchanging digests instead of
+elements. If the roots differ, :meth:`~MerkleDigest.differing_chunks` finds
+the runs that differ by descending the trees, so that only those need to be
+exchanged.
+
+Elements must be :class:`int`, :class:`str` or :class:`bytes`, which are
+hashed with their stable encoding. :meth:`orderedsets.FrozenOrderedSet.digest`
+caches the digest of a frozen set.
+
+.. autoclass:: MerkleDigest()
+    :members: root, differing_chunks, chunk_range
+
+.. doctest::
+
+    >>> from orderedsets import FrozenOrderedSet
+    >>> a = FrozenOrderedSet(range(10_000))
+    >>> b = FrozenOrderedSet([*range(5_000), -1, *range(5_001, 10_000)])
+    >>> a.digest(chunk_size=1000) == b.digest(chunk_size=1000)
+    False
+    >>> a.digest(chunk_size=1000).differing_chunks(b.digest(chunk_size=1000))
+    [5]
+"""
+
+from __future__ import annotations
+
+__copyright__ = """
+Copyright (C) 2026 University of Illinois Board of Trustees
+"""
+
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from collections.abc import Iterable
+from hashlib import blake2b
+from itertools import islice
+from typing import Any
+
+from orderedsets._encoding import encode
+
+_DIGEST_SIZE = 16
+# Prefixes that distinguish the hashes of runs from those of inner nodes.
+_LEAF = b"\x00"
+_NODE = b"\x01"
+
+
+def _leaf(elements: Iterable[Any]) -> bytes:
+    h = blake2b(_LEAF, digest_size=_DIGEST_SIZE)
+    for e in elements:
+        data = encode(e)
+        h.update(len(data).to_bytes(4, "little"))
+        h.update(data)
+    return h.digest()
+
+
+def _parents(nodes: list[bytes]) -> list[bytes]:
+    # A node without a sibling is promoted unchanged.
+    return [blake2b(_NODE + nodes[i] + nodes[i + 1],
+                    digest_size=_DIGEST_SIZE).digest()
+            if i + 1 < len(nodes) else nodes[i]
+            for i in range(0, len(nodes), 2)]
+
+
+class MerkleDigest:
+    """A Merkle tree over runs of *chunk_size* elements of a set.
+
+    Digests are equal if they were computed with the same chunk size from
+    sets with the same elements in the same order.
+    """
+
+    __slots__ = ("chunk_size", "length", "levels")
+
+    def __init__(self, elements: Iterable[Any], chunk_size: int = 1024, *,
+                 prefix: MerkleDigest | None = None) -> None:
+        """Compute the digest of *elements*.
+
+        If *prefix* is the digest (with the same chunk size) of a sequence that
+        *elements* starts with, the hashes of its complete runs are reused, so
+        that only the remaining elements are hashed.
+        """
+        if chunk_size < 1:
+            raise ValueError(f"invalid chunk size: {chunk_size}")
+        self.chunk_size = chunk_size
+
+        leaves: list[bytes] = []
+        length = 0
+        it = iter(elements)
+        if prefix is not None and prefix.chunk_size == chunk_size:
+            complete = prefix.length // chunk_size
+            leaves = prefix.levels[0][:complete]
+            length = complete * chunk_size
+            # Skip the elements of the reused runs.
+            next(islice(it, length, length), None)
+
+        while True:
+            chunk = list(islice(it, chunk_size))
+            if not chunk:
+                break
+            leaves.append(_leaf(chunk))
+            length += len(chunk)
+
+        self.length: int = length
+        # levels[0] holds the hashes of the runs, and levels[-1] the root.
+        self.levels: list[list[bytes]] = [leaves]
+        while len(self.levels[-1]) > 1:
+            self.levels.append(_parents(self.levels[-1]))
+
+    @property
+    def root(self) -> bytes:
+        """The hash of all elements and their order."""
+        top = self.levels[-1][0] if self.levels[0] else _leaf(())
+        return blake2b(
+            top + self.length.to_bytes(8, "little")
+            + self.chunk_size.to_bytes(8, "little"),
+            digest_size=_DIGEST_SIZE).digest()
+
+    def __eq__(self, other: object) -> bool:
+        """Return whether *other* is a digest of the same elements."""
+        return isinstance(other, MerkleDigest) and self.root == other.root
+
+    def __hash__(self) -> int:
+        """Return a hash of this digest."""
+        return hash(self.root)
+
+    def __repr__(self) -> str:
+        """Return a string representation of this digest."""
+        return (f"{self.__class__.__name__}(root={self.root.hex()!r}, "
+                f"length={self.length}, chunk_size={self.chunk_size})")
+
+    def chunk_range(self, i: int) -> range:
+        """Return the positions of the elements in run *i*."""
+        return range(i * self.chunk_size,
+                     min((i + 1) * self.chunk_size, self.length))
+
+    def differing_chunks(self, other: MerkleDigest) -> list[int]:
+        """Return the indices of the runs that differ between the sets of this \
+            digest and of *other*.
+
+        Runs that exist in only one of the sets are included. Only the
+        subtrees that contain differences are visited, so that the time is
+        proportional to the number of differing runs times the height of the
+        trees. Raises :exc:`ValueError` if the chunk sizes differ.
+        """
+        if other.chunk_size != self.chunk_size:
+            raise ValueError("digests have different chunk sizes: "
+                             f"{self.chunk_size} and {other.chunk_size}")
+
+        nleaves = len(self.levels[0]), len(other.levels[0])
+        level = max(len(self.levels), len(other.levels)) - 1
+        candidates = [0]
+        while True:
+            nodes = self.levels[level] if level < len(self.levels) else []
+            other_nodes = other.levels[level] if level < len(other.levels) else []
+            differing = []
+            for j in candidates:
+                # The runs below a node, which may be truncated at the end.
+                end, other_end = (min((j + 1) << level, n) for n in nleaves)
+                if (end != other_end or j >= len(nodes) or j >= len(other_nodes)
+                        or nodes[j] != other_nodes[j]):
+                    differing.append(j)
+            if level == 0:
+                return [j for j in differing if j < max(nleaves)]
+            candidates = [c for j in differing for c in (2 * j, 2 * j + 1)]
+            level -= 1
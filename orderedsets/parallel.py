@@ -0,0 +1,240 @@
+"""Parallel set algebra for very large ordered sets.
+
+The functions in this module compute the same results as the corresponding
+methods of :class:`~orderedsets.OrderedSet`, but split the work over several
+workers. Each worker looks up the elements of a contiguous range of an operand
+in the other operand and returns a membership mask for its range, and the
+selected elements of the ranges are concatenated in order, so that the result
+is identical to the result of the serial method.
+
+On free-threaded Python builds, the workers are threads of a
+:class:`~concurrent.futures.ThreadPoolExecutor` by default, which share the
+operands. Otherwise, the serial method is used, unless *use_threads* or
+*executor* is given: with the global interpreter lock, threads do not run in
+parallel, and the processes of a
+:class:`~concurrent.futures.ProcessPoolExecutor` must first receive the
+operands, which costs about as much as the set operation itself. A pool
+created for the call (with ``use_threads=False``) sends them once to each
+worker when it starts, an existing *executor* of processes with each task.
+``examples/parallel_speed.py`` measures the scaling on a given machine.
+
+.. autofunction:: union
+.. autofunction:: intersection
+.. autofunction:: difference
+.. autofunction:: symmetric_difference
+"""
+
+from __future__ import annotations
+
+__copyright__ = """
+Copyright (C) 2026 University of Illinois Board of Trustees
+"""
+
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import os
+import sys
+from collections.abc import Collection, Container, Iterable, Sequence
+from itertools import compress
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+    from typing import List, Tuple
+
+    from orderedsets import FrozenOrderedSet, OrderedSet
+
+    S = TypeVar("S", OrderedSet[Any], FrozenOrderedSet[Any])
+
+    # Pairs of a sequence of elements and a container to look them up in.
+    Operands = List[Tuple[Sequence[Any], Container[Any]]]
+
+# Operands smaller than this are processed serially.
+_MIN_PARALLEL_SIZE = 100_000
+
+# The operands of the current set operation in a worker process of a pool
+# created by _run().
+_operands: Operands = []
+
+# How the operands reach the workers: installed in each worker process when it
+# starts, shared by reference with worker threads, or copied for each task.
+_INSTALLED = "installed"
+_SHARED = "shared"
+_COPIED = "copied"
+
+
+def _free_threaded() -> bool:
+    return not getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
+def _set_operands(operands: Operands) -> None:
+    global _operands
+    _operands = operands
+
+
+def _mask(operands: Operands | None, pair: int, start: int, stop: int,
+          keep_common: bool) -> bytes:
+    # Selects the elements at positions *start* to *stop* of the sequence of
+    # operands[pair] that are in its container (if *keep_common* is true) or
+    # not in it (otherwise).
+    items, other = (_operands if operands is None else operands)[pair]
+    if keep_common:
+        return bytes([e in other for e in items[start:stop]])
+    return bytes([e not in other for e in items[start:stop]])
+
+
+def _filter(operands: Operands, pair: int, keep_common: bool, workers: int,
+            executor: Executor, how: str) -> list[Any]:
+    # Returns the elements of the sequence of operands[pair] that are (or are
+    # not) in its container, in order. Each worker processes a contiguous
+    # range of the sequence, so that the result is the concatenation of the
+    # selected elements of the ranges.
+    items, other = operands[pair]
+    bounds = [len(items) * i // workers for i in range(workers + 1)]
+    futures = []
+    for start, stop in zip(bounds, bounds[1:]):
+        if how == _INSTALLED:
+            future = executor.submit(_mask, None, pair, start, stop, keep_common)
+        elif how == _SHARED:
+            future = executor.submit(_mask, operands, pair, start, stop,
+                                     keep_common)
+        else:
+            future = executor.submit(_mask, [(items[start:stop], other)], 0, 0,
+                                     stop - start, keep_common)
+        futures.append(future)
+    return list(compress(items, b"".join([f.result() for f in futures])))
+
+
+def _lookup(s: Collection[Any]) -> Container[Any]:
+    # A container with the elements of *s* that is fast to look up in.
+    from orderedsets import FrozenOrderedSet, OrderedSet
+
+    if isinstance(s, (OrderedSet, FrozenOrderedSet)):
+        # Looking up in the dict avoids calling __contains__ in Python.
+        return s._dict
+    if isinstance(s, (set, frozenset, dict)):
+        return s
+    return set(s)
+
+
+def _run(op: str, a: S, b: Iterable[Any], workers: int | None,
+         executor: Executor | None, use_threads: bool | None) -> S:
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if not 1 <= workers < 2**16:
+        raise ValueError(f"invalid number of workers: {workers}")
+
+    other = b if isinstance(b, Collection) else list(b)
+
+    if (workers == 1 or len(a) + len(other) < _MIN_PARALLEL_SIZE
+            or (executor is None and use_threads is None
+                and not _free_threaded())):
+        # type-ignore-reason: mypy cannot follow the method name
+        return getattr(a, op)(other)  # type: ignore[no-any-return]
+
+    a_items = list(a)
+    if op in ("union", "symmetric_difference"):
+        b_items = other if isinstance(other, Sequence) else list(other)
+    if op == "union":
+        operands: Operands = [(b_items, a._dict)]
+    elif op in ("intersection", "difference"):
+        operands = [(a_items, _lookup(other))]
+    else:
+        assert op == "symmetric_difference"
+        operands = [(a_items, _lookup(other)), (b_items, a._dict)]
+
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    if executor is None:
+        if use_threads is None:
+            use_threads = _free_threaded()
+        if use_threads:
+            pool: Executor = ThreadPoolExecutor(max_workers=workers)
+        else:
+            pool = ProcessPoolExecutor(max_workers=workers,
+                                       initializer=_set_operands,
+                                       initargs=(operands,))
+        with pool:
+            return _compute(op, a, a_items, operands, workers, pool,
+                            _SHARED if use_threads else _INSTALLED)
+
+    how = _SHARED if isinstance(executor, ThreadPoolExecutor) else _COPIED
+    return _compute(op, a, a_items, operands, workers, executor, how)
+
+
+def _compute(op: str, a: S, a_items: list[Any], operands: Operands,
+             workers: int, executor: Executor, how: str) -> S:
+    if op == "union":
+        items = a_items + _filter(operands, 0, False, workers, executor, how)
+    elif op == "intersection":
+        items = _filter(operands, 0, True, workers, executor, how)
+    elif op == "difference":
+        items = _filter(operands, 0, False, workers, executor, how)
+    else:
+        items = (_filter(operands, 0, False, workers, executor, how)
+                 + _filter(operands, 1, False, workers, executor, how))
+
+    return a.__class__(items)
+
+
+def union(a: S, b: Iterable[Any], workers: int | None = None, *,
+          executor: Executor | None = None, use_threads: bool | None = None) -> S:
+    """Return the union of *a* and *b*, computed by *workers* workers.
+
+    *workers* defaults to the number of CPUs. If *executor* is not given, a new
+    pool is created for the duration of the call; *use_threads* selects a
+    thread pool instead of a process pool. By default, a thread pool is used on
+    free-threaded builds, and the serial method otherwise. The result has the
+    type of *a*.
+    """
+    return _run("union", a, b, workers, executor, use_threads)
+
+
+def intersection(a: S, b: Iterable[Any], workers: int | None = None, *,
+                 executor: Executor | None = None,
+                 use_threads: bool | None = None) -> S:
+    """Return the intersection of *a* and *b*, computed by *workers* workers.
+
+    See :func:`union` for the meaning of the arguments.
+    """
+    return _run("intersection", a, b, workers, executor, use_threads)
+
+
+def difference(a: S, b: Iterable[Any], workers: int | None = None, *,
+               executor: Executor | None = None,
+               use_threads: bool | None = None) -> S:
+    """Return the difference of *a* and *b*, computed by *workers* workers.
+
+    See :func:`union` for the meaning of the arguments.
+    """
+    return _run("difference", a, b, workers, executor, use_threads)
+
+
+def symmetric_difference(a: S, b: Iterable[Any], workers: int | None = None, *,
+                         executor: Executor | None = None,
+                         use_threads: bool | None = None) -> S:
+    """Return the symmetric difference of *a* and *b*, computed by \
+        *workers* workers.
+
+    See :func:`union` for the meaning of the arguments.
+    """
+    return _run("symmetric_difference", a, b, workers, executor, use_threads)
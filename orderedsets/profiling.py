@@ -0,0 +1,293 @@
+"""Opt-in profiling of the operations of the set classes.
+
+While profiling is enabled, every call of a method of
+:class:`~orderedsets.OrderedSet`, :class:`~orderedsets.FrozenOrderedSet`,
+:class:`~orderedsets.IndexSet` and :class:`~orderedsets.FrozenIndexSet`
+(including methods inherited by subclasses) is counted per class and method.
+Sampled calls are also timed, and the size of the set and of set operands are
+recorded in histograms. Profiling works by temporarily replacing the methods
+with wrappers, so it does not use :func:`sys.setprofile` and has no overhead
+when it is disabled.
+
+Profiling can be enabled for a block of code with :func:`profile`:
+
+.. doctest::
+
+    >>> from orderedsets import OrderedSet
+    >>> with profile() as prof:
+    ...     s = OrderedSet(range(10))
+    ...     s.add(10); s.add(11)
+    >>> prof.report()["OrderedSet"]["add"]["calls"]
+    2
+
+or for a whole program by setting the environment variable
+``ORDEREDSETS_PROFILE`` to the name of a file, to which the report is written
+as JSON when the program exits (``ORDEREDSETS_PROFILE=1`` writes it to
+standard error).
+
+To reduce the overhead in production, *sample_every* times (and passes to the
+*hook*) only every n-th call. The *hook* is called with the class name, the
+method name, the duration in seconds, and the size of the set (or *None*),
+e.g. to forward the samples to a monitoring system.
+
+Profiling is global and not thread-safe: concurrent calls from several
+threads may be counted inexactly.
+
+.. autoclass:: Profile
+    :members: report, to_json, reset
+
+.. autofunction:: profile
+.. autofunction:: enable
+.. autofunction:: disable
+"""
+
+from __future__ import annotations
+
+__copyright__ = """
+Copyright (C) 2026 University of Illinois Board of Trustees
+"""
+
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import json
+import sys
+from collections.abc import Generator
+from contextlib import contextmanager
+from functools import wraps
+from inspect import isfunction
+from time import perf_counter
+from typing import Any, Callable, Optional
+
+import orderedsets
+
+# Methods whose positional arguments are sets or iterables, for which the
+# operand size is recorded.
+_OPERAND_METHODS = frozenset({
+    "__init__", "__eq__", "__and__", "__iand__", "__or__", "__ior__",
+    "__sub__", "__isub__", "__xor__", "__ixor__",
+    "__le__", "__lt__", "__ge__", "__gt__",
+    "difference", "difference_update", "intersection", "intersection_update",
+    "isdisjoint", "issubset", "issuperset",
+    "symmetric_difference", "symmetric_difference_update", "union", "update",
+})
+
+Hook = Callable[[str, str, float, Optional[int]], None]
+
+
+def _bucket(size: int) -> int:
+    # Lower bound of the power-of-two histogram bucket of *size*.
+    return 1 << (size.bit_length() - 1) if size else 0
+
+
+class _Stats:
+    __slots__ = ("calls", "operand_sizes", "sampled", "sizes", "time")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.sampled = 0
+        self.time = 0.
+        self.sizes: dict[int, int] = {}
+        self.operand_sizes: dict[int, int] = {}
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "sampled_calls": self.sampled,
+            "total_time": self.time,
+            "size_histogram": {str(k): v for k, v in sorted(self.sizes.items())},
+            "operand_size_histogram": {
+                str(k): v for k, v in sorted(self.operand_sizes.items())},
+        }
+
+
+class Profile:
+    """The statistics collected while profiling is enabled.
+
+    Calls are counted exactly. Only every *sample_every*-th call is timed,
+    recorded in the size histograms, and passed to *hook*.
+    """
+
+    def __init__(self, sample_every: int = 1, hook: Hook | None = None) -> None:
+        """Create a new, empty :class:`Profile`."""
+        if sample_every < 1:
+            raise ValueError(f"invalid sampling interval: {sample_every}")
+        self.sample_every = sample_every
+        self.hook = hook
+        self._countdown = sample_every
+        self._stats: dict[tuple[str, str], _Stats] = {}
+
+    def reset(self) -> None:
+        """Discard all statistics collected so far."""
+        self._stats.clear()
+        self._countdown = self.sample_every
+
+    def report(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """Return the statistics by class name and method name.
+
+        For each method, the report contains the number of ``calls``, the
+        number of ``sampled_calls``, their ``total_time`` in seconds
+        (including the time spent in nested calls), and histograms of the size
+        of the set (``size_histogram``) and of the total size of the operands
+        (``operand_size_histogram``) in the sampled calls. Histogram buckets
+        are powers of two, keyed by their lower bound as a string: bucket
+        ``"4"`` counts sizes 4 to 7.
+        """
+        result: dict[str, dict[str, dict[str, Any]]] = {}
+        for (cls_name, method), stats in sorted(self._stats.items()):
+            result.setdefault(cls_name, {})[method] = stats.as_dict()
+        return result
+
+    def to_json(self, **kwargs: Any) -> str:
+        """Return :meth:`report` as a JSON string.
+
+        *kwargs* are passed to :func:`json.dumps`.
+        """
+        return json.dumps(self.report(), **kwargs)
+
+
+# {{{ method wrapping
+
+_CLASSES = (orderedsets.OrderedSet, orderedsets.FrozenOrderedSet,
+            orderedsets.IndexSet, orderedsets.FrozenIndexSet)
+
+_active: Profile | None = None
+_originals: list[tuple[type, str, Any]] = []
+
+
+def _size(obj: Any) -> int:
+    # Avoid calling (and counting) the wrapped __len__ of our own classes.
+    d = getattr(obj, "__dict__", {}).get("_dict")
+    if isinstance(d, dict):
+        return len(d)
+    try:
+        return len(obj)
+    except TypeError:
+        return 0
+
+
+def _record(prof: Profile, cls: type, name: str, func: Callable[..., Any],
+            self: Any, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+    stats = prof._stats.get((cls.__name__, name))
+    if stats is None:
+        stats = prof._stats[cls.__name__, name] = _Stats()
+    stats.calls += 1
+
+    prof._countdown -= 1
+    if prof._countdown:
+        return func(self, *args, **kwargs)
+    prof._countdown = prof.sample_every
+
+    # Objects that are being initialized or that do not store their elements
+    # in a dict have no size.
+    d = self.__dict__.get("_dict")
+    size = len(d) if isinstance(d, dict) else None
+    if name in _OPERAND_METHODS:
+        operand_size = sum(_size(arg) for arg in args)
+        stats.operand_sizes[_bucket(operand_size)] = \
+            stats.operand_sizes.get(_bucket(operand_size), 0) + 1
+    if size is not None:
+        stats.sizes[_bucket(size)] = stats.sizes.get(_bucket(size), 0) + 1
+
+    start = perf_counter()
+    try:
+        return func(self, *args, **kwargs)
+    finally:
+        elapsed = perf_counter() - start
+        stats.sampled += 1
+        stats.time += elapsed
+        if prof.hook is not None:
+            prof.hook(cls.__name__, name, elapsed, size)
+
+
+def _wrap(name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+    @wraps(func)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        # _active can only be None here if the method was saved while
+        # profiling was enabled and is called after it was disabled.
+        if _active is None:
+            return func(self, *args, **kwargs)
+        return _record(_active, type(self), name, func, self, args, kwargs)
+
+    return wrapper
+
+
+def enable(prof: Profile | None = None) -> Profile:
+    """Enable profiling, collecting statistics in *prof* or in a new \
+        :class:`Profile`, and return it.
+
+    Raises :exc:`RuntimeError` if profiling is already enabled.
+    """
+    global _active
+
+    if _active is not None:
+        raise RuntimeError("profiling is already enabled")
+    _active = prof if prof is not None else Profile()
+
+    for cls in _CLASSES:
+        for name, func in list(vars(cls).items()):
+            if isfunction(func) and name not in ("__init_subclass__",
+                                                 "__class_getitem__"):
+                _originals.append((cls, name, func))
+                setattr(cls, name, _wrap(name, func))
+
+    return _active
+
+
+def disable() -> Profile | None:
+    """Disable profiling and return the active :class:`Profile`, if any."""
+    global _active
+
+    for cls, name, func in reversed(_originals):
+        setattr(cls, name, func)
+    _originals.clear()
+
+    prof, _active = _active, None
+    return prof
+
+
+@contextmanager
+def profile(sample_every: int = 1, hook: Hook | None = None) \
+        -> Generator[Profile, None, None]:
+    """Return a context manager that enables profiling in its body and \
+        yields the :class:`Profile`."""
+    prof = enable(Profile(sample_every, hook))
+    try:
+        yield prof
+    finally:
+        disable()
+
+# }}}
+
+
+def _write_report(prof: Profile, destination: str) -> None:
+    if destination == "1":
+        sys.stderr.write(prof.to_json(indent=1) + "\n")
+    else:
+        with open(destination, "w") as f:
+            f.write(prof.to_json(indent=1))
+
+
+def _enable_from_environment(destination: str) -> None:
+    # Called on import if the ORDEREDSETS_PROFILE environment variable is set.
+    import atexit
+
+    atexit.register(_write_report, enable(), destination)
@@ -0,0 +1,342 @@
+"""An ordered set that spreads its elements over several dicts."""
+
+from __future__ import annotations
+
+__copyright__ = """
+Copyright (C) 2026 University of Illinois Board of Trustees
+"""
+
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import sys
+from collections.abc import Iterable, Iterator
+from heapq import merge
+from operator import itemgetter
+from typing import Any
+
+from orderedsets import T, _NotProvided
+
+if sys.version_info >= (3, 9):  # pragma: no cover
+    from collections.abc import MutableSet, Set  # noqa: PYI025
+else:  # pragma: no cover
+    from typing import AbstractSet as Set
+    from typing import MutableSet
+
+# Odd multiplier whose product with the hash of an element chooses its shard
+# from the middle bits of the hash, so that the elements of a shard do not
+# share the low bits that choose their slot in the dict of the shard.
+_MIX = 0x9E3779B97F4A7C15
+_MASK64 = (1 << 64) - 1
+# Removed elements leave a placeholder in the insertion order, which is
+# compacted once it has more than this many entries plus twice the number of
+# elements.
+_ORDER_SLACK = 64
+# The number of entries of the insertion order that each add() or removal
+# compacts, which bounds their latency. Since it is larger than 1, compacting
+# finishes before the elements added in the meantime double the order.
+_COMPACT_STEP = 8
+# The placeholder of removed elements in the insertion order.
+_REMOVED: Any = object()
+
+
+class ShardedOrderedSet(MutableSet[T]):
+    """A mutable ordered set whose elements are spread over *shards* dicts.
+
+    Each element is stored in the dict selected by its hash, together with a
+    sequence number that records the insertion order. When a dict grows, Python
+    copies it into a larger table, which for a single dict with many millions
+    of elements can stall an :meth:`add` for hundreds of milliseconds. Since
+    every shard only holds about 1 / *shards* of the elements, such a resize
+    copies only that fraction of the set, which bounds the latency of
+    individual insertions. In exchange, the typical operation is a few times
+    slower than for :class:`~orderedsets.OrderedSet`, since it is implemented
+    in Python.
+
+    Membership tests, :meth:`add`, :meth:`discard`, :meth:`remove`,
+    :meth:`pop` and :func:`len` take (amortized) O(1) like for
+    :class:`~orderedsets.OrderedSet`. Removed elements are dropped from the
+    insertion order a few entries per operation, so that none of them stalls
+    to compact it. Iteration merges the shards by sequence
+    number in O(n log(shards)). Operations that produce new sets return
+    :class:`ShardedOrderedSet` instances with the same number of shards.
+
+    .. doctest::
+
+        >>> sset = ShardedOrderedSet(["b", "a", "c"], shards=4)
+        >>> sset.add("d"); sset.discard("a")
+        >>> sset
+        ShardedOrderedSet({'b', 'c', 'd'})
+    """
+
+    def __init__(self, items: Iterable[T] | type[_NotProvided] = _NotProvided,
+                 *, shards: int = 64) -> None:
+        """Create a new :class:`ShardedOrderedSet` with *shards* dicts, \
+            optionally initialized with *items*."""
+        if shards < 1:
+            raise ValueError(f"invalid number of shards: {shards}")
+        self._init_shards(shards)
+        if items is not _NotProvided:
+            # type-ignore-reason:
+            # mypy thinks 'items' can still be Type[_NotProvided] here.
+            self.update(items)  # type: ignore[arg-type]
+
+    def _init_shards(self, shards: int) -> None:
+        self._shards: tuple[dict[T, int], ...] = tuple({} for _ in range(shards))
+        # The element added with each sequence number, or _REMOVED.
+        self._order: list[Any] = []
+        # While the insertion order is compacted, the elements before
+        # _cursor in _order have been renumbered into _compacted, and
+        # sequence numbers below _cursor refer to _compacted.
+        self._compacted: list[Any] | None = None
+        self._cursor = 0
+        self._len = 0
+
+    def _index(self, element: object) -> int:
+        return ((hash(element) * _MIX & _MASK64) >> 32) % len(self._shards)
+
+    def _compact(self) -> None:
+        # Renumbers the next entries of the insertion order into _compacted.
+        # The new sequence numbers are smaller than _cursor, and those of the
+        # remaining elements are at least _cursor, so the elements of each
+        # shard stay ordered by sequence number.
+        compacted = self._compacted
+        assert compacted is not None
+        order = self._order
+        shards = self._shards
+        start = self._cursor
+        stop = min(start + _COMPACT_STEP, len(order))
+        for e in order[start:stop]:
+            if e is not _REMOVED:
+                shards[self._index(e)][e] = len(compacted)
+                compacted.append(e)
+        if stop == len(order):
+            self._order = compacted
+            self._compacted = None
+            self._cursor = 0
+        else:
+            self._cursor = stop
+
+    def _removed(self, seq: int) -> None:
+        if self._compacted is not None and seq < self._cursor:
+            self._compacted[seq] = _REMOVED
+        else:
+            self._order[seq] = _REMOVED
+        self._len -= 1
+        if self._compacted is not None:
+            self._compact()
+        elif len(self._order) > 2 * self._len + _ORDER_SLACK:
+            self._compacted = []
+            self._compact()
+
+    def _new(self, items: Iterable[T]) -> ShardedOrderedSet[T]:
+        return self.__class__(items, shards=len(self._shards))
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state of this set for pickling."""
+        # The shard of an element depends on its hash, which can differ
+        # between processes.
+        return {"elements": list(self), "shards": len(self._shards)}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the state of this set from *state*."""
+        self._init_shards(state["shards"])
+        self.update(state["elements"])
+
+    def __eq__(self, other: object) -> bool:
+        """Return whether this set is equal to *other*."""
+        return (isinstance(other, Set)
+                and len(self) == len(other)
+                and all(i in other for i in self))
+
+    def __repr__(self) -> str:
+        """Return a string representation of this set."""
+        cls_name = self.__class__.__name__
+        if len(self) == 0:
+            return f"{cls_name}()"
+        return f"{cls_name}({{" + ", ".join([repr(k) for k in self]) + "})"
+
+    def __len__(self) -> int:
+        """Return the number of elements in this set."""
+        return self._len
+
+    def __contains__(self, o: object) -> bool:
+        """Return whether *o* is in this set."""
+        return o in self._shards[
+            ((hash(o) * _MIX & _MASK64) >> 32) % len(self._shards)]
+
+    def __iter__(self) -> Iterator[T]:
+        """Return an iterator over the elements in insertion order."""
+        # Each shard is ordered by sequence number, which is unique, so the
+        # elements themselves are never compared.
+        return map(itemgetter(1), merge(*(zip(shard.values(), shard)
+                                          for shard in self._shards)))
+
+    # {{{ mutations
+
+    def add(self, element: T) -> None:
+        """Add *element* to this set."""
+        i = ((hash(element) * _MIX & _MASK64) >> 32) % len(self._shards)
+        shard = self._shards[i]
+        if element not in shard:
+            # The sequence number is the position in the insertion order.
+            shard[element] = len(self._order)
+            self._order.append(element)
+            self._len += 1
+            if self._compacted is not None:
+                self._compact()
+
+    def discard(self, element: T) -> None:
+        """Remove *element* from this set if it is present."""
+        seq = self._shards[self._index(element)].pop(element, -1)
+        if seq >= 0:
+            self._removed(seq)
+
+    def remove(self, element: T) -> None:
+        """Remove *element* from this set, raising :exc:`KeyError` if not present."""
+        self._removed(self._shards[self._index(element)].pop(element))
+
+    def pop(self) -> T:
+        """Remove and return the most recently added element from this set."""
+        while True:
+            order = self._order
+            if len(order) == self._cursor:
+                if self._compacted is None:
+                    raise KeyError("pop from an empty set")
+                # The remaining elements have all been renumbered.
+                self._order = self._compacted
+                self._compacted = None
+                self._cursor = 0
+                continue
+            element: T = order.pop()
+            if element is not _REMOVED:
+                del self._shards[self._index(element)][element]
+                self._len -= 1
+                return element
+
+    def clear(self) -> None:
+        """Remove all elements from this set."""
+        self._init_shards(len(self._shards))
+
+    def update(self, *others: Iterable[T]) -> None:
+        """Update this set to be the union of itself and *others*."""
+        for other in others:
+            for e in other:
+                self.add(e)
+
+    def difference_update(self, *others: Iterable[T]) -> None:
+        """Update this set to remove all items that are in *others*."""
+        for other in others:
+            for e in list(other) if other is self else other:
+                self.discard(e)
+
+    def intersection_update(self, *others: Iterable[T]) -> None:
+        """Update this set to be the intersection of itself and *others*."""
+        keep = self.intersection(*others)
+        for e in [e for e in self if e not in keep]:
+            self.discard(e)
+
+    def symmetric_difference_update(self, s: Iterable[T]) -> None:
+        """Update this set to be the symmetric difference of itself and *s*."""
+        for e in dict.fromkeys(s):
+            if e in self:
+                self.discard(e)
+            else:
+                self.add(e)
+
+    def __iand__(self, s: Set[Any]) -> ShardedOrderedSet[T]:
+        """Update this set to be the intersection of itself and *s*."""
+        self.intersection_update(s)
+        return self
+
+    def __ior__(self, s: Set[Any]) -> ShardedOrderedSet[T]:
+        """Update this set to be the union of itself and *s*."""
+        self.update(s)
+        return self
+
+    def __isub__(self, s: Set[Any]) -> ShardedOrderedSet[T]:
+        """Update this set to be the difference of itself and *s*."""
+        self.difference_update(s)
+        return self
+
+    def __ixor__(self, s: Set[Any]) -> ShardedOrderedSet[T]:
+        """Update this set to be the symmetric difference of itself and *s*."""
+        self.symmetric_difference_update(s)
+        return self
+
+    # }}}
+
+    # {{{ new sets
+
+    def copy(self) -> ShardedOrderedSet[T]:
+        """Return a shallow copy of this set."""
+        return self._new(self)
+
+    def difference(self, *others: Iterable[T]) -> ShardedOrderedSet[T]:
+        """Return the difference of this set and *others*."""
+        result = self.copy()
+        result.difference_update(*others)
+        return result
+
+    def intersection(self, *others: Iterable[T]) -> ShardedOrderedSet[T]:
+        """Return the intersection of this set and *others*."""
+        keep = [other if isinstance(other, Set) else set(other)
+                for other in others]
+        return self._new(e for e in self if all(e in k for k in keep))
+
+    def symmetric_difference(self, s: Iterable[T]) -> ShardedOrderedSet[T]:
+        """Return the symmetric difference of this set and *s*."""
+        result = self.copy()
+        result.symmetric_difference_update(s)
+        return result
+
+    def union(self, *others: Iterable[T]) -> ShardedOrderedSet[T]:
+        """Return the union of this set and *others*."""
+        result = self.copy()
+        result.update(*others)
+        return result
+
+    def issubset(self, s: Iterable[T]) -> bool:
+        """Return whether this set is a subset of *s*."""
+        other = s if isinstance(s, Set) else set(s)
+        return all(i in other for i in self)
+
+    def issuperset(self, s: Iterable[T]) -> bool:
+        """Return whether this set is a superset of *s*."""
+        return all(i in self for i in s)
+
+    def __and__(self, s: Set[Any]) -> ShardedOrderedSet[T]:
+        """Return the intersection of this set and *s*."""
+        return self.intersection(s)
+
+    def __or__(self, s: Set[Any]) -> ShardedOrderedSet[T]:
+        """Return the union of this set and *s*."""
+        return self.union(s)
+
+    def __sub__(self, s: Set[Any]) -> ShardedOrderedSet[T]:
+        """Return the difference of this set and *s*."""
+        return self.difference(s)
+
+    def __xor__(self, s: Set[Any]) -> ShardedOrderedSet[T]:
+        """Return the symmetric difference of this set and *s*."""
+        return self.symmetric_difference(s)
+
+    # }}}
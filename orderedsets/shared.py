@@ -0,0 +1,397 @@
+"""Frozen ordered sets stored in shared memory."""
+
+from __future__ import annotations
+
+__copyright__ = """
+Copyright (C) 2026 University of Illinois Board of Trustees
+"""
+
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any
+
+from orderedsets import FrozenOrderedSet, T_co, _NotProvided
+from orderedsets._bloom import BloomFilter, filter_words
+from orderedsets._encoding import decode, encode, encode_lookup, stable_hash
+
+if sys.version_info >= (3, 9):  # pragma: no cover
+    from collections.abc import Set  # noqa: PYI025
+else:  # pragma: no cover
+    from typing import AbstractSet as Set
+
+if TYPE_CHECKING:
+    from multiprocessing.shared_memory import SharedMemory
+
+# Memory layout (all integers are little-endian, unsigned, 64 bits wide):
+#
+#   header:  magic, number of elements n, hash table size, number of filter
+#            words (0 if there is no filter), filter error rate (a double)
+#   offsets: n+1 offsets of the element encodings, relative to the data section
+#   hashes:  n stable hashes of the element encodings
+#   table:   open-addressing hash table of (element index + 1), 0 means empty
+#   data:    concatenated element encodings, padded to a multiple of 8 bytes
+#   filter:  the words of the Bloom filter of the stable hashes of the elements
+_MAGIC = b"OSETSHM3"
+# Whether SharedMemory registers blocks with the resource tracker, which
+# unlinks them when the process exits.
+_TRACKED = os.name == "posix"
+_HEADER = struct.Struct("<8sQQQd")
+
+
+def _table_size(n: int) -> int:
+    size = 2
+    while size < 2 * n:
+        size *= 2
+    return size
+
+
+class SharedFrozenOrderedSet(Set[T_co]):
+    """A frozen ordered set stored in :mod:`multiprocessing.shared_memory`.
+
+    Elements must be of type :class:`int`, :class:`str` or :class:`bytes`.
+    Creating a :class:`SharedFrozenOrderedSet` publishes the elements into a new
+    shared memory block, which other processes can attach to by name with
+    :meth:`attach`, without copying the elements. Pickling an instance (for
+    example, to pass it to a :mod:`multiprocessing` worker) only transfers the
+    name of the block.
+
+    Membership tests use a hash table stored in the shared memory block, and
+    iteration decodes elements directly from it. Operations that produce new sets
+    (such as :meth:`union`) return process-local :class:`~orderedsets.FrozenOrderedSet`
+    instances. Integers are stored as plain :class:`int`.
+
+    If *filter_error_rate* is given, a Bloom filter of the elements with this
+    false positive rate is built once when the set is created and stored in the
+    shared memory block, where processes that attach to the set use it
+    without copying it. Membership tests (and thus :meth:`isdisjoint`) check it
+    after computing the stable hash of the element, so that most elements that
+    are not in the set are rejected without probing the shared hash table.
+    Since checking the filter costs about as much as the probe, this does not
+    make misses noticeably faster (see ``examples/filter_speed.py``), and
+    membership tests that hit are slower.
+
+    The process that created the set is responsible for calling :meth:`unlink`
+    (or using the set as a context manager) once no process needs it anymore.
+    Requires Python 3.8 or later.
+
+    .. doctest::
+
+        >>> with SharedFrozenOrderedSet(["a", "b", 3]) as sset:
+        ...     other = SharedFrozenOrderedSet.attach(sset.name)
+        ...     print(list(other), "b" in other, 4 in other)
+        ...     other.close()
+        ['a', 'b', 3] True False
+
+    .. automethod:: attach
+    .. automethod:: __getitem__
+    """
+
+    def __init__(self, items: Iterable[T_co] | type[_NotProvided] = _NotProvided,
+                 *, name: str | None = None,
+                 filter_error_rate: float | None = None) -> None:
+        """Publish *items* into a new shared memory block called *name*."""
+        from multiprocessing.shared_memory import SharedMemory
+
+        if items is _NotProvided:
+            elements: list[Any] = []
+        else:
+            # type-ignore-reason:
+            # mypy thinks 'items' can still be Type[_NotProvided] here.
+            elements = list(dict.fromkeys(items))  # type: ignore[arg-type]
+        encoded = [encode(e) for e in elements]
+
+        n = len(encoded)
+        table_size = _table_size(n)
+        hashes = array("Q", [stable_hash(e) for e in encoded])
+        offsets = array("Q", [0])
+        for e in encoded:
+            offsets.append(offsets[-1] + len(e))
+
+        table = array("Q", bytes(8 * table_size))
+        mask = table_size - 1
+        for i, h in enumerate(hashes):
+            slot = h & mask
+            while table[slot]:
+                slot = (slot + 1) & mask
+            table[slot] = i + 1
+
+        bloom = b""
+        if filter_error_rate is not None:
+            bloom_filter = BloomFilter(n, filter_error_rate)
+            for h in hashes:
+                bloom_filter.add(h)
+            bloom = bloom_filter.tobytes()
+        data = b"".join(encoded)
+        padding = bytes(-len(data) % 8)
+
+        size = (_HEADER.size + 8 * (2 * n + 1 + table_size) + len(data)
+                + len(padding) + len(bloom))
+        shm = SharedMemory(name=name, create=True, size=size)
+        try:
+            buf = shm.buf
+            assert buf is not None
+            _HEADER.pack_into(buf, 0, _MAGIC, n, table_size, len(bloom) // 8,
+                              filter_error_rate or 0.)
+            pos = _HEADER.size
+            for part in (offsets.tobytes(), hashes.tobytes(), table.tobytes(),
+                         data, padding, bloom):
+                buf[pos:pos + len(part)] = part
+                pos += len(part)
+            self._setup(shm, owner=True)
+        except BaseException:  # pragma: no cover
+            shm.close()
+            shm.unlink()
+            raise
+
+    @classmethod
+    def attach(cls, name: str) -> SharedFrozenOrderedSet[T_co]:
+        """Attach to the shared memory block *name* of another \
+            :class:`SharedFrozenOrderedSet`."""
+        from multiprocessing.shared_memory import SharedMemory
+
+        # Only the creator should unlink the block on exit.
+        if sys.version_info >= (3, 13):  # pragma: no cover
+            shm = SharedMemory(name=name, track=False)
+        else:  # pragma: no cover
+            shm = SharedMemory(name=name)
+
+        self = cls.__new__(cls)
+        try:
+            self._setup(shm, owner=False)
+        except BaseException:
+            shm.close()
+            raise
+
+        if sys.version_info < (3, 13) and _TRACKED:  # pragma: no cover
+            from multiprocessing import resource_tracker
+
+            # type-ignore-reason: _name is the name with its leading "/"
+            resource_tracker.unregister(shm._name,  # type: ignore[attr-defined]
+                                        "shared_memory")
+        return self
+
+    def _setup(self, shm: SharedMemory, owner: bool) -> None:
+        buf = shm.buf
+        assert buf is not None
+        magic, n, table_size, nwords, error_rate = _HEADER.unpack_from(buf, 0)
+        if magic != _MAGIC:
+            raise ValueError(f"shared memory block '{shm.name}' does not contain "
+                             "a SharedFrozenOrderedSet")
+        if nwords and (not 0 < error_rate < 1
+                       or nwords != filter_words(n, error_rate)):
+            raise ValueError(f"shared memory block '{shm.name}' contains an "
+                             "invalid filter")
+
+        pos = _HEADER.size
+        self._offsets = buf[pos:pos + 8 * (n + 1)].cast("Q")
+        pos += 8 * (n + 1)
+        self._hashes = buf[pos:pos + 8 * n].cast("Q")
+        pos += 8 * n
+        self._table = buf[pos:pos + 8 * table_size].cast("Q")
+        pos += 8 * table_size
+        self._data = buf[pos:pos + self._offsets[n]]
+        pos += self._offsets[n] + -self._offsets[n] % 8
+
+        self._shm = shm
+        self._owner = owner
+        self._len: int = n
+        self._mask: int = table_size - 1
+        self._my_hash: int | None = None
+
+        self._filter_words: memoryview | None = None
+        self._filter: BloomFilter | None = None
+        if nwords:
+            self._filter_words = \
+                buf[pos:pos + 8 * nwords].toreadonly().cast("Q")
+            self._filter = BloomFilter(n, error_rate, self._filter_words)
+
+    @property
+    def name(self) -> str:
+        """The name of the shared memory block holding this set."""
+        return self._shm.name
+
+    def close(self) -> None:
+        """Detach this process from the shared memory block."""
+        if self._shm.buf is None:
+            return
+        for view in (self._offsets, self._hashes, self._table, self._data,
+                     self._filter_words):
+            if view is not None:
+                view.release()
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Detach from and destroy the shared memory block.
+
+        Only the process that created the set should call this.
+        """
+        self.close()
+        if sys.version_info < (3, 13) and _TRACKED:  # pragma: no cover
+            from multiprocessing import resource_tracker
+
+            # A process that attached to the block and shares the resource
+            # tracker of this one has unregistered it, and unlink()
+            # unregisters it again.
+            # type-ignore-reason: _name is the name with its leading "/"
+            resource_tracker.register(self._shm._name,  # type: ignore[attr-defined]
+                                      "shared_memory")
+        self._shm.unlink()
+
+    def __enter__(self) -> SharedFrozenOrderedSet[T_co]:
+        """Return this set."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close this set, and destroy it if this process created it."""
+        if self._owner:
+            self.unlink()
+        else:
+            self.close()
+
+    def __del__(self) -> None:
+        """Release the views into the shared memory block."""
+        if hasattr(self, "_shm"):
+            self.close()
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Return pickling information for this set.
+
+        Only the name of the shared memory block is pickled.
+        """
+        return (self.__class__.attach, (self.name,))
+
+    def _element(self, index: int) -> Any:
+        return decode(self._data[self._offsets[index]:self._offsets[index + 1]])
+
+    def _find(self, o: object) -> int:
+        enc = encode_lookup(o)
+        if enc is None:
+            return -1
+        return self._probe(enc, stable_hash(enc))
+
+    def _probe(self, enc: bytes, h: int) -> int:
+        # Returns the index of the element with encoding *enc* and stable
+        # hash *h*, or -1.
+        table, hashes, offsets, data = \
+            self._table, self._hashes, self._offsets, self._data
+        mask = self._mask
+        slot = h & mask
+        while True:
+            i = table[slot] - 1
+            if i < 0:
+                return -1
+            if hashes[i] == h and data[offsets[i]:offsets[i + 1]] == enc:
+                return i
+            slot = (slot + 1) & mask
+
+    def __len__(self) -> int:
+        """Return the number of elements in this set."""
+        return self._len
+
+    def __contains__(self, o: object) -> bool:
+        """Return whether *o* is in this set."""
+        enc = encode_lookup(o)
+        if enc is None:
+            return False
+        h = stable_hash(enc)
+        if self._filter is not None and h not in self._filter:
+            return False
+        return self._probe(enc, h) >= 0
+
+    def __iter__(self) -> Iterator[T_co]:
+        """Return an iterator over the elements of this set."""
+        for i in range(self._len):
+            yield self._element(i)
+
+    def __getitem__(self, index: int | slice) -> T_co | list[T_co]:
+        """Return the element at *index* or a list of elements for a slice."""
+        if isinstance(index, int):
+            if index < 0:
+                index += self._len
+            if index >= self._len or index < 0:
+                raise IndexError("Index out of range.")
+            return self._element(index)  # type: ignore[no-any-return]
+        elif isinstance(index, slice):
+            return [self._element(i) for i in range(*index.indices(self._len))]
+        else:
+            raise TypeError("Index must be an integer or slice.")
+
+    def index(self, element: object) -> int:
+        """Return the position of *element* in this set.
+
+        Raises :exc:`ValueError` if *element* is not present.
+        """
+        i = self._find(element)
+        if i < 0:
+            raise ValueError(f"{element!r} is not in set")
+        return i
+
+    def __hash__(self) -> int:
+        """Return a hash of this set.
+
+        The hash has the same value as a :class:`frozenset` with the same
+        elements, and it is cached after the first call.
+        """
+        if self._my_hash is None:
+            self._my_hash = hash(frozenset(self))
+        return self._my_hash
+
+    def __repr__(self) -> str:
+        """Return a string representation of this set."""
+        cls_name = self.__class__.__name__
+        if len(self) == 0:
+            return f"{cls_name}()"
+        return f"{cls_name}({{" + ", ".join([repr(k) for k in self]) + "})"
+
+    @classmethod
+    def _from_iterable(cls, it: Iterable[Any]) -> FrozenOrderedSet[Any]:
+        return FrozenOrderedSet(it)
+
+    def difference(self, *others: Iterable[Any]) -> FrozenOrderedSet[T_co]:
+        """Return the difference of this set and *others*."""
+        return FrozenOrderedSet(self).difference(*others)
+
+    def intersection(self, *others: Iterable[Any]) -> FrozenOrderedSet[T_co]:
+        """Return the intersection of this set and *others*."""
+        return FrozenOrderedSet(self).intersection(*others)
+
+    def symmetric_difference(self, s: Iterable[Any]) -> FrozenOrderedSet[T_co]:
+        """Return the symmetric difference of this set and *s*."""
+        return FrozenOrderedSet(self).symmetric_difference(s)
+
+    def union(self, *others: Iterable[Any]) -> FrozenOrderedSet[T_co]:
+        """Return the union of this set and *others*."""
+        return FrozenOrderedSet(self).union(*others)
+
+    def issubset(self, s: Iterable[Any]) -> bool:
+        """Return whether this set is a subset of *s*."""
+        other = s if isinstance(s, Set) else set(s)
+        return all(i in other for i in self)
+
+    def issuperset(self, s: Iterable[Any]) -> bool:
+        """Return whether this set is a superset of *s*."""
+        return all(i in self for i in s)
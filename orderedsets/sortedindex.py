@@ -0,0 +1,381 @@
+"""An ordered set with a sorted index for range and rank queries."""
+
+from __future__ import annotations
+
+__copyright__ = """
+Copyright (C) 2026 University of Illinois Board of Trustees
+"""
+
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Iterable, Iterator, Set  # noqa: PYI025
+from itertools import chain, islice, takewhile
+from typing import Any
+
+from orderedsets import OrderedSet, T, _NotProvided
+from orderedsets._fenwick import FenwickTree
+
+
+class _SortedList:
+    """A sorted list of distinct elements, stored in blocks.
+
+    Blocks have between :attr:`load` / 2 and 2 * :attr:`load` elements (except
+    for a single block), so that insertions and removals move O(load)
+    references. A :class:`~orderedsets._fenwick.FenwickTree` of the block
+    lengths, rebuilt lazily after blocks are split or merged, finds the
+    element at a rank and the rank of an element in O(log n).
+    """
+
+    __slots__ = ("_blocks", "_len", "_lengths", "_maxes")
+
+    load = 512
+
+    def __init__(self, elements: Iterable[Any] = ()) -> None:
+        """Create a sorted list of the distinct *elements*."""
+        values = sorted(elements)
+        load = self.load
+        self._blocks = [values[i:i + load] for i in range(0, len(values), load)]
+        self._maxes = [block[-1] for block in self._blocks]
+        self._len = len(values)
+        self._lengths: FenwickTree | None = None
+
+    def __len__(self) -> int:
+        """Return the number of elements."""
+        return self._len
+
+    def __iter__(self) -> Iterator[Any]:
+        """Return an iterator over the elements in sorted order."""
+        return chain.from_iterable(self._blocks)
+
+    def _tree(self) -> FenwickTree:
+        # The block lengths, rebuilt in O(n / load) after a split or merge.
+        if self._lengths is None:
+            self._lengths = FenwickTree(map(len, self._blocks))
+        return self._lengths
+
+    def _offset(self, block: int) -> int:
+        # The number of elements before *block*.
+        return self._tree().prefix_sum(block)
+
+    def add(self, element: Any) -> None:
+        """Add *element*, which must not be present."""
+        blocks, maxes = self._blocks, self._maxes
+        if not maxes:
+            blocks.append([element])
+            maxes.append(element)
+            self._lengths = None
+        else:
+            i = bisect_left(maxes, element)
+            if i == len(maxes):
+                i -= 1
+                blocks[i].append(element)
+                maxes[i] = element
+            else:
+                insort(blocks[i], element)
+
+            if len(blocks[i]) > 2 * self.load:
+                block = blocks[i]
+                blocks[i:i + 1] = [block[:self.load], block[self.load:]]
+                maxes.insert(i, block[self.load - 1])
+                self._lengths = None
+            elif self._lengths is not None:
+                self._lengths.add(i, 1)
+        self._len += 1
+
+    def remove(self, element: Any) -> None:
+        """Remove *element*, which must be present."""
+        blocks, maxes = self._blocks, self._maxes
+        i = bisect_left(maxes, element)
+        block = blocks[i]
+        del block[bisect_left(block, element)]
+        self._len -= 1
+
+        if len(block) < self.load // 2 and len(blocks) > 1:
+            # Merge the block into a neighbor, and split the result again if
+            # it is too large.
+            j = i - 1 if i else i + 1
+            lo, hi = min(i, j), max(i, j)
+            merged = blocks[lo] + blocks[hi]
+            if len(merged) > 2 * self.load:
+                half = len(merged) // 2
+                blocks[lo:hi + 1] = [merged[:half], merged[half:]]
+                maxes[lo:hi + 1] = [merged[half - 1], merged[-1]]
+            else:
+                blocks[lo:hi + 1] = [merged]
+                maxes[lo:hi + 1] = [merged[-1]]
+            self._lengths = None
+        elif not block:
+            del blocks[i]
+            del maxes[i]
+            self._lengths = None
+        else:
+            maxes[i] = block[-1]
+            if self._lengths is not None:
+                self._lengths.add(i, -1)
+
+    def bisect_left(self, value: Any) -> int:
+        """Return the number of elements less than *value*."""
+        i = bisect_left(self._maxes, value)
+        if i == len(self._maxes):
+            return self._len
+        return self._offset(i) + bisect_left(self._blocks[i], value)
+
+    def bisect_right(self, value: Any) -> int:
+        """Return the number of elements less than or equal to *value*."""
+        i = bisect_right(self._maxes, value)
+        if i == len(self._maxes):
+            return self._len
+        return self._offset(i) + bisect_right(self._blocks[i], value)
+
+    def at(self, rank: int) -> Any:
+        """Return the element at *rank*, which must be in range."""
+        i = self._tree().find(rank)
+        return self._blocks[i][rank - self._offset(i)]
+
+    def irange(self, lo: Any, hi: Any, inclusive: tuple[bool, bool]) \
+            -> Iterator[Any]:
+        """Return an iterator over the elements between *lo* and *hi*."""
+        blocks, maxes = self._blocks, self._maxes
+        if lo is None:
+            i = j = 0
+        else:
+            find = bisect_left if inclusive[0] else bisect_right
+            i = find(maxes, lo)
+            j = find(blocks[i], lo) if i < len(maxes) else 0
+
+        # islice() would iterate over the blocks before the start.
+        elements = chain(islice(blocks[i], j, None) if i < len(blocks) else (),
+                         chain.from_iterable(blocks[b] for b in
+                                             range(i + 1, len(blocks))))
+        if hi is None:
+            return elements
+        if inclusive[1]:
+            return takewhile(lambda e: e <= hi, elements)
+        return takewhile(lambda e: e < hi, elements)
+
+
+class SortedIndexedOrderedSet(OrderedSet[T]):
+    """An :class:`~orderedsets.OrderedSet` with a sorted index of its elements.
+
+    Iteration follows the insertion order, like for
+    :class:`~orderedsets.OrderedSet`. In addition, the elements are kept in a
+    sorted list of blocks, which answers range and rank queries in O(log n)
+    (plus O(k) for *k* returned elements) without sorting the set. Elements
+    must be mutually comparable. Adding and removing an element takes
+    O(log n) plus moving up to a block of a few hundred references in memory,
+    which is fast in practice. Creating the set, :meth:`update` with many
+    elements and other bulk operations sort all elements at once instead.
+
+    .. doctest::
+
+        >>> sset = SortedIndexedOrderedSet([5, 1, 4, 2])
+        >>> sset
+        SortedIndexedOrderedSet({5, 1, 4, 2})
+        >>> list(sset.irange(2, 4))
+        [2, 4]
+        >>> sset.floor(3), sset.ceiling(3), sset.kth_smallest(0)
+        (2, 4, 1)
+
+    .. automethod:: irange
+    .. automethod:: bisect_left
+    .. automethod:: bisect_right
+    .. automethod:: floor
+    .. automethod:: ceiling
+    .. automethod:: kth_smallest
+    """
+
+    def __init__(self, items: Iterable[T] | type[_NotProvided] = _NotProvided)\
+            -> None:
+        """Create a new :class:`SortedIndexedOrderedSet`, optionally \
+            initialized with *items*."""
+        super().__init__(items)
+        self._sorted = _SortedList(self._dict)
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state of this set for pickling."""
+        return {"_dict": self._dict}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the state of this set from *state*."""
+        self._dict = state["_dict"]
+        self._sorted = _SortedList(self._dict)
+
+    def _bulk_threshold(self) -> int:
+        # Changes of more than this many elements re-sort all elements.
+        return len(self._dict) // 8 + _SortedList.load
+
+    # {{{ queries
+
+    def irange(self, minimum: T | None = None, maximum: T | None = None,
+               inclusive: tuple[bool, bool] = (True, True)) -> Iterator[T]:
+        """Return an iterator over the elements between *minimum* and \
+            *maximum* in sorted order.
+
+        *None* means no bound. *inclusive* determines whether the bounds
+        themselves are included.
+        """
+        return self._sorted.irange(minimum, maximum, inclusive)
+
+    def bisect_left(self, value: T) -> int:
+        """Return the number of elements less than *value*."""
+        return self._sorted.bisect_left(value)
+
+    def bisect_right(self, value: T) -> int:
+        """Return the number of elements less than or equal to *value*."""
+        return self._sorted.bisect_right(value)
+
+    bisect = bisect_right
+
+    def floor(self, value: T) -> T:
+        """Return the largest element less than or equal to *value*.
+
+        Raises :exc:`KeyError` if there is no such element.
+        """
+        rank = self._sorted.bisect_right(value)
+        if rank == 0:
+            raise KeyError(value)
+        return self._sorted.at(rank - 1)  # type: ignore[no-any-return]
+
+    def ceiling(self, value: T) -> T:
+        """Return the smallest element greater than or equal to *value*.
+
+        Raises :exc:`KeyError` if there is no such element.
+        """
+        rank = self._sorted.bisect_left(value)
+        if rank == len(self._sorted):
+            raise KeyError(value)
+        return self._sorted.at(rank)  # type: ignore[no-any-return]
+
+    def kth_smallest(self, k: int) -> T:
+        """Return the element with *k* smaller elements.
+
+        Negative *k* count from the largest element, like indices. Raises
+        :exc:`IndexError` if *k* is out of range.
+        """
+        n = len(self._sorted)
+        if k < 0:
+            k += n
+        if not 0 <= k < n:
+            raise IndexError("Index out of range.")
+        return self._sorted.at(k)  # type: ignore[no-any-return]
+
+    # }}}
+
+    # {{{ mutations
+
+    def add(self, element: T) -> None:
+        """Add *element* to this set."""
+        if element not in self._dict:
+            # Add it to the sorted list first, which fails for incomparable
+            # elements.
+            self._sorted.add(element)
+            self._dict[element] = None
+
+    def discard(self, element: T) -> None:
+        """Remove *element* from this set if it is present."""
+        if element in self._dict:
+            del self._dict[element]
+            self._sorted.remove(element)
+
+    def remove(self, element: T) -> None:
+        """Remove *element* from this set, raising :exc:`KeyError` if not present."""
+        del self._dict[element]
+        self._sorted.remove(element)
+
+    def pop(self) -> T:
+        """Remove and return the most recently added element from this set."""
+        element = self._dict.popitem()[0]
+        self._sorted.remove(element)
+        return element
+
+    def clear(self) -> None:
+        """Remove all elements from this set."""
+        self._dict.clear()
+        self._sorted = _SortedList()
+
+    def update(self, *others: Iterable[T]) -> None:
+        """Update this set to be the union of itself and *others*."""
+        new = [e for e in dict.fromkeys(chain.from_iterable(others))
+               if e not in self._dict]
+        if len(new) > self._bulk_threshold():
+            # Sorting the concatenation of the sorted elements and the new
+            # ones merges them in O(n + k log k).
+            self._sorted = _SortedList(chain(self._sorted, new))
+            self._dict.update(dict.fromkeys(new))
+        else:
+            # Like add(), so that both stay consistent if an element cannot
+            # be compared.
+            for e in new:
+                self._sorted.add(e)
+                self._dict[e] = None
+
+    def _remove_all(self, elements: list[T]) -> None:
+        # Remove *elements*, which must be present and distinct.
+        for e in elements:
+            del self._dict[e]
+        if len(elements) > self._bulk_threshold():
+            self._sorted = _SortedList(self._dict)
+        else:
+            for e in elements:
+                self._sorted.remove(e)
+
+    def difference_update(self, *others: Iterable[T]) -> None:
+        """Update this set to remove all items that are in *others*."""
+        self._remove_all([e for e in dict.fromkeys(chain.from_iterable(others))
+                          if e in self._dict])
+
+    def intersection_update(self, *others: Iterable[T]) -> None:
+        """Update this set to be the intersection of itself and *others*."""
+        keep = [other if isinstance(other, Set) else set(other)
+                for other in others]
+        self._remove_all([e for e in self._dict
+                          if not all(e in k for k in keep)])
+
+    def symmetric_difference_update(self, s: Iterable[T]) -> None:
+        """Update this set to be the symmetric difference of itself and *s*."""
+        other = list(dict.fromkeys(s))
+        new = [e for e in other if e not in self._dict]
+        self._remove_all([e for e in other if e in self._dict])
+        self.update(new)
+
+    def __iand__(self, s: Set[T]) -> SortedIndexedOrderedSet[T]:
+        """Update this set to be the intersection of itself and *s*."""
+        self.intersection_update(s)
+        return self
+
+    def __ior__(self, s: Set[Any]) -> SortedIndexedOrderedSet[T]:
+        """Update this set to be the union of itself and *s*."""
+        self.update(s)
+        return self
+
+    def __isub__(self, s: Set[T]) -> SortedIndexedOrderedSet[T]:
+        """Update this set to be the difference of itself and *s*."""
+        self.difference_update(s)
+        return self
+
+    def __ixor__(self, s: Set[Any]) -> SortedIndexedOrderedSet[T]:
+        """Update this set to be the symmetric difference of itself and *s*."""
+        self.symmetric_difference_update(s)
+        return self
+
+    # }}}
@@ -0,0 +1,377 @@
+"""An ordered set that spills its oldest elements to disk."""
+
+from __future__ import annotations
+
+__copyright__ = """
+Copyright (C) 2026 University of Illinois Board of Trustees
+"""
+
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import os
+import sqlite3
+import sys
+from collections.abc import Generator, Iterable, Iterator
+from contextlib import contextmanager
+from itertools import islice
+from tempfile import mkstemp
+from typing import Any
+from weakref import finalize
+
+from orderedsets import T, _NotProvided
+from orderedsets._bloom import BloomFilter
+from orderedsets._encoding import decode, encode, encode_lookup, stable_hash
+
+if sys.version_info >= (3, 9):  # pragma: no cover
+    from collections.abc import MutableSet, Set  # noqa: PYI025
+else:  # pragma: no cover
+    from typing import AbstractSet as Set
+    from typing import MutableSet
+
+# Number of rows read from the database at a time during iteration.
+_FETCH_SIZE = 1024
+
+
+def _close(db: sqlite3.Connection, path: str | None) -> None:
+    # Close the database, and delete it if it is a temporary file.
+    db.close()
+    if path is not None:
+        os.unlink(path)
+
+
+class SpillingOrderedSet(MutableSet[T]):
+    """A mutable ordered set that keeps at most *max_in_memory* elements in \
+        memory and stores the others in an :mod:`sqlite3` database.
+
+    Elements must be of type :class:`int`, :class:`str` or :class:`bytes`.
+    New elements are added to an in-memory dict. When it holds more than
+    *max_in_memory* elements, the oldest quarter of them is moved to the
+    database file at *path*, which must not contain a set yet, or to a
+    temporary file that is deleted when the set is closed. Since spilled
+    elements are always older than the ones in memory, iteration reads the
+    database in insertion order and then continues with the dict.
+
+    Membership tests (including those of :meth:`add`) consult a
+    :class:`Bloom filter <orderedsets._bloom.BloomFilter>` of the spilled
+    elements with false positive rate *error_rate* before querying the
+    database, so that most elements that are not in the set do not access the
+    disk. The filter is rebuilt with twice the capacity when it is full.
+
+    Operations that produce new sets return :class:`SpillingOrderedSet`
+    instances with the same *max_in_memory* and *error_rate* in temporary
+    files. The set should be closed with :meth:`close`, or used as a context
+    manager.
+
+    .. doctest::
+
+        >>> with SpillingOrderedSet(range(10), max_in_memory=4) as sset:
+        ...     print(list(sset), 2 in sset, sset.spilled)
+        [0, 1, 2, 3, 4, 5, 6, 7, 8, 9] True 6
+
+    .. automethod:: close
+    .. autoattribute:: spilled
+    """
+
+    def __init__(self, items: Iterable[T] | type[_NotProvided] = _NotProvided,
+                 *, max_in_memory: int = 1_000_000, path: str | None = None,
+                 error_rate: float = 0.01) -> None:
+        """Create a new :class:`SpillingOrderedSet`, optionally initialized \
+            with *items*."""
+        if max_in_memory < 1:
+            raise ValueError(f"invalid memory budget: {max_in_memory}")
+        self._max_in_memory = max_in_memory
+        self._error_rate = error_rate
+        self._bloom = BloomFilter(max_in_memory, error_rate)
+        self._hot: dict[T, None] = {}
+        self._spilled = 0
+
+        temp_path = None
+        if path is None:
+            fd, temp_path = mkstemp(suffix=".sqlite3")
+            path = temp_path
+            os.close(fd)
+        self._db = sqlite3.connect(path, isolation_level=None)
+        self._finalizer = finalize(self, _close, self._db, temp_path)
+        # The database is scratch storage, which need not survive crashes.
+        self._db.execute("PRAGMA journal_mode = OFF")
+        self._db.execute("PRAGMA synchronous = OFF")
+        self._db.execute("CREATE TABLE elements "
+                         "(seq INTEGER PRIMARY KEY, data BLOB NOT NULL UNIQUE)")
+
+        if items is not _NotProvided:
+            # type-ignore-reason:
+            # mypy thinks 'items' can still be Type[_NotProvided] here.
+            self.update(items)  # type: ignore[arg-type]
+
+    def _new(self, items: Iterable[T]) -> SpillingOrderedSet[T]:
+        return self.__class__(items, max_in_memory=self._max_in_memory,
+                              error_rate=self._error_rate)
+
+    def close(self) -> None:
+        """Close the database, and delete it if it is a temporary file."""
+        self._finalizer()
+
+    def __enter__(self) -> SpillingOrderedSet[T]:
+        """Return this set."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close this set."""
+        self.close()
+
+    @property
+    def spilled(self) -> int:
+        """The number of elements stored in the database."""
+        return self._spilled
+
+    # {{{ spilled elements
+
+    def _cold_contains(self, data: bytes) -> bool:
+        # Whether the encoded element *data* is in the database.
+        if not self._spilled or stable_hash(data) not in self._bloom:
+            return False
+        return self._db.execute("SELECT 1 FROM elements WHERE data = ?",
+                                (data,)).fetchone() is not None
+
+    @contextmanager
+    def _transaction(self) -> Generator[None, None, None]:
+        # Statements outside of a transaction are committed one by one.
+        self._db.execute("BEGIN")
+        try:
+            yield
+        finally:
+            self._db.execute("COMMIT")
+
+    def _spill(self) -> None:
+        # Move the oldest quarter of the elements in memory to the database.
+        batch = list(islice(self._hot, max(self._max_in_memory // 4, 1)))
+        encoded = [encode(e) for e in batch]
+        with self._transaction():
+            self._db.executemany("INSERT INTO elements (data) VALUES (?)",
+                                 [(data,) for data in encoded])
+        for e in batch:
+            del self._hot[e]
+        self._spilled += len(batch)
+
+        bloom = self._bloom
+        for data in encoded:
+            bloom.add(stable_hash(data))
+        if bloom.full:
+            bloom = BloomFilter(2 * bloom.capacity, self._error_rate)
+            for (data,) in self._db.execute("SELECT data FROM elements"):
+                bloom.add(stable_hash(data))
+            self._bloom = bloom
+
+    # }}}
+
+    def __eq__(self, other: object) -> bool:
+        """Return whether this set is equal to *other*."""
+        return (isinstance(other, Set)
+                and len(self) == len(other)
+                and all(i in other for i in self))
+
+    def __repr__(self) -> str:
+        """Return a string representation of this set."""
+        cls_name = self.__class__.__name__
+        if len(self) == 0:
+            return f"{cls_name}()"
+        return f"{cls_name}({{" + ", ".join([repr(k) for k in self]) + "})"
+
+    def __len__(self) -> int:
+        """Return the number of elements in this set."""
+        return len(self._hot) + self._spilled
+
+    def __contains__(self, o: object) -> bool:
+        """Return whether *o* is in this set."""
+        if o in self._hot:
+            return True
+        data = encode_lookup(o)
+        return data is not None and self._cold_contains(data)
+
+    def __iter__(self) -> Iterator[T]:
+        """Return an iterator over the elements in insertion order."""
+        seq = 0
+        while True:
+            rows = self._db.execute(
+                "SELECT seq, data FROM elements WHERE seq > ? ORDER BY seq "
+                "LIMIT ?", (seq, _FETCH_SIZE)).fetchall()
+            if not rows:
+                break
+            for _, data in rows:
+                yield decode(data)
+            seq = rows[-1][0]
+        yield from self._hot
+
+    # {{{ mutations
+
+    def add(self, element: T) -> None:
+        """Add *element* to this set."""
+        if element in self._hot:
+            return
+        # Also raises TypeError for unsupported elements.
+        data = encode(element)
+        if self._cold_contains(data):
+            return
+        self._hot[element] = None
+        if len(self._hot) > self._max_in_memory:
+            self._spill()
+
+    def discard(self, element: T) -> None:
+        """Remove *element* from this set if it is present."""
+        if element in self._hot:
+            del self._hot[element]
+            return
+        data = encode_lookup(element)
+        if data is not None and self._cold_contains(data):
+            self._db.execute("DELETE FROM elements WHERE data = ?", (data,))
+            self._spilled -= 1
+
+    def remove(self, element: T) -> None:
+        """Remove *element* from this set, raising :exc:`KeyError` if not present."""
+        if element not in self:
+            raise KeyError(element)
+        self.discard(element)
+
+    def pop(self) -> T:
+        """Remove and return the most recently added element from this set."""
+        if self._hot:
+            return self._hot.popitem()[0]
+        row = self._db.execute("SELECT seq, data FROM elements "
+                               "ORDER BY seq DESC LIMIT 1").fetchone()
+        if row is None:
+            raise KeyError("pop from an empty set")
+        self._db.execute("DELETE FROM elements WHERE seq = ?", (row[0],))
+        self._spilled -= 1
+        return decode(row[1])  # type: ignore[no-any-return]
+
+    def clear(self) -> None:
+        """Remove all elements from this set."""
+        self._hot.clear()
+        self._db.execute("DELETE FROM elements")
+        self._spilled = 0
+        self._bloom = BloomFilter(self._max_in_memory, self._error_rate)
+
+    def update(self, *others: Iterable[T]) -> None:
+        """Update this set to be the union of itself and *others*."""
+        for other in others:
+            for e in other:
+                self.add(e)
+
+    def difference_update(self, *others: Iterable[T]) -> None:
+        """Update this set to remove all items that are in *others*."""
+        for other in others:
+            for e in list(other) if other is self else other:
+                self.discard(e)
+
+    def intersection_update(self, *others: Iterable[T]) -> None:
+        """Update this set to be the intersection of itself and *others*."""
+        keep = [other if isinstance(other, Set) else set(other)
+                for other in others]
+        for e in [e for e in self if not all(e in k for k in keep)]:
+            self.discard(e)
+
+    def symmetric_difference_update(self, s: Iterable[T]) -> None:
+        """Update this set to be the symmetric difference of itself and *s*."""
+        for e in dict.fromkeys(s):
+            if e in self:
+                self.discard(e)
+            else:
+                self.add(e)
+
+    def __iand__(self, s: Set[Any]) -> SpillingOrderedSet[T]:
+        """Update this set to be the intersection of itself and *s*."""
+        self.intersection_update(s)
+        return self
+
+    def __ior__(self, s: Set[Any]) -> SpillingOrderedSet[T]:
+        """Update this set to be the union of itself and *s*."""
+        self.update(s)
+        return self
+
+    def __isub__(self, s: Set[Any]) -> SpillingOrderedSet[T]:
+        """Update this set to be the difference of itself and *s*."""
+        self.difference_update(s)
+        return self
+
+    def __ixor__(self, s: Set[Any]) -> SpillingOrderedSet[T]:
+        """Update this set to be the symmetric difference of itself and *s*."""
+        self.symmetric_difference_update(s)
+        return self
+
+    # }}}
+
+    # {{{ new sets
+
+    def copy(self) -> SpillingOrderedSet[T]:
+        """Return a shallow copy of this set."""
+        return self._new(self)
+
+    def difference(self, *others: Iterable[T]) -> SpillingOrderedSet[T]:
+        """Return the difference of this set and *others*."""
+        result = self.copy()
+        result.difference_update(*others)
+        return result
+
+    def intersection(self, *others: Iterable[T]) -> SpillingOrderedSet[T]:
+        """Return the intersection of this set and *others*."""
+        keep = [other if isinstance(other, Set) else set(other)
+                for other in others]
+        return self._new(e for e in self if all(e in k for k in keep))
+
+    def symmetric_difference(self, s: Iterable[T]) -> SpillingOrderedSet[T]:
+        """Return the symmetric difference of this set and *s*."""
+        result = self.copy()
+        result.symmetric_difference_update(s)
+        return result
+
+    def union(self, *others: Iterable[T]) -> SpillingOrderedSet[T]:
+        """Return the union of this set and *others*."""
+        result = self.copy()
+        result.update(*others)
+        return result
+
+    def issubset(self, s: Iterable[T]) -> bool:
+        """Return whether this set is a subset of *s*."""
+        other = s if isinstance(s, Set) else set(s)
+        return all(i in other for i in self)
+
+    def issuperset(self, s: Iterable[T]) -> bool:
+        """Return whether this set is a superset of *s*."""
+        return all(i in self for i in s)
+
+    def __and__(self, s: Set[Any]) -> SpillingOrderedSet[T]:
+        """Return the intersection of this set and *s*."""
+        return self.intersection(s)
+
+    def __or__(self, s: Set[Any]) -> SpillingOrderedSet[T]:
+        """Return the union of this set and *s*."""
+        return self.union(s)
+
+    def __sub__(self, s: Set[Any]) -> SpillingOrderedSet[T]:
+        """Return the difference of this set and *s*."""
+        return self.difference(s)
+
+    def __xor__(self, s: Set[Any]) -> SpillingOrderedSet[T]:
+        """Return the symmetric difference of this set and *s*."""
+        return self.symmetric_difference(s)
+
+    # }}}
@@ -0,0 +1,258 @@
+"""An ordered set that records its changes."""
+
+from __future__ import annotations
+
+__copyright__ = """
+Copyright (C) 2026 University of Illinois Board of Trustees
+"""
+
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from collections.abc import Iterable, MutableSet, Set  # noqa: PYI025
+from typing import Any, Callable, Generic
+
+from orderedsets import OrderedSet, T, _is_sorted, _NotProvided, _sorted
+
+
+class Delta(Generic[T]):
+    """The net changes of a :class:`TrackedOrderedSet` between two checkpoints.
+
+    .. attribute:: removed
+
+        A tuple of the elements that were present at the earlier checkpoint and
+        were removed afterwards.
+
+    .. attribute:: added
+
+        A tuple of the elements that were added after the earlier checkpoint and
+        are still present, in insertion order.
+
+    An element that was removed and added again is in both tuples, since it
+    moved to the end of the set. Applying the delta with :meth:`apply_to`
+    removes all elements in :attr:`removed` and then adds all elements in
+    :attr:`added`.
+    """
+
+    __slots__ = ("added", "removed")
+
+    def __init__(self, added: Iterable[T] = (), removed: Iterable[T] = ()) -> None:
+        """Create a new :class:`Delta`."""
+        self.added = tuple(added)
+        self.removed = tuple(removed)
+
+    def __repr__(self) -> str:
+        """Return a string representation of this delta."""
+        return (f"{self.__class__.__name__}(added={self.added!r}, "
+                f"removed={self.removed!r})")
+
+    def __eq__(self, other: object) -> bool:
+        """Return whether this delta is equal to *other*."""
+        return (isinstance(other, Delta)
+                and self.added == other.added and self.removed == other.removed)
+
+    def __hash__(self) -> int:
+        """Return a hash of this delta."""
+        return hash((self.added, self.removed))
+
+    def __len__(self) -> int:
+        """Return the number of changes in this delta."""
+        return len(self.added) + len(self.removed)
+
+    def apply_to(self, target: MutableSet[T]) -> None:
+        """Apply the changes to *target*."""
+        for e in self.removed:
+            target.discard(e)
+        for e in self.added:
+            target.add(e)
+
+
+class TrackedOrderedSet(OrderedSet[T]):
+    """An :class:`~orderedsets.OrderedSet` that records its changes.
+
+    Every effective addition and removal is appended to a journal.
+    :meth:`checkpoint` returns a token for the current position in the journal,
+    and :meth:`changes_since` returns the net changes since a token as a
+    :class:`Delta`, in time proportional to the number of changes rather than
+    to the size of the set. The journal grows until it is trimmed with
+    :meth:`trim`.
+
+    .. doctest::
+
+        >>> tset = TrackedOrderedSet(["a", "b", "c"])
+        >>> token = tset.checkpoint()
+        >>> tset.add("d"); tset.discard("a"); tset.add("e"); tset.discard("e")
+        >>> delta = tset.changes_since(token)
+        >>> delta
+        Delta(added=('d',), removed=('a',))
+        >>> replica = OrderedSet(["a", "b", "c"])
+        >>> delta.apply_to(replica)
+        >>> replica == tset
+        True
+
+    .. automethod:: checkpoint
+    .. automethod:: changes_since
+    .. automethod:: trim
+    """
+
+    def __init__(self, items: Iterable[T] | type[_NotProvided] = _NotProvided)\
+            -> None:
+        """Create a new :class:`TrackedOrderedSet`, optionally initialized \
+            with *items*."""
+        super().__init__(items)
+        # Journal entries are (element, whether it was added) pairs.
+        self._log: list[tuple[T, bool]] = []
+        self._log_start = 0
+
+    # {{{ journal
+
+    def checkpoint(self) -> int:
+        """Return a token for the current state of this set."""
+        return self._log_start + len(self._log)
+
+    def _entries_since(self, token: int) -> list[tuple[T, bool]]:
+        if not self._log_start <= token <= self.checkpoint():
+            raise ValueError(f"invalid or trimmed token: {token}")
+        return self._log[token - self._log_start:]
+
+    def changes_since(self, token: int) -> Delta[T]:
+        """Return the net changes since the checkpoint *token*.
+
+        Raises :exc:`ValueError` if *token* was trimmed with :meth:`trim`.
+        """
+        initially_present: dict[T, None] = {}
+        # True for elements that are present now, in the order they were
+        # (last) added.
+        final: dict[T, bool] = {}
+
+        for e, added in self._entries_since(token):
+            if e not in final and not added:
+                initially_present[e] = None
+            if added:
+                final.pop(e, None)
+                final[e] = True
+            else:
+                final[e] = False
+
+        return Delta([e for e, present in final.items() if present],
+                     initially_present)
+
+    def trim(self, token: int) -> None:
+        """Discard the journal before the checkpoint *token*.
+
+        Tokens before *token* become invalid.
+        """
+        self._entries_since(token)  # check that the token is valid
+        del self._log[:token - self._log_start]
+        self._log_start = token
+
+    # }}}
+
+    # {{{ mutations
+
+    def add(self, element: T) -> None:
+        """Add *element* to this set."""
+        if element not in self._dict:
+            self._dict[element] = None
+            self._log.append((element, True))
+
+    def discard(self, element: T) -> None:
+        """Remove *element* from this set if it is present."""
+        if element in self._dict:
+            del self._dict[element]
+            self._log.append((element, False))
+
+    def remove(self, element: T) -> None:
+        """Remove *element* from this set, raising :exc:`KeyError` if not present."""
+        del self._dict[element]
+        self._log.append((element, False))
+
+    def pop(self) -> T:
+        """Remove and return the most recently added element from this set."""
+        element = self._dict.popitem()[0]
+        self._log.append((element, False))
+        return element
+
+    def clear(self) -> None:
+        """Remove all elements from this set."""
+        self._log.extend((e, False) for e in self._dict)
+        self._dict.clear()
+
+    def sort(self, *, key: Callable[[T], Any] | None = None,
+             reverse: bool = False) -> None:
+        """Sort the elements of this set in place, like :meth:`list.sort`.
+
+        Each element is recorded as removed and added again, so that applying
+        the :class:`Delta` reproduces the new order.
+        """
+        if not _is_sorted(self._dict, key, reverse):
+            for e in _sorted(self._dict, key, reverse):
+                self.discard(e)
+                self.add(e)
+
+    def update(self, *others: Iterable[T]) -> None:
+        """Update this set to be the union of itself and *others*."""
+        for other in others:
+            for e in other:
+                self.add(e)
+
+    def difference_update(self, *others: Iterable[T]) -> None:
+        """Update this set to remove all items that are in *others*."""
+        for other in others:
+            for e in list(other) if other is self else other:
+                self.discard(e)
+
+    def intersection_update(self, *others: Iterable[T]) -> None:
+        """Update this set to be the intersection of itself and *others*."""
+        keep = [other if isinstance(other, Set) else set(other)
+                for other in others]
+        for e in [e for e in self._dict if not all(e in k for k in keep)]:
+            self.discard(e)
+
+    def symmetric_difference_update(self, s: Iterable[T]) -> None:
+        """Update this set to be the symmetric difference of itself and *s*."""
+        for e in dict.fromkeys(s):
+            if e in self._dict:
+                self.discard(e)
+            else:
+                self.add(e)
+
+    def __iand__(self, s: Set[T]) -> TrackedOrderedSet[T]:
+        """Update this set to be the intersection of itself and *s*."""
+        self.intersection_update(s)
+        return self
+
+    def __ior__(self, s: Set[Any]) -> TrackedOrderedSet[T]:
+        """Update this set to be the union of itself and *s*."""
+        self.update(s)
+        return self
+
+    def __isub__(self, s: Set[T]) -> TrackedOrderedSet[T]:
+        """Update this set to be the difference of itself and *s*."""
+        self.difference_update(s)
+        return self
+
+    def __ixor__(self, s: Set[Any]) -> TrackedOrderedSet[T]:
+        """Update this set to be the symmetric difference of itself and *s*."""
+        self.symmetric_difference_update(s)
+        return self
+
+    # }}}
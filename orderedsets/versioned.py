@@ -0,0 +1,322 @@
+"""An ordered set with cheap read-only snapshots."""
+
+from __future__ import annotations
+
+__copyright__ = """
+Copyright (C) 2026 University of Illinois Board of Trustees
+"""
+
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import weakref
+from collections.abc import Iterable, Iterator, Set  # noqa: PYI025
+from heapq import merge
+from operator import itemgetter
+from typing import Any, Callable
+
+from orderedsets import (
+    FrozenOrderedSet,
+    OrderedSet,
+    T,
+    _is_sorted,
+    _NotProvided,
+    _sorted,
+)
+
+
+class _Version:
+    """The state of a :class:`VersionedOrderedSet` when a snapshot was taken.
+
+    *overlay* maps each element that was modified after this version (and before
+    the next one) to its sequence number at this version, or to *None* if it
+    was not present. Versions are chained from older to newer via *next*, so
+    that a snapshot keeps alive the overlays of all newer versions it needs.
+    """
+
+    __slots__ = ("__weakref__", "bound", "next", "overlay")
+
+    def __init__(self, bound: int) -> None:
+        self.bound = bound
+        self.overlay: dict[Any, int | None] = {}
+        self.next: _Version | None = None
+
+
+class VersionedOrderedSet(OrderedSet[T]):
+    """An :class:`~orderedsets.OrderedSet` with O(1) read-only snapshots.
+
+    :meth:`snapshot` returns a :class:`Snapshot`, a
+    :class:`~orderedsets.FrozenOrderedSet` that keeps showing the contents and
+    order of the set at the time it was taken, without copying the set. After a
+    snapshot is taken, each mutation saves the previous state of the modified
+    element (once per element), so the cost of snapshots is proportional to the
+    number of elements changed while they are alive. No state is saved while no
+    snapshot is alive.
+
+    .. doctest::
+
+        >>> vset = VersionedOrderedSet(["a", "b", "c"])
+        >>> snap = vset.snapshot()
+        >>> vset.discard("a"); vset.add("d")
+        >>> snap
+        Snapshot({'a', 'b', 'c'})
+        >>> vset
+        VersionedOrderedSet({'b', 'c', 'd'})
+
+    .. automethod:: snapshot
+    """
+
+    def __init__(self, items: Iterable[T] | type[_NotProvided] = _NotProvided)\
+            -> None:
+        """Create a new :class:`VersionedOrderedSet`, optionally initialized \
+            with *items*."""
+        super().__init__(items)
+        # Values are insertion sequence numbers, which increase in the order
+        # of the dict.
+        self._dict: dict[T, Any] = dict(zip(self._dict, range(len(self._dict))))
+        self._seq = len(self._dict)
+        self._version: weakref.ref[_Version] | None = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state of this set for pickling."""
+        return {"_dict": self._dict, "_seq": self._seq}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the state of this set from *state*."""
+        self.__dict__.update(state)
+        self._version = None
+
+    def snapshot(self) -> Snapshot[T]:
+        """Return a read-only snapshot of the current state of this set."""
+        version = self._version() if self._version is not None else None
+        if version is None or version.overlay:
+            new_version = _Version(self._seq)
+            if version is not None:
+                version.next = new_version
+            version = new_version
+            self._version = weakref.ref(version)
+        return Snapshot(self, version, len(self._dict))
+
+    def _save(self, element: T, seq: int | None) -> None:
+        # Save the state (*seq*) of *element* before it is modified.
+        version = self._version() if self._version is not None else None
+        if version is None:
+            self._version = None
+        elif element not in version.overlay:
+            version.overlay[element] = seq
+
+    # {{{ mutations
+
+    def add(self, element: T) -> None:
+        """Add *element* to this set."""
+        if element not in self._dict:
+            if self._version is not None:
+                self._save(element, None)
+            self._dict[element] = self._seq
+            self._seq += 1
+
+    def discard(self, element: T) -> None:
+        """Remove *element* from this set if it is present."""
+        if element in self._dict:
+            if self._version is not None:
+                self._save(element, self._dict[element])
+            del self._dict[element]
+
+    def remove(self, element: T) -> None:
+        """Remove *element* from this set, raising :exc:`KeyError` if not present."""
+        if element not in self._dict:
+            raise KeyError(element)
+        self.discard(element)
+
+    def pop(self) -> T:
+        """Remove and return the most recently added element from this set."""
+        element, seq = self._dict.popitem()
+        if self._version is not None:
+            self._save(element, seq)
+        return element
+
+    def clear(self) -> None:
+        """Remove all elements from this set."""
+        if self._version is not None:
+            for e, seq in self._dict.items():
+                self._save(e, seq)
+        self._dict.clear()
+
+    def sort(self, *, key: Callable[[T], Any] | None = None,
+             reverse: bool = False) -> None:
+        """Sort the elements of this set in place, like :meth:`list.sort`.
+
+        Each element is removed and added again, so that snapshots keep the
+        previous order.
+        """
+        if not _is_sorted(self._dict, key, reverse):
+            for e in _sorted(self._dict, key, reverse):
+                self.discard(e)
+                self.add(e)
+
+    def update(self, *others: Iterable[T]) -> None:
+        """Update this set to be the union of itself and *others*."""
+        for other in others:
+            for e in other:
+                self.add(e)
+
+    def difference_update(self, *others: Iterable[T]) -> None:
+        """Update this set to remove all items that are in *others*."""
+        for other in others:
+            for e in list(other) if other is self else other:
+                self.discard(e)
+
+    def intersection_update(self, *others: Iterable[T]) -> None:
+        """Update this set to be the intersection of itself and *others*."""
+        keep = [other if isinstance(other, Set) else set(other)
+                for other in others]
+        for e in [e for e in self._dict if not all(e in k for k in keep)]:
+            self.discard(e)
+
+    def symmetric_difference_update(self, s: Iterable[T]) -> None:
+        """Update this set to be the symmetric difference of itself and *s*."""
+        for e in dict.fromkeys(s):
+            if e in self._dict:
+                self.discard(e)
+            else:
+                self.add(e)
+
+    def __iand__(self, s: Set[T]) -> VersionedOrderedSet[T]:
+        """Update this set to be the intersection of itself and *s*."""
+        self.intersection_update(s)
+        return self
+
+    def __ior__(self, s: Set[Any]) -> VersionedOrderedSet[T]:
+        """Update this set to be the union of itself and *s*."""
+        self.update(s)
+        return self
+
+    def __isub__(self, s: Set[T]) -> VersionedOrderedSet[T]:
+        """Update this set to be the difference of itself and *s*."""
+        self.difference_update(s)
+        return self
+
+    def __ixor__(self, s: Set[Any]) -> VersionedOrderedSet[T]:
+        """Update this set to be the symmetric difference of itself and *s*."""
+        self.symmetric_difference_update(s)
+        return self
+
+    # }}}
+
+
+class Snapshot(FrozenOrderedSet[T]):
+    """A read-only snapshot of a :class:`VersionedOrderedSet`.
+
+    Taking a snapshot and querying its length is O(1). Membership tests are
+    O(1) for elements that were not modified since the snapshot was taken.
+    Iteration and the operations inherited from
+    :class:`~orderedsets.FrozenOrderedSet` reconstruct the elements in O(n).
+    Pickling a snapshot produces a :class:`~orderedsets.FrozenOrderedSet`.
+    """
+
+    def __init__(self, live: VersionedOrderedSet[T], version: _Version,
+                 length: int) -> None:
+        """Create a snapshot of *live* at *version* (use \
+            :meth:`VersionedOrderedSet.snapshot` instead)."""
+        self._live = live
+        self._snapshot_version = version
+        self._len = length
+        self._my_hash = None
+
+    # type-ignore-reason: FrozenOrderedSet._dict is an attribute
+    @property
+    def _dict(self) -> dict[T, None]:  # type: ignore[override]
+        return dict.fromkeys(self)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Return pickling information for this snapshot."""
+        return (FrozenOrderedSet, (list(self),))
+
+    def __len__(self) -> int:
+        """Return the number of elements in this set."""
+        return self._len
+
+    # {{{ operations that return new sets
+
+    def _frozen(self) -> FrozenOrderedSet[T]:
+        return FrozenOrderedSet(self._dict)
+
+    def copy(self) -> FrozenOrderedSet[T]:
+        """Return a :class:`~orderedsets.FrozenOrderedSet` with the elements \
+            of this snapshot."""
+        return self._frozen()
+
+    def difference(self, *others: Iterable[T]) -> FrozenOrderedSet[T]:
+        """Return all elements that are in this set but not in *others*."""
+        return self._frozen().difference(*others)
+
+    def intersection(self, *others: Iterable[T]) -> FrozenOrderedSet[T]:
+        """Return a new set with elements common to this set and all *others*."""
+        return self._frozen().intersection(*others)
+
+    def symmetric_difference(self, s: Iterable[T]) -> FrozenOrderedSet[T]:
+        """Return the symmetric difference of this set and *s*."""
+        return self._frozen().symmetric_difference(s)
+
+    def union(self, *others: Iterable[T]) -> FrozenOrderedSet[T]:
+        """Return a new set with elements from this set and *others*."""
+        return self._frozen().union(*others)
+
+    def sorted(self, *, key: Callable[[T], Any] | None = None,
+               reverse: bool = False) -> FrozenOrderedSet[T]:
+        """Return a set with the elements of this set in sorted order."""
+        return self._frozen().sorted(key=key, reverse=reverse)
+
+    # }}}
+
+    def __contains__(self, o: object) -> bool:
+        """Return whether *o* is in this set."""
+        # type-ignore-reason: any hashable object can be looked up
+        seq = self._live._dict.get(o)  # type: ignore[arg-type]
+        if seq is not None and seq < self._snapshot_version.bound:
+            return True
+        version: _Version | None = self._snapshot_version
+        while version is not None:
+            if o in version.overlay:
+                return version.overlay[o] is not None
+            version = version.next
+        return False
+
+    def __iter__(self) -> Iterator[T]:
+        """Return an iterator over the elements of this set."""
+        bound = self._snapshot_version.bound
+
+        restored: dict[T, int | None] = {}
+        version: _Version | None = self._snapshot_version
+        while version is not None:
+            for e, seq in version.overlay.items():
+                restored.setdefault(e, seq)
+            version = version.next
+
+        current = []
+        for e, seq in self._live._dict.items():
+            if seq >= bound:
+                break
+            current.append((seq, e))
+
+        removed = sorted(((seq, e) for e, seq in restored.items() if seq is not None),
+                         key=itemgetter(0))
+        return iter([e for _, e in merge(current, removed, key=itemgetter(0))])
@@ -0,0 +1,293 @@
+"""An ordered set that holds weak references to its elements."""
+
+from __future__ import annotations
+
+__copyright__ = """
+Copyright (C) 2026 University of Illinois Board of Trustees
+"""
+
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import sys
+from collections.abc import Iterable, Iterator
+from typing import Any, Callable
+from weakref import ref
+
+from orderedsets import T, _is_sorted, _NotProvided, _sorted
+
+if sys.version_info >= (3, 9):  # pragma: no cover
+    from collections.abc import MutableSet, Set  # noqa: PYI025
+else:  # pragma: no cover
+    from typing import AbstractSet as Set
+    from typing import MutableSet
+
+
+class WeakOrderedSet(MutableSet[T]):
+    """A mutable ordered set that holds weak references to its elements.
+
+    An element is removed from the set when it is garbage collected, like for
+    :class:`weakref.WeakSet`, and the remaining elements keep their insertion
+    order. Elements must support weak references. The API is the same as
+    that of :class:`~orderedsets.OrderedSet`; operations that produce new sets
+    return :class:`WeakOrderedSet` instances.
+
+    The callback of the weak reference of a collected element only records
+    the reference. Dead references are removed from the dict in a batch by the
+    next operation on the set, except while the set is being iterated over:
+    iterators skip dead elements, so that elements can be collected during
+    iteration without changing the order or invalidating the iterator.
+
+    .. doctest::
+
+        >>> class Entry: pass
+        >>> a, b, c = Entry(), Entry(), Entry()
+        >>> wset = WeakOrderedSet([a, b, c])
+        >>> del b
+        >>> list(wset) == [a, c]
+        True
+    """
+
+    def __init__(self, items: Iterable[T] | type[_NotProvided] = _NotProvided)\
+            -> None:
+        """Create a new :class:`WeakOrderedSet`, optionally initialized with \
+            *items*."""
+        self._dict: dict[ref[T], None] = {}
+        # Dead references, removed from the dict by _commit_removals().
+        self._pending: list[ref[T]] = []
+        self._iterating = 0
+
+        # The callback must not keep the set alive.
+        selfref = ref(self)
+
+        def _remove(r: ref[T]) -> None:
+            s = selfref()
+            if s is not None:
+                s._pending.append(r)
+
+        self._remove: Callable[[ref[T]], None] = _remove
+
+        if items is not _NotProvided:
+            # type-ignore-reason:
+            # mypy thinks 'items' can still be Type[_NotProvided] here.
+            self.update(items)  # type: ignore[arg-type]
+
+    def _commit_removals(self) -> None:
+        if self._pending and not self._iterating:
+            pop = self._dict.pop
+            for r in self._pending:
+                pop(r, None)
+            self._pending.clear()
+
+    def _new(self, items: Iterable[T]) -> WeakOrderedSet[T]:
+        return self.__class__(items)
+
+    def __eq__(self, other: object) -> bool:
+        """Return whether this set is equal to *other*."""
+        return (isinstance(other, Set)
+                and len(self) == len(other)
+                and all(i in other for i in self))
+
+    def __repr__(self) -> str:
+        """Return a string representation of this set."""
+        cls_name = self.__class__.__name__
+        elements = list(self)
+        if not elements:
+            return f"{cls_name}()"
+        return f"{cls_name}({{" + ", ".join([repr(k) for k in elements]) + "})"
+
+    def __len__(self) -> int:
+        """Return the number of elements in this set."""
+        return len(self._dict) - len(self._pending)
+
+    def __contains__(self, o: object) -> bool:
+        """Return whether *o* is in this set."""
+        try:
+            r = ref(o)
+        except TypeError:
+            return False
+        return r in self._dict
+
+    def __iter__(self) -> Iterator[T]:
+        """Return an iterator over the live elements in insertion order."""
+        self._iterating += 1
+        try:
+            for r in self._dict:
+                element = r()
+                if element is not None:
+                    yield element
+        finally:
+            self._iterating -= 1
+            self._commit_removals()
+
+    # {{{ mutations
+
+    def add(self, element: T) -> None:
+        """Add *element* to this set."""
+        self._commit_removals()
+        self._dict[ref(element, self._remove)] = None
+
+    def discard(self, element: T) -> None:
+        """Remove *element* from this set if it is present."""
+        self._commit_removals()
+        self._dict.pop(ref(element), None)
+
+    def remove(self, element: T) -> None:
+        """Remove *element* from this set, raising :exc:`KeyError` if not present."""
+        self._commit_removals()
+        try:
+            del self._dict[ref(element)]
+        except KeyError:
+            raise KeyError(element) from None
+
+    def pop(self) -> T:
+        """Remove and return the most recently added element from this set."""
+        self._commit_removals()
+        while self._dict:
+            element = self._dict.popitem()[0]()
+            if element is not None:
+                return element
+        raise KeyError("pop from an empty set")
+
+    def clear(self) -> None:
+        """Remove all elements from this set."""
+        self._dict.clear()
+        self._pending.clear()
+
+    def sort(self, *, key: Callable[[T], Any] | None = None,
+             reverse: bool = False) -> None:
+        """Sort the elements of this set in place.
+
+        See :meth:`orderedsets.OrderedSet.sort`.
+        """
+        # Keep the elements alive while they are reinserted.
+        elements = list(self)
+        if not _is_sorted(elements, key, reverse):
+            self._dict = dict.fromkeys(
+                ref(e, self._remove) for e in _sorted(elements, key, reverse))
+            # The dead references are not in the new dict.
+            self._pending.clear()
+
+    def update(self, *others: Iterable[T]) -> None:
+        """Update this set to be the union of itself and *others*."""
+        for other in others:
+            for e in list(other) if other is self else other:
+                self.add(e)
+
+    def difference_update(self, *others: Iterable[T]) -> None:
+        """Update this set to remove all items that are in *others*."""
+        for other in others:
+            for e in list(other) if other is self else other:
+                self.discard(e)
+
+    def intersection_update(self, *others: Iterable[T]) -> None:
+        """Update this set to be the intersection of itself and *others*."""
+        keep = [other if isinstance(other, Set) else set(other)
+                for other in others]
+        for e in [e for e in self if not all(e in k for k in keep)]:
+            self.discard(e)
+
+    def symmetric_difference_update(self, s: Iterable[T]) -> None:
+        """Update this set to be the symmetric difference of itself and *s*."""
+        for e in list(dict.fromkeys(s)):
+            if e in self:
+                self.discard(e)
+            else:
+                self.add(e)
+
+    def __iand__(self, s: Set[Any]) -> WeakOrderedSet[T]:
+        """Update this set to be the intersection of itself and *s*."""
+        self.intersection_update(s)
+        return self
+
+    def __ior__(self, s: Set[Any]) -> WeakOrderedSet[T]:
+        """Update this set to be the union of itself and *s*."""
+        self.update(s)
+        return self
+
+    def __isub__(self, s: Set[Any]) -> WeakOrderedSet[T]:
+        """Update this set to be the difference of itself and *s*."""
+        self.difference_update(s)
+        return self
+
+    def __ixor__(self, s: Set[Any]) -> WeakOrderedSet[T]:
+        """Update this set to be the symmetric difference of itself and *s*."""
+        self.symmetric_difference_update(s)
+        return self
+
+    # }}}
+
+    # {{{ new sets
+
+    def copy(self) -> WeakOrderedSet[T]:
+        """Return a shallow copy of this set."""
+        return self._new(self)
+
+    def difference(self, *others: Iterable[T]) -> WeakOrderedSet[T]:
+        """Return the difference of this set and *others*."""
+        result = self.copy()
+        result.difference_update(*others)
+        return result
+
+    def intersection(self, *others: Iterable[T]) -> WeakOrderedSet[T]:
+        """Return the intersection of this set and *others*."""
+        keep = [other if isinstance(other, Set) else set(other)
+                for other in others]
+        return self._new([e for e in self if all(e in k for k in keep)])
+
+    def symmetric_difference(self, s: Iterable[T]) -> WeakOrderedSet[T]:
+        """Return the symmetric difference of this set and *s*."""
+        result = self.copy()
+        result.symmetric_difference_update(s)
+        return result
+
+    def union(self, *others: Iterable[T]) -> WeakOrderedSet[T]:
+        """Return the union of this set and *others*."""
+        result = self.copy()
+        result.update(*others)
+        return result
+
+    def issubset(self, s: Iterable[T]) -> bool:
+        """Return whether this set is a subset of *s*."""
+        other = s if isinstance(s, Set) else set(s)
+        return all(i in other for i in self)
+
+    def issuperset(self, s: Iterable[T]) -> bool:
+        """Return whether this set is a superset of *s*."""
+        return all(i in self for i in s)
+
+    def __and__(self, s: Set[Any]) -> WeakOrderedSet[T]:
+        """Return the intersection of this set and *s*."""
+        return self.intersection(s)
+
+    def __or__(self, s: Set[Any]) -> WeakOrderedSet[T]:
+        """Return the union of this set and *s*."""
+        return self.union(s)
+
+    def __sub__(self, s: Set[Any]) -> WeakOrderedSet[T]:
+        """Return the difference of this set and *s*."""
+        return self.difference(s)
+
+    def __xor__(self, s: Set[Any]) -> WeakOrderedSet[T]:
+        """Return the symmetric difference of this set and *s*."""
+        return self.symmetric_difference(s)
+
+    # }}}
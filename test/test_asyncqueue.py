@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+__copyright__ = """
+Copyright (C) 2026 University of Illinois Board of Trustees
+"""
+
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+from typing import Any, Coroutine
+
+import pytest
+
+from orderedsets.asyncqueue import AsyncOrderedSetQueue
+
+
+def run(coro: Coroutine[Any, Any, None]) -> None:
+    asyncio.run(coro)
+
+
+def test_queue_dedup() -> None:
+    async def main() -> None:
+        queue: AsyncOrderedSetQueue[str] = AsyncOrderedSetQueue()
+        assert queue.empty()
+        assert not queue.full()
+        assert queue.maxsize == 0
+
+        assert await queue.put("a")
+        assert await queue.put("b")
+        assert not await queue.put("a")
+        assert queue.put_nowait("c")
+        assert not queue.put_nowait("b")
+
+        assert len(queue) == queue.qsize() == 3
+        assert "a" in queue
+        assert "x" not in queue
+        assert repr(queue) == ("<AsyncOrderedSetQueue maxsize=0 "
+                               "pending=['a', 'b', 'c'] unfinished=3>")
+
+        assert await queue.get() == "a"
+        # Without dedup_in_flight, retrieved items can be queued again.
+        assert await queue.put("a")
+        assert await queue.get_many(2) == ["b", "c"]
+        assert queue.get_nowait() == "a"
+
+        with pytest.raises(asyncio.QueueEmpty):
+            queue.get_nowait()
+        with pytest.raises(ValueError):
+            await queue.get_many(0)
+
+        for _ in range(4):
+            queue.task_done()
+        with pytest.raises(ValueError):
+            queue.task_done()
+
+    run(main())
+
+
+def test_queue_dedup_in_flight() -> None:
+    async def main() -> None:
+        queue: AsyncOrderedSetQueue[int] = AsyncOrderedSetQueue(dedup_in_flight=True)
+        await queue.put(1)
+        await queue.put(2)
+        assert await queue.get() == 1
+        assert 1 in queue
+        assert not await queue.put(1)
+
+        with pytest.raises(ValueError):
+            queue.task_done(2)
+        queue.task_done(1)
+        assert 1 not in queue
+        assert await queue.put(1)
+        assert await queue.get_many(5) == [2, 1]
+
+    run(main())
+
+
+def test_queue_maxsize() -> None:
+    async def main() -> None:
+        queue: AsyncOrderedSetQueue[int] = AsyncOrderedSetQueue(maxsize=2)
+        await queue.put(1)
+        await queue.put(2)
+        assert queue.full()
+
+        with pytest.raises(asyncio.QueueFull):
+            queue.put_nowait(3)
+        # Duplicates do not block on a full queue.
+        assert not queue.put_nowait(1)
+        assert not await queue.put(2)
+
+        putters = [asyncio.ensure_future(queue.put(i)) for i in (3, 4, 3)]
+        await asyncio.sleep(0)
+        assert not any(p.done() for p in putters)
+
+        assert await queue.get_many(2) == [1, 2]
+        assert await asyncio.gather(*putters) == [True, True, False]
+        assert await queue.get_many(5) == [3, 4]
+
+    run(main())
+
+
+def test_queue_duplicate_after_wait() -> None:
+    async def main() -> None:
+        queue: AsyncOrderedSetQueue[int] = AsyncOrderedSetQueue(maxsize=1)
+        await queue.put(0)
+
+        putters = [asyncio.ensure_future(queue.put(i)) for i in (1, 2)]
+        await asyncio.sleep(0)
+
+        queue.get_nowait()
+        # Takes the slot the first putter was woken up for.
+        queue.put_nowait(1)
+        await asyncio.sleep(0)
+        assert putters[0].done()
+        assert not putters[0].result()
+
+        queue.get_nowait()
+        assert await putters[1]
+        assert queue.get_nowait() == 2
+
+    run(main())
+
+
+def test_queue_blocking_get_and_join() -> None:
+    async def main() -> None:
+        queue: AsyncOrderedSetQueue[int] = AsyncOrderedSetQueue()
+        results: list[int] = []
+
+        async def worker() -> None:
+            while True:
+                for item in await queue.get_many(3):
+                    results.append(item)
+                    queue.task_done()
+
+        async def single_worker() -> None:
+            while True:
+                results.append(await queue.get())
+                queue.task_done()
+
+        await queue.join()  # nothing queued
+
+        workers = [asyncio.ensure_future(worker()),
+                   asyncio.ensure_future(single_worker())]
+        await asyncio.sleep(0)
+
+        for i in [*range(10), *range(5)]:
+            await queue.put(i)
+        await queue.join()
+        assert sorted(results) == list(range(10))
+
+        for w in workers:
+            w.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    run(main())
+
+
+def test_queue_cancel() -> None:
+    async def main() -> None:
+        queue: AsyncOrderedSetQueue[int] = AsyncOrderedSetQueue()
+
+        # Cancel a waiting getter.
+        getter = asyncio.ensure_future(queue.get())
+        await asyncio.sleep(0)
+        getter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await getter
+        assert not queue._getters
+
+        # Cancel a getter after it was woken up: the next getter gets the item.
+        getter1 = asyncio.ensure_future(queue.get())
+        getter2 = asyncio.ensure_future(queue.get())
+        await asyncio.sleep(0)
+        queue.put_nowait(1)
+        getter1.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await getter1
+        assert await getter2 == 1
+
+    run(main())
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+__copyright__ = """
+Copyright (C) 2026 University of Illinois Board of Trustees
+"""
+
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+# These tests measure how the run time of each operation grows with the size of
+# the set, in order to catch accidentally quadratic implementations, which the
+# fixed-size timings in test_speed.py cannot see.
+
+import platform
+from math import log
+from timeit import Timer
+from typing import Any
+
+import pytest
+
+from orderedsets import FrozenIndexSet, FrozenOrderedSet, IndexSet, OrderedSet
+from orderedsets.sortedindex import SortedIndexedOrderedSet
+
+SIZES = [1000, 2000, 4000, 8000, 16000]
+
+# Maximum fitted growth exponent for each complexity class. The limits leave
+# room for measurement noise and cache effects, but are far below the next
+# complexity class.
+CONSTANT = 0.5
+SQRT = 0.75
+LINEAR = 1.5
+
+# In the statements, "s" is the set under test with elements 0..n-1, "t" an
+# equal set, "o" a set with elements n/2..3n/2-1, "lst" a list with the same
+# elements as "o", "x" an element of "s", "y" an element that is not in "s",
+# and "m" the middle index.
+COMMON_OPERATIONS = [
+    ("init", "cls(items)", LINEAR),
+    ("len", "len(s)", CONSTANT),
+    ("contains", "x in s", CONSTANT),
+    ("contains_miss", "y in s", CONSTANT),
+    ("iter", "for _ in s: pass", LINEAR),
+    ("repr", "repr(s)", LINEAR),
+    ("eq", "s == t", LINEAR),
+    ("copy", "s.copy()", LINEAR),
+    ("union", "s.union(o)", LINEAR),
+    ("union_list", "s.union(lst)", LINEAR),
+    ("intersection", "s.intersection(o)", LINEAR),
+    ("intersection_list", "s.intersection(lst)", LINEAR),
+    ("difference", "s.difference(o)", LINEAR),
+    ("difference_list", "s.difference(lst)", LINEAR),
+    ("symmetric_difference", "s.symmetric_difference(o)", LINEAR),
+    ("symmetric_difference_list", "s.symmetric_difference(lst)", LINEAR),
+    ("isdisjoint_list", "s.isdisjoint(lst)", LINEAR),
+    ("issubset", "s.issubset(t)", LINEAR),
+    ("issubset_list", "s.issubset(list(t))", LINEAR),
+    ("issuperset_list", "s.issuperset(list(t))", LINEAR),
+    ("le", "s <= t", LINEAR),
+    ("ge", "s >= t", LINEAR),
+    ("and", "s & o", LINEAR),
+    ("or", "s | o", LINEAR),
+    ("sub", "s - o", LINEAR),
+    ("xor", "s ^ o", LINEAR),
+]
+
+MUTABLE_OPERATIONS = [
+    ("add_existing", "s.add(x)", CONSTANT),
+    ("add_discard", "s.add(y); s.discard(y)", CONSTANT),
+    ("remove_add", "s.remove(x); s.add(x)", CONSTANT),
+    ("pop_add", "s.add(s.pop())", CONSTANT),
+    ("update_list", "s.copy().update(lst)", LINEAR),
+    ("intersection_update_list", "s.copy().intersection_update(lst)", LINEAR),
+    ("difference_update_list", "s.copy().difference_update(lst)", LINEAR),
+    ("symmetric_difference_update_list",
+     "s.copy().symmetric_difference_update(lst)", LINEAR),
+    ("iand", "u = s.copy(); u &= o", LINEAR),
+    ("ior", "u = s.copy(); u |= o", LINEAR),
+    ("isub", "u = s.copy(); u -= o", LINEAR),
+    ("ixor", "u = s.copy(); u ^= o", LINEAR),
+]
+
+FROZEN_OPERATIONS = [
+    ("hash", "hash(s)", CONSTANT),
+    ("hash_new", "hash(s.copy())", LINEAR),
+]
+
+INDEX_OPERATIONS = [
+    ("getitem_first", "s[0]", CONSTANT),
+    ("getitem_middle", "s[m]", CONSTANT),
+    ("slice_middle", "s[m:m + 10]", CONSTANT),
+    ("index", "s.index(x)", CONSTANT),
+    ("slice_head", "s[:10]", CONSTANT),
+    ("getitem_last", "s[-1]", CONSTANT),
+    ("slice_tail", "s[-10:]", CONSTANT),
+    ("slice_reversed", "s[:-11:-1]", CONSTANT),
+    ("slice_all", "s[::-1]", LINEAR),
+]
+
+# Interleaved removals, insertions and positional accesses, which must not
+# rebuild the position index of IndexSet.
+MUTABLE_INDEX_OPERATIONS = [
+    ("discard_getitem_add", "s.discard(x); s[m]; s.add(x)", CONSTANT),
+    ("discard_index_add", "s.discard(x); s.index(m - 1); s.add(x)", CONSTANT),
+    ("pop_getitem_add", "s.add(s.pop()); s[m]", CONSTANT),
+    ("insert_discard", "s.insert(m, y); s.discard(y)", SQRT),
+    ("move", "s.move(x, m // 2)", SQRT),
+    ("move_last_to_middle", "s.move(s[-1], m)", SQRT),
+    ("move_to_front_and_end", "s.move_to_end(x, last=False); s.move_to_end(x)",
+     SQRT),
+]
+
+# Range and rank queries of SortedIndexedOrderedSet, interleaved with removals
+# and insertions that change its sorted index.
+SORTED_OPERATIONS = [
+    ("irange", "list(s.irange(m, m + 10))", CONSTANT),
+    ("kth_smallest", "s.kth_smallest(m)", CONSTANT),
+    ("floor_ceiling", "s.floor(m); s.ceiling(m)", CONSTANT),
+    ("bisect", "s.bisect_left(x); s.bisect_right(x)", CONSTANT),
+    ("discard_kth_add", "s.discard(x); s.kth_smallest(m); s.add(x)", CONSTANT),
+]
+
+CASES = [
+    (cls, name, statement, limit)
+    for cls, operations in [
+        (OrderedSet, COMMON_OPERATIONS + MUTABLE_OPERATIONS),
+        (FrozenOrderedSet, COMMON_OPERATIONS + FROZEN_OPERATIONS),
+        (IndexSet, COMMON_OPERATIONS + MUTABLE_OPERATIONS + INDEX_OPERATIONS
+         + MUTABLE_INDEX_OPERATIONS),
+        (FrozenIndexSet, COMMON_OPERATIONS + FROZEN_OPERATIONS + INDEX_OPERATIONS),
+        (SortedIndexedOrderedSet,
+         COMMON_OPERATIONS + MUTABLE_OPERATIONS + SORTED_OPERATIONS),
+    ]
+    for name, statement, limit in operations
+]
+
+
+def measure(statement: str, cls: type, n: int, min_time: float) -> float:
+    """Return the best time of one execution of *statement* for size *n*."""
+    items = list(range(n))
+    namespace: dict[str, Any] = {
+        "cls": cls, "items": items, "s": cls(items), "t": cls(items),
+        "o": cls(range(n // 2, n + n // 2)), "lst": list(range(n // 2, n + n // 2)),
+        "x": n // 2, "y": -1, "m": n // 2,
+    }
+    timer = Timer(statement, globals=namespace)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            break
+        number *= 2 if elapsed > min_time / 10 else 10
+    return min(timer.timeit(number) for _ in range(3)) / number
+
+
+def growth_exponent(statement: str, cls: type, min_time: float) -> float:
+    """Return the exponent *k* of the least-squares fit of the time of \
+        *statement* to *c * n**k*."""
+    xs = [log(n) for n in SIZES]
+    ys = [log(measure(statement, cls, n, min_time)) for n in SIZES]
+    x_mean = sum(xs) / len(xs)
+    y_mean = sum(ys) / len(ys)
+    return (sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys))
+            / sum((x - x_mean) ** 2 for x in xs))
+
+
+def test_growth_exponent() -> None:
+    assert growth_exponent("len(s)", OrderedSet, 1e-4) < CONSTANT
+    assert CONSTANT < growth_exponent("list(s)", OrderedSet, 1e-4) < LINEAR
+    assert growth_exponent("for _ in range(len(s) // 100): list(s)",
+                           OrderedSet, 1e-4) > LINEAR
+
+
+@pytest.mark.parametrize("cls, name, statement, limit", CASES,
+                         ids=[f"{c.__name__}-{n}" for c, n, _, _ in CASES])
+def test_complexity(cls: type, name: str, statement: str, limit: float) -> None:
+    if platform.python_implementation() == "PyPy":
+        pytest.skip("Timings under PyPy's JIT are not meaningful here.")
+
+    exponent = growth_exponent(statement, cls, 1e-3)
+    if exponent > limit:
+        # Measure again with more repetitions before failing, in case the
+        # machine was busy.
+        exponent = min(exponent, growth_exponent(statement, cls, 1e-2))
+
+    assert exponent <= limit, \
+        f"{cls.__name__}.{name}: time grows as n**{exponent:.2f}"
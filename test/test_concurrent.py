@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+__copyright__ = """
+Copyright (C) 2026 University of Illinois Board of Trustees
+"""
+
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import pickle
+from threading import Barrier, Thread
+from typing import Any, Callable
+
+import pytest
+
+from orderedsets import OrderedSet
+from orderedsets.concurrent import ConcurrentOrderedSet
+
+
+def _run_threads(nthreads: int, target: Callable[[int], Any]) -> None:
+    barrier = Barrier(nthreads)
+
+    def run(i: int) -> None:
+        barrier.wait()
+        target(i)
+
+    threads = [Thread(target=run, args=(i,)) for i in range(nthreads)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+
+def test_concurrent_api() -> None:
+    cset = ConcurrentOrderedSet(["d", "a", "d", "b"], stripes=3)
+    oset = OrderedSet(["d", "a", "d", "b"])
+
+    assert cset == oset
+    assert list(cset) == list(oset)
+    assert repr(cset) == "ConcurrentOrderedSet({'d', 'a', 'b'})"
+    assert repr(ConcurrentOrderedSet()) == "ConcurrentOrderedSet()"
+    assert isinstance(cset, OrderedSet)
+
+    for op, args in (("union", (["x", "a"], "y")), ("intersection", (["b", "d"],)),
+                     ("intersection", ()), ("difference", (["a"], "b")),
+                     ("difference", ()), ("symmetric_difference", (["a", "q"],))):
+        result = getattr(cset, op)(*args)
+        assert type(result) is ConcurrentOrderedSet
+        assert len(result._locks) == 3
+        assert list(result) == list(getattr(oset, op)(*args))
+
+    copy = cset.copy()
+    assert copy == cset
+    assert copy is not cset
+    assert len(copy._locks) == 3
+
+    assert cset.isdisjoint(["x"])
+    assert not cset.isdisjoint(["a"])
+    assert cset.issubset(["a", "b", "d", "e"])
+    assert not cset.issubset(["a"])
+    assert cset <= {"a", "b", "d"}
+    assert cset >= {"a"}
+
+    with pytest.raises(ValueError):
+        ConcurrentOrderedSet(stripes=0)
+
+
+def test_concurrent_mutations() -> None:
+    cset = ConcurrentOrderedSet(range(10))
+    oset = OrderedSet(range(10))
+
+    for s in (cset, oset):
+        s.add(3)
+        s.add(20)
+        s.discard(4)
+        s.discard(40)
+        s.remove(5)
+        s.update([1, 21], [22])
+        s.difference_update([0], [21, 99])
+        s.intersection_update(range(30), [1, 2, 3, 6, 7, 8, 9, 20, 22])
+        s.symmetric_difference_update([2, 50, 3, 51, 50])
+        s.sort(reverse=True)
+        s.sort(reverse=True)
+    assert list(cset) == list(oset)
+    assert cset.pop() == oset.pop()
+
+    with pytest.raises(KeyError):
+        cset.remove(1000)
+
+    orig = cset
+    cset |= {100}
+    cset &= {1, 6, 100}
+    cset -= {1}
+    cset ^= {6, 7}
+    assert cset is orig
+    assert list(cset) == [100, 7]
+
+    cset.clear()
+    assert len(cset) == 0
+
+
+def test_concurrent_sort() -> None:
+    cset = ConcurrentOrderedSet([3, 1, 2])
+
+    def key(x: int) -> int:
+        # The key is called outside of the locks, so it can modify the set.
+        cset.add(10)
+        cset.discard(2)
+        return x
+
+    cset.sort(key=key)
+    assert list(cset) == [1, 3, 10]
+
+
+def test_concurrent_iteration_snapshot() -> None:
+    cset = ConcurrentOrderedSet(range(5))
+    for i in cset:
+        cset.discard(i)  # noqa: B909
+        cset.add(i + 10)  # noqa: B909
+    assert list(cset) == list(range(10, 15))
+
+
+def test_concurrent_pickle() -> None:
+    cset = ConcurrentOrderedSet(["b", "a"], stripes=5)
+    cset2 = pickle.loads(pickle.dumps(cset))
+    assert list(cset2) == ["b", "a"]
+    assert len(cset2._locks) == 5
+    cset2.add("c")
+    assert "c" not in cset
+
+
+def test_concurrent_threads() -> None:
+    nthreads = 8
+    cset: ConcurrentOrderedSet[int] = ConcurrentOrderedSet()
+    added = [0] * nthreads
+
+    def add(i: int) -> None:
+        for j in range(2000):
+            added[i] += cset.add_if_absent(j)
+            cset.update([10000 + 2000 * i + j])
+
+    _run_threads(nthreads, add)
+
+    # Every element was added exactly once, and no update was lost.
+    assert sum(added) == 2000
+    assert len(cset) == 2000 + nthreads * 2000
+
+    def pop(i: int) -> None:
+        for _ in range(1000):
+            cset.pop()
+            cset.discard(i)
+
+    _run_threads(nthreads, pop)
+    assert len(cset) == 2000 + nthreads * 2000 - nthreads * 1000 - nthreads
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+__copyright__ = """
+Copyright (C) 2026 University of Illinois Board of Trustees
+"""
+
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+import random
+from typing import Any
+
+import pytest
+
+from orderedsets import FrozenOrderedSet, IndexSet, OrderedSet
+from orderedsets.diffing import (
+    Delete,
+    Edit,
+    Insert,
+    Move,
+    _increasing_run,
+    diff,
+    patch,
+)
+
+
+def check(a: list[Any], b: list[Any]) -> list[Edit]:
+    script = diff(a, b)
+    result = patch(IndexSet(a), script)
+    assert type(result) is IndexSet
+    assert list(result) == b
+
+    # Every edit keeps the positions that it records consistent.
+    current = list(a)
+    for edit in script:
+        if isinstance(edit, Delete):
+            assert current.pop(edit.position) == edit.element
+        elif isinstance(edit, Move):
+            assert current.pop(edit.source) == edit.element
+            current.insert(edit.target, edit.element)
+        else:
+            current.insert(edit.position, edit.element)
+    assert current == b
+
+    # The edits are minimal.
+    common = [e for e in a if e in b]
+    moves = len(common) - len(_increasing_run([b.index(e) for e in common]))
+    assert sum(isinstance(e, Move) for e in script) == moves
+    assert sum(isinstance(e, Delete) for e in script) == len(set(a) - set(b))
+    assert sum(isinstance(e, Insert) for e in script) == len(set(b) - set(a))
+    return script
+
+
+def test_diff_examples() -> None:
+    assert check([], []) == []
+    assert check([1, 2, 3], [1, 2, 3]) == []
+    assert check([], [1, 2]) == [Insert(0, 1), Insert(1, 2)]
+    assert check([1, 2], []) == [Delete(1, 2), Delete(0, 1)]
+    assert check([1, 2, 3], [3, 1, 2]) == [Move(2, 0, 3)]
+    assert check([1, 2, 3], [2, 3, 1]) == [Move(0, 2, 1)]
+    assert check([1, 2, 3, 4], [4, 3, 2, 1]) == [
+        Move(2, 3, 3), Move(1, 3, 2), Move(0, 3, 1)]
+    assert check(list("abcde"), list("eXdcb")) == [
+        Delete(0, "a"), Move(2, 3, "d"), Move(1, 3, "c"), Move(0, 3, "b"),
+        Insert(1, "X")]
+
+
+def test_diff_random() -> None:
+    rng = random.Random(47)
+    for _ in range(500):
+        a = rng.sample(range(30), rng.randint(0, 20))
+        b = rng.sample(range(30), rng.randint(0, 20))
+        check(a, b)
+        check(a, [*a[:5], *rng.sample(a[5:], len(a[5:]))])
+
+
+@pytest.mark.parametrize("cls", [OrderedSet, FrozenOrderedSet, IndexSet])
+def test_patch_types(cls: Any) -> None:
+    a, b = cls("abcd"), cls("dbXa")
+    result = patch(a, diff(a, b))
+    assert type(result) is cls
+    assert list(result) == list(b)
+    assert list(a) == list("abcd")
+    assert patch(list("abcd"), diff(a, b)) == list("dbXa")
+
+
+def test_patch_errors() -> None:
+    a = IndexSet("abc")
+    for edit in (Delete(0, "b"), Delete(0, "x"), Move(1, 0, "a"),
+                 Move(0, 3, "a"), Insert(0, "a"), Insert(4, "x")):
+        with pytest.raises(ValueError, match="cannot apply"):
+            patch(a, [edit])
+    with pytest.raises(ValueError, match="cannot apply"):
+        patch(IndexSet("bac"), diff("abc", "cba"))
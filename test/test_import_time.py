@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+__copyright__ = """
+Copyright (C) 2026 University of Illinois Board of Trustees
+"""
+
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import orderedsets
+
+# Dependencies of orderedsets/__init__.py, which are imported at startup by
+# the interpreter or by most programs. typing is only imported on Python
+# versions whose collections.abc classes cannot be subscripted.
+DEPENDENCIES = "import os, sys, collections.abc"
+if sys.version_info < (3, 9):  # pragma: no cover
+    DEPENDENCIES += ", typing"
+
+# Maximum time to import orderedsets when its dependencies are already
+# imported. Looking up the version with importlib.metadata and importing
+# typing at import time used to take about 10 times as long.
+MAX_IMPORT_TIME_US = 5_000
+
+
+def run(*args: str) -> subprocess.CompletedProcess[str]:
+    # Allow writing bytecode, so that only the first import compiles the
+    # source.
+    env = {k: v for k, v in os.environ.items()
+           if k not in ("ORDEREDSETS_PROFILE", "PYTHONDONTWRITEBYTECODE")}
+    return subprocess.run([sys.executable, *args], env=env,
+                          capture_output=True, text=True, check=True)
+
+
+def test_imported_modules() -> None:
+    code = "import sys; print(' '.join(sys.modules))"
+    before = set(run("-c", f"{DEPENDENCIES}; {code}").stdout.split())
+    after = set(run("-c", f"{DEPENDENCIES}; import orderedsets; {code}")
+                .stdout.split())
+
+    assert after - before <= {"orderedsets", "__future__"}
+
+
+def test_import_time() -> None:
+    times = []
+    for _ in range(3):
+        stderr = run("-X", "importtime", "-c",
+                     f"{DEPENDENCIES}; import orderedsets").stderr
+        line, = (line for line in stderr.splitlines()
+                 if line.endswith("| orderedsets"))
+        times.append(int(line.split("|")[1]))
+
+    assert min(times) <= MAX_IMPORT_TIME_US
+
+
+def test_lazy_attributes() -> None:
+    try:
+        from importlib.metadata import version
+    except ModuleNotFoundError:  # pragma: no cover
+        # Python 3.7
+        from importlib_metadata import version  # type: ignore[no-redef]
+
+    from orderedsets import __version__
+    assert __version__ == orderedsets.__version__ == version("orderedsets")
+
+    from orderedsets.concurrent import ConcurrentOrderedSet
+    assert orderedsets.concurrent.ConcurrentOrderedSet is ConcurrentOrderedSet
+
+    from orderedsets.diffing import diff
+    assert orderedsets.diff is diff
+    from orderedsets import patch
+    assert patch is orderedsets.diffing.patch
+
+    with pytest.raises(AttributeError, match="no attribute 'nonexistent'"):
+        orderedsets.nonexistent  # noqa: B018
+
+
+def test_lazy_submodules(monkeypatch: pytest.MonkeyPatch) -> None:
+    # In a fresh interpreter, no submodule is imported before its first access.
+    code = ("import sys, orderedsets\n"
+            "assert 'orderedsets.sharded' not in sys.modules\n"
+            "print(orderedsets.sharded.ShardedOrderedSet.__module__)")
+    assert run("-c", code).stdout.split() == ["orderedsets.sharded"]
+
+    # Importing a submodule sets it as an attribute of the package, which
+    # bypasses __getattr__.
+    from orderedsets import sharded
+    monkeypatch.delattr(orderedsets, "sharded")
+    assert orderedsets.sharded is sharded
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 __copyright__ = """
 Copyright (C) 2025 University of Illinois Board of Trustees
 """
@@ -23,11 +25,11 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-from typing import Type, TypeVar, Union
+from typing import Any, Type, TypeVar, Union
 
 import pytest
 
-from orderedsets import FrozenIndexSet, IndexSet
+from orderedsets import FrozenIndexSet, IndexSet, OrderedSet
 
 T = TypeVar("T")
 
@@ -77,3 +79,260 @@ def test_indexset(cls: T_set[str]) -> None:
     assert iset[5:100] == ["f", "g", "h", "i", "j"] == input_list[5:100]
 
     # }}}
+
+
+@pytest.mark.parametrize("cls", set_types)
+@pytest.mark.parametrize("have_reversed_dict", [True, False])
+@pytest.mark.parametrize("max_scan", [32, 1, -1])
+def test_indexset_slices(cls: T_set[int], have_reversed_dict: bool,
+                         max_scan: int, monkeypatch: pytest.MonkeyPatch) -> None:
+    import orderedsets
+    monkeypatch.setattr(orderedsets, "_HAVE_REVERSED_DICT", have_reversed_dict)
+    # -1 builds the position index on the first access.
+    monkeypatch.setattr(orderedsets, "_MAX_SCAN", max_scan)
+
+    bounds = [None, *range(-12, 13)]
+    for n in range(10):
+        input_list = list(range(n))
+        iset = cls(input_list)
+
+        for i in range(-n, n):
+            assert iset[i] == input_list[i]
+
+        for start in bounds:
+            for stop in bounds:
+                for step in [None, 1, 2, 3, 7, -1, -2, -3, -7]:
+                    assert iset[start:stop:step] == input_list[start:stop:step]
+
+        with pytest.raises(ValueError):
+            iset[::0]
+
+
+@pytest.mark.parametrize("cls", set_types)
+def test_index(cls: T_set[str], monkeypatch: pytest.MonkeyPatch) -> None:
+    import orderedsets
+
+    input_list = [str(i) for i in range(100)]
+    for max_scan in (32, -1, 1000):
+        monkeypatch.setattr(orderedsets, "_MAX_SCAN", max_scan)
+        iset = cls(input_list)
+        for i, e in enumerate(input_list):
+            assert iset.index(e) == i
+            assert iset[iset.index(e)] == e
+
+        with pytest.raises(ValueError, match="'x' is not in set"):
+            iset.index("x")
+
+
+def _random_update(iset: IndexSet[int], ref: list[int], rng: Any,
+                   step: int) -> list[int]:
+    # Apply a random bulk update to *iset* and return the updated *ref*.
+    other = [rng.randrange(100) for _ in range(5)]
+    if step % 100 == 0:
+        iset.clear()
+        return []
+    elif step % 4 == 0:
+        iset |= OrderedSet(other)
+        return ref + [e for e in dict.fromkeys(other) if e not in ref]
+    elif step % 4 == 1:
+        iset -= OrderedSet(other)
+        return [e for e in ref if e not in other]
+    elif step % 4 == 2:
+        iset ^= OrderedSet(other)
+        return ([e for e in ref if e not in other]
+                + [e for e in dict.fromkeys(other) if e not in ref])
+    else:
+        keep = set(range(other[0], other[0] + 90))
+        iset &= keep
+        return [e for e in ref if e in keep]
+
+
+def _check_positions(iset: IndexSet[int], ref: list[int], i: int) -> None:
+    assert iset[i] == ref[i]
+    assert iset.index(ref[i]) == ref.index(ref[i])
+    assert iset[i::3] == ref[i::3]
+    assert iset[i:i - 7:-2] == ref[i:i - 7:-2]
+
+
+@pytest.mark.parametrize("min_load", [0.5, 0.9, 0.])
+def test_indexset_mixed_operations(min_load: float,
+                                   monkeypatch: pytest.MonkeyPatch) -> None:
+    import random
+
+    import orderedsets
+    from orderedsets._slots import SlotIndex
+
+    monkeypatch.setattr(orderedsets, "_MAX_SCAN", -1)
+    monkeypatch.setattr(SlotIndex, "min_load", min_load)
+
+    rng = random.Random(min_load)
+    iset: IndexSet[int] = IndexSet(range(50))
+    ref = list(range(50))
+
+    for step in range(3000):
+        x = rng.randrange(100)
+        op = rng.randrange(8)
+        if op < 3:
+            iset.add(x)
+            if x not in ref:
+                ref.append(x)
+        elif op < 6:
+            if x in ref and op == 5:
+                iset.remove(x)
+            else:
+                iset.discard(x)
+            if x in ref:
+                ref.remove(x)
+        elif op == 6 and ref:
+            assert iset.pop() == ref.pop()
+        else:
+            ref = _random_update(iset, ref, rng, step)
+
+        assert len(iset) == len(ref)
+        if ref:
+            _check_positions(iset, ref, rng.randrange(-len(ref), len(ref)))
+
+    assert list(iset) == ref
+    with pytest.raises(KeyError):
+        iset.remove(-1)
+
+
+def test_indexset_pickle_copy(monkeypatch: pytest.MonkeyPatch) -> None:
+    import pickle
+    from copy import copy
+
+    import orderedsets
+
+    monkeypatch.setattr(orderedsets, "_MAX_SCAN", -1)
+
+    iset: IndexSet[int] = IndexSet(range(10))
+    assert iset[5] == 5
+    iset.discard(3)
+    iset.add(3)
+
+    for result in (pickle.loads(pickle.dumps(iset)), copy(iset), iset.copy()):
+        assert isinstance(result, IndexSet)
+        assert list(result) == [0, 1, 2, 4, 5, 6, 7, 8, 9, 3]
+        assert result[3] == 4
+        assert result.index(3) == 9
+        result.discard(4)
+        assert result[3] == 5
+
+    assert list(iset) == [0, 1, 2, 4, 5, 6, 7, 8, 9, 3]
+
+
+def _random_move(iset: IndexSet[int], ref: list[int], rng: Any) -> None:
+    # Apply a random insertion or move to *iset* and *ref*.
+    x = rng.randrange(120)
+    op = rng.randrange(4)
+    if op == 0:
+        i = rng.randrange(-70, 70)
+        iset.insert(i, x)
+        if x not in ref:
+            ref.insert(i, x)
+    elif op == 1 and ref:
+        e = rng.choice(ref)
+        i = rng.randrange(-len(ref), len(ref))
+        iset.move(e, i)
+        i %= len(ref)
+        ref.remove(e)
+        ref.insert(i, e)
+    elif op == 2 and ref:
+        e = rng.choice(ref)
+        iset.move_to_end(e, last=rng.random() < 0.5)
+        ref.remove(e)
+        if iset[-1] == e:
+            ref.append(e)
+        else:
+            ref.insert(0, e)
+    elif op == 3:
+        iset.add(x)
+        if x not in ref:
+            ref.append(x)
+
+
+@pytest.mark.parametrize("spacing", [8, 3, 1])
+def test_indexset_insert_move(spacing: int,
+                              monkeypatch: pytest.MonkeyPatch) -> None:
+    import random
+
+    from orderedsets._slots import SlotIndex
+
+    monkeypatch.setattr(SlotIndex, "spacing", spacing)
+
+    for seed in range(20):
+        rng = random.Random(seed)
+        iset: IndexSet[int] = IndexSet(range(rng.randrange(60)))
+        ref = list(iset)
+
+        for step in range(300):
+            if rng.random() < 0.7:
+                _random_move(iset, ref, rng)
+            elif ref and rng.random() < 0.5:
+                assert iset.pop() == ref.pop()
+            else:
+                x = rng.randrange(120)
+                iset.discard(x)
+                if x in ref:
+                    ref.remove(x)
+
+            assert len(iset) == len(ref)
+            if ref:
+                _check_positions(iset, ref, rng.randrange(-len(ref), len(ref)))
+            if step % 50 == 0:
+                assert list(iset) == ref
+
+        assert list(iset) == ref
+        assert repr(iset) == repr(IndexSet(ref))
+        assert list(iset.copy()) == ref
+        assert list(iset | {-1}) == [*ref, -1]
+        assert list(iset - {ref[0]}) == ref[1:]
+
+
+def test_indexset_sort() -> None:
+    iset: IndexSet[int] = IndexSet(range(100))
+    iset.move(0, 50)
+    assert iset[50] == 0
+    iset.sort()
+    assert list(iset) == list(range(100))
+    assert iset[50] == 50
+    iset.sort(reverse=True)
+    assert iset[50] == 49
+    assert iset.index(99) == 0
+
+
+def test_indexset_insert_move_edge_cases() -> None:
+    import pickle
+
+    iset: IndexSet[str] = IndexSet(["a", "b", "c"])
+    iset.move_to_end("a")
+    assert list(iset) == ["b", "c", "a"]
+
+    iset.insert(1, "c")
+    assert list(iset) == ["b", "c", "a"]
+    iset.insert(-1, "d")
+    iset.insert(-10, "e")
+    iset.insert(10, "f")
+    assert list(iset) == ["e", "b", "c", "d", "a", "f"]
+
+    iset.move("f", 0)
+    iset.move("e", -1)
+    assert list(iset) == ["f", "b", "c", "d", "a", "e"]
+    assert iset == {"a", "b", "c", "d", "e", "f"}
+    assert iset.symmetric_difference({"a", "x"}) == IndexSet("fbcdex")
+    assert list(iset.intersection("abcf")) == ["f", "b", "c", "a"]
+    assert list(pickle.loads(pickle.dumps(iset))) == list(iset)
+
+    with pytest.raises(KeyError):
+        iset.move("x", 0)
+    with pytest.raises(IndexError):
+        iset.move("a", 6)
+    with pytest.raises(KeyError):
+        iset.move_to_end("x")
+    with pytest.raises(KeyError):
+        iset.move_to_end("x", last=False)
+
+    while iset:
+        iset.pop()
+    with pytest.raises(KeyError):
+        iset.pop()
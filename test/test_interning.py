@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+__copyright__ = """
+Copyright (C) 2026 University of Illinois Board of Trustees
+"""
+
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+import pickle
+import sys
+from typing import Any
+
+import pytest
+
+from orderedsets import FrozenOrderedSet, OrderedSet
+from orderedsets.interning import InternedFrozenOrderedSet, InternedOrderedSet
+
+
+def fresh(s: str) -> str:
+    # A new str object equal to s, as created by a parser.
+    return "".join(list(s))
+
+
+class Name(str):  # noqa: FURB189
+    pass
+
+
+def assert_interned(s: Any) -> None:
+    for e in s:
+        if type(e) is str:
+            assert e is sys.intern(fresh(e))
+
+
+@pytest.mark.parametrize("cls", [InternedOrderedSet, InternedFrozenOrderedSet])
+def test_interning_construction(cls: type) -> None:
+    assert len(cls()) == 0
+    words = [fresh("alpha"), fresh("beta"), fresh("alpha"), 3, fresh("gamma")]
+    assert words[0] is not words[2]
+
+    s = cls(words)
+    assert list(s) == ["alpha", "beta", 3, "gamma"]
+    assert_interned(s)
+
+    name = Name("beta")
+    assert type(next(iter(cls([name])))) is Name
+
+    for result in (s | [fresh("delta")], s ^ {fresh("epsilon"), "beta"},
+                   s.union([fresh("zeta")]), s.copy(), s - {3}, s & {"beta"}):
+        assert type(result) is cls
+        assert_interned(result)
+
+    assert pickle.loads(pickle.dumps(s)) == s
+    assert_interned(pickle.loads(pickle.dumps(s)))
+
+
+def test_interning_mutations() -> None:
+    s: OrderedSet[Any] = InternedOrderedSet()
+    s.add(fresh("alpha"))
+    s.update([fresh("beta"), 1], (fresh("gamma"),))
+    s |= {fresh("delta")}
+    s ^= {fresh("epsilon"), "alpha"}
+    s.symmetric_difference_update([fresh("zeta")])
+    assert s == OrderedSet(["beta", 1, "gamma", "delta", "epsilon", "zeta"])
+    assert list(s) == ["beta", 1, "gamma", "delta", "epsilon", "zeta"]
+    assert_interned(s)
+
+    s.discard(fresh("beta"))
+    s.remove(fresh("gamma"))
+    s -= {1}
+    s &= {"delta", "epsilon", "zeta"}
+    assert s == FrozenOrderedSet(["delta", "epsilon", "zeta"])
+    assert_interned(s)
+
+
+def test_interning_shares_strings() -> None:
+    words = [fresh(f"identifier_{i % 10}") for i in range(100)]
+    sets = [InternedOrderedSet(words[i:i + 20]) for i in range(0, 100, 20)]
+    assert len({id(e) for s in sets for e in s}) == 10
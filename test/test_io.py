@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+__copyright__ = """
+Copyright (C) 2026 University of Illinois Board of Trustees
+"""
+
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+import io
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import orderedsets.io
+from orderedsets import FrozenIndexSet, FrozenOrderedSet, IndexSet, OrderedSet
+from orderedsets.io import dump, load
+from orderedsets.sharded import ShardedOrderedSet
+
+JSON_ELEMENTS = ["a", "", "line\nbreak", '"quoted", [1]', "é\U0001f600",
+                 0, -1, 2**70, 1.5, None, True]
+BINARY_ELEMENTS = ["a", "", "line\nbreak", "é\U0001f600", "\udc80",
+                   0, -1, 2**70, b"", b"\x00bytes"]
+
+
+def roundtrip(s: Any, fmt: str, cls: Any = OrderedSet, **kwargs: Any) -> Any:
+    buf: Any = io.StringIO() if fmt == "jsonl" else io.BytesIO()
+    dump(s, buf, format=fmt, **kwargs)
+    buf.seek(0)
+    return load(buf, cls, format=fmt, **kwargs)
+
+
+@pytest.mark.parametrize("cls", [OrderedSet, FrozenOrderedSet, IndexSet,
+                                 FrozenIndexSet, partial(ShardedOrderedSet,
+                                                         shards=4)])
+@pytest.mark.parametrize("fmt, elements", [("jsonl", JSON_ELEMENTS),
+                                           ("binary", BINARY_ELEMENTS)])
+def test_io_roundtrip(cls: Any, fmt: str, elements: list[Any]) -> None:
+    for chunk_size in (1, 3, 10_000):
+        result = roundtrip(OrderedSet(elements), fmt, cls, chunk_size=chunk_size)
+        assert isinstance(result, getattr(cls, "func", cls))
+        assert list(result) == elements
+        assert [type(e) for e in result] == [type(e) for e in elements]
+
+        assert list(roundtrip(cls(), fmt, cls, chunk_size=chunk_size)) == []
+
+
+def test_io_binary_records_across_reads(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(orderedsets.io, "_READ_SIZE", 3)
+    s = OrderedSet(["x" * 10, *range(100), "", b"y" * 7])
+    assert list(roundtrip(s, "binary")) == list(s)
+
+
+def test_io_file(tmp_path: Path) -> None:
+    s = FrozenOrderedSet(f"element {i}" for i in range(1000))
+    with open(tmp_path / "set.jsonl", "w", encoding="utf-8") as f:
+        dump(s, f)
+    assert (tmp_path / "set.jsonl").read_text("utf-8").splitlines()[:2] == [
+        '"element 0"', '"element 1"']
+    with open(tmp_path / "set.jsonl", encoding="utf-8") as f:
+        assert list(load(f, FrozenOrderedSet)) == list(s)
+
+    with open(tmp_path / "set.bin", "wb") as f:
+        dump(s, f, format="binary")
+    with open(tmp_path / "set.bin", "rb") as f:
+        assert list(load(f, format="binary")) == list(s)
+
+
+def test_io_errors() -> None:
+    with pytest.raises(ValueError, match="unknown format 'json'"):
+        dump([], io.StringIO(), format="json")
+    with pytest.raises(ValueError, match="unknown format 'json'"):
+        load(io.StringIO(), format="json")
+
+    with pytest.raises(ValueError, match="not a binary ordered set file"):
+        load(io.BytesIO(b"[1, 2]"), format="binary")
+    buf = io.BytesIO()
+    dump(["abc", "def"], buf, format="binary")
+    with pytest.raises(ValueError, match="truncated"):
+        load(io.BytesIO(buf.getvalue()[:-1]), format="binary")
+
+    with pytest.raises(TypeError, match="cannot encode"):
+        dump([1.5], io.BytesIO(), format="binary")
+    # Elements that are not decoded as equal, hashable values.
+    for element in (b"bytes", (1, 2), FrozenOrderedSet([1])):
+        with pytest.raises(TypeError, match="cannot write element of type"):
+            dump([1, element], io.StringIO())
+
+
+def test_io_jsonl_blank_lines() -> None:
+    text = '"a"\n\n  \n1\n\nnull\n\n'
+    assert list(load(io.StringIO(text))) == ["a", 1, None]
+    assert list(load(io.StringIO(text), chunk_size=1)) == ["a", 1, None]
+    assert list(load(io.StringIO("\n\n"))) == []
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+__copyright__ = """
+Copyright (C) 2026 University of Illinois Board of Trustees
+"""
+
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+# Memory budgets for the set classes, measured with tracemalloc. Sizes are
+# compared to those of builtin sets and dicts, or given in units of the
+# memory used by an OrderedSet of the same size (not counting the elements).
+
+import io
+import platform
+import tracemalloc
+from functools import partial
+from operator import iand, ior, isub, ixor
+from typing import Any, Callable
+
+import pytest
+
+from orderedsets import FrozenIndexSet, FrozenOrderedSet, IndexSet, OrderedSet
+from orderedsets.interning import InternedFrozenOrderedSet, InternedOrderedSet
+from orderedsets.io import dump, load
+
+if platform.python_implementation() == "PyPy":
+    pytest.skip("tracemalloc does not track object memory on PyPy.",
+                allow_module_level=True)
+
+N = 10_000
+
+all_classes = pytest.mark.parametrize(
+    "cls", [OrderedSet, FrozenOrderedSet, IndexSet, FrozenIndexSet])
+mutable_classes = pytest.mark.parametrize("cls", [OrderedSet, IndexSet])
+
+
+def traced(func: Callable[[], Any]) -> tuple[int, int]:
+    """Return the memory retained after calling *func* and the peak memory \
+        allocated during the call."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        # Keep the result alive until the memory is measured.
+        result = func()  # noqa: F841
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return current - before, peak - before
+
+
+def test_traced() -> None:
+    items = list(range(N))
+    size, peak = traced(partial(list, items))
+    assert 8 * N <= size <= peak
+    assert traced(partial(bool, items)) == (0, 0)
+
+
+@all_classes
+def test_instance_overhead(cls: type) -> None:
+    overhead, _ = traced(cls)
+    assert overhead <= 2.5 * traced(set)[0]
+
+
+@all_classes
+def test_bytes_per_element(cls: type) -> None:
+    items = list(range(N))
+    size, _ = traced(partial(cls, items))
+    dict_size, _ = traced(partial(dict.fromkeys, items))
+    set_size, _ = traced(partial(set, items))
+
+    # The elements are stored in a dict, so the per-element cost must be that
+    # of a dict.
+    assert size <= dict_size + 1024
+    assert size <= 2 * set_size
+
+
+@all_classes
+@pytest.mark.parametrize("op, max_units", [
+    ("union", 2.5),
+    ("intersection", 2),
+])
+def test_operation_peak(cls: type, op: str, max_units: float) -> None:
+    s = cls(range(N))
+    o = cls(range(N // 2, N + N // 2))
+    unit, _ = traced(partial(OrderedSet, range(N)))
+
+    _, peak = traced(partial(getattr(s, op), o))
+    assert peak <= max_units * unit
+
+
+@mutable_classes
+@pytest.mark.parametrize("op, func, max_units", [
+    ("update", lambda s, o: s.update(o), 2.5),
+    ("|=", ior, 2.5),
+    ("&=", iand, 2),
+    ("-=", isub, 2.5),
+    ("^=", ixor, 2.5),
+])
+def test_in_place_peak(cls: type, op: str, func: Callable[[Any, Any], Any],
+                       max_units: float) -> None:
+    s = cls(range(N))
+    o = cls(range(N // 2, N + N // 2))
+    unit, _ = traced(partial(OrderedSet, range(N)))
+
+    _, peak = traced(partial(func, s, o))
+    assert peak <= max_units * unit, op
+
+
+@pytest.mark.parametrize("cls, interned_cls", [
+    (OrderedSet, InternedOrderedSet),
+    (FrozenOrderedSet, InternedFrozenOrderedSet),
+])
+def test_interned_strings(cls: type, interned_cls: type) -> None:
+    # Sets of the same identifiers, each parsed into new str objects.
+    def build(cls: type) -> list[Any]:
+        return [cls(f"identifier_{i}" for i in range(N // 10))
+                for _ in range(10)]
+
+    # Intern the strings beforehand, so that resizing the interpreter's
+    # intern table is not measured.
+    warmup = build(interned_cls)  # noqa: F841
+
+    size, _ = traced(partial(build, cls))
+    interned_size, _ = traced(partial(build, interned_cls))
+    assert interned_size <= 0.5 * size
+
+
+class Discard:
+    def write(self, data: Any) -> int:
+        return len(data)
+
+
+@pytest.mark.parametrize("fmt", ["jsonl", "binary"])
+def test_io_peak(fmt: str) -> None:
+    s = OrderedSet(range(N))
+    unit, _ = traced(partial(OrderedSet, range(N)))
+
+    # Only a chunk of the elements is serialized at a time.
+    sink: Any = Discard()
+    _, peak = traced(partial(dump, s, sink, format=fmt, chunk_size=N // 20))
+    assert peak <= 0.5 * unit
+
+    buf: Any = io.StringIO() if fmt == "jsonl" else io.BytesIO()
+    dump(s, buf, format=fmt)
+    buf.seek(0)
+    size, peak = traced(partial(load, buf, format=fmt, chunk_size=N // 20))
+    assert peak <= size + 0.5 * unit
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+__copyright__ = """
+Copyright (C) 2026 University of Illinois Board of Trustees
+"""
+
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+import random
+import subprocess
+import sys
+from typing import Any
+
+import pytest
+
+import orderedsets.merkle
+from orderedsets import FrozenIndexSet, FrozenOrderedSet
+from orderedsets.merkle import MerkleDigest
+
+
+def expected_chunks(a: list[Any], b: list[Any], chunk_size: int) -> list[int]:
+    nchunks = -(-max(len(a), len(b)) // chunk_size)
+    return [i for i in range(nchunks)
+            if a[i * chunk_size:(i + 1) * chunk_size]
+            != b[i * chunk_size:(i + 1) * chunk_size]]
+
+
+def test_merkle_differing_chunks() -> None:
+    rng = random.Random(48)
+    for _ in range(1000):
+        chunk_size = rng.randint(1, 5)
+        a = list(range(rng.randint(0, 40)))
+        b = [-1 if rng.random() < 0.1 else i for i in range(rng.randint(0, 40))]
+        da, db = MerkleDigest(a, chunk_size), MerkleDigest(b, chunk_size)
+
+        assert (da == db) == (a == b)
+        assert (hash(da) == hash(db)) == (a == b)
+        assert da.differing_chunks(db) == expected_chunks(a, b, chunk_size)
+        assert db.differing_chunks(da) == expected_chunks(a, b, chunk_size)
+        for i in da.differing_chunks(db):
+            assert (a[da.chunk_range(i).start:da.chunk_range(i).stop]
+                    != b[db.chunk_range(i).start:db.chunk_range(i).stop])
+
+        prefix = MerkleDigest(a[:rng.randint(0, len(a))], chunk_size)
+        assert MerkleDigest(a, chunk_size, prefix=prefix).levels == da.levels
+
+
+def test_merkle_order_and_types() -> None:
+    elements = ["a", 1, b"a", -(2**70), ""]
+    digest = MerkleDigest(elements, 2)
+    assert digest == MerkleDigest(iter(elements), 2)
+    assert digest != MerkleDigest(elements[::-1], 2)
+    assert digest != MerkleDigest(elements, 3)
+    assert digest != "digest"
+    assert MerkleDigest([]) != MerkleDigest([""])
+    assert MerkleDigest(["ab", "c"]) != MerkleDigest(["a", "bc"])
+    assert repr(MerkleDigest([], 4)) == (
+        f"MerkleDigest(root='{MerkleDigest([], 4).root.hex()}', length=0, "
+        "chunk_size=4)")
+
+    with pytest.raises(ValueError, match="invalid chunk size"):
+        MerkleDigest(elements, 0)
+    with pytest.raises(ValueError, match="different chunk sizes"):
+        digest.differing_chunks(MerkleDigest(elements, 3))
+    with pytest.raises(TypeError, match="cannot encode"):
+        MerkleDigest([1.5])
+
+
+def test_merkle_independent_of_hash_seed() -> None:
+    code = ("from orderedsets import FrozenOrderedSet; "
+            "print(FrozenOrderedSet(['a', 'b', 1, b'c']).digest(2).root.hex())")
+    roots = {subprocess.run([sys.executable, "-c", code], check=True,
+                            capture_output=True, text=True,
+                            env={"PYTHONHASHSEED": str(seed)}).stdout.strip()
+             for seed in (1, 2)}
+    assert roots == {FrozenOrderedSet(["a", "b", 1, b"c"]).digest(2).root.hex()}
+
+
+@pytest.mark.parametrize("cls", [FrozenOrderedSet, FrozenIndexSet])
+def test_frozen_digest_cache(cls: type, monkeypatch: pytest.MonkeyPatch) -> None:
+    leaves = []
+    leaf = orderedsets.merkle._leaf
+
+    def counting_leaf(elements: Any) -> bytes:
+        leaves.append(elements)
+        return leaf(elements)
+
+    union_digest = MerkleDigest(range(102), 10)
+    digest50 = MerkleDigest(range(100), 50)
+    monkeypatch.setattr(orderedsets.merkle, "_leaf", counting_leaf)
+
+    s = cls(range(100))
+    digest = s.digest(10)
+    assert len(leaves) == 10
+    assert s.digest(10) is digest
+    assert len(leaves) == 10
+
+    # Derived sets only hash the runs after the elements they share.
+    union = s.union([100, 101, 5])
+    assert union.digest(10) == union_digest
+    assert len(leaves) == 11
+    assert s.copy().digest(10) is digest
+    assert s.union().digest(10) is digest
+    assert len(leaves) == 11
+
+    # Other chunk sizes and sets without a cached digest hash everything.
+    assert s.digest(50) == digest50
+    assert len(leaves) == 13
+    assert cls(range(100)).copy().digest(10) == digest
+    assert len(leaves) == 23
@@ -24,6 +24,8 @@ SOFTWARE.
 """
 
 
+import subprocess
+import sys
 from typing import AbstractSet, Any, FrozenSet, Generator, Set, Type, TypeVar, Union
 
 import pytest
@@ -284,6 +286,48 @@ def test_hash_value() -> None:
     assert hash(fs2) == hash(fos2)
 
 
+def test_ordered_hash() -> None:
+    fos = FrozenOrderedSet(["a", "b", "c"])
+    assert fos.ordered_hash() == hash(("a", "b", "c"))
+    assert fos.ordered_hash() == FrozenOrderedSet("abc").ordered_hash()
+    assert fos.ordered_hash() != FrozenOrderedSet("cba").ordered_hash()
+    assert hash(fos) == hash(FrozenOrderedSet("cba"))
+
+    # The hash is cached.
+    fos._dict = {}
+    assert fos.ordered_hash() == hash(("a", "b", "c"))
+
+    stable = FrozenOrderedSet([1, "a", b"b"]).ordered_hash(stable=True)
+    assert 0 <= stable < 2**64
+    assert stable != FrozenOrderedSet([1, b"b", "a"]).ordered_hash(stable=True)
+    code = ("from orderedsets import FrozenOrderedSet; "
+            "print(FrozenOrderedSet([1, 'a', b'b']).ordered_hash(stable=True))")
+    for seed in ("1", "2"):
+        out = subprocess.run([sys.executable, "-c", code], check=True,
+                             capture_output=True, text=True,
+                             env={"PYTHONHASHSEED": seed}).stdout
+        assert int(out) == stable
+
+
+def test_ordered_key() -> None:
+    memo = {FrozenOrderedSet("abc").ordered_key(): 1,
+            FrozenOrderedSet("cba").ordered_key(): 2}
+    assert memo[FrozenOrderedSet("abc").ordered_key()] == 1
+    assert memo[FrozenOrderedSet("cba").ordered_key()] == 2
+    assert FrozenOrderedSet("ab").ordered_key() not in memo
+
+    fos = FrozenOrderedSet([1, 2])
+    key = fos.ordered_key()
+    assert key == fos.ordered_key()
+    assert key == FrozenOrderedSet([1.0, 2]).ordered_key()
+    assert key != FrozenOrderedSet([2, 1]).ordered_key()
+    assert key != FrozenOrderedSet([1, 2, 3]).ordered_key()
+    assert key != (1, 2)
+    assert hash(key) == fos.ordered_hash()
+    assert key.set is fos
+    assert repr(key) == "OrderedKey(FrozenOrderedSet({1, 2}))"
+
+
 @all_immutable_set_types
 def test_update_immutable(cls: T_immutable_set[int]) -> None:
     s = cls([1, 6, 8])
@@ -480,6 +524,14 @@ def test_symmetric_difference(cls: T_set[str]) -> None:
     if cls in ordered_set_types:
         assert list(s1.symmetric_difference(s2)) == ["c", "b", "g"]
 
+    # Non-set iterables, including iterators, with duplicates
+    assert cls(["c", "b", "g"]) == s1.symmetric_difference(["a", "g", "g"])
+    assert cls(["c", "b", "g"]) == s1.symmetric_difference(iter(["a", "g", "a"]))
+
+    if cls in ordered_set_types:
+        assert list(s1.symmetric_difference(iter(["g", "a", "g"]))) \
+            == ["c", "b", "g"]
+
 
 @all_immutable_set_types
 def test_symmetric_difference_update_immutable(cls: T_immutable_set[int]) -> None:
@@ -656,6 +708,9 @@ def test_issubset(cls: T_set[int]) -> None:
     s2 = cls([1, 7])
     assert not s2.issubset(s1)
     assert cls().issubset(s1)
+    assert cls([3, 1]).issubset([1, 2, 3])
+    assert cls([3, 1]).issubset(iter([1, 2, 3]))
+    assert not cls([3, 1]).issubset([1, 2])
 
     if cls in mutable_set_types:
         s2.discard(7)  # type: ignore[union-attr]
@@ -784,6 +839,44 @@ def test_ordering(cls: T_set[int]) -> None:
     # assert not (oset3 >= list(oset4))
 
 
+def _sort(s: Any, **kwargs: Any) -> Any:
+    if isinstance(s, OrderedSet):
+        s.sort(**kwargs)
+        return s
+    return s.sorted(**kwargs)
+
+
+@all_ordered_set_types
+def test_sort(cls: T_ordered_set[Any]) -> None:
+    import random
+
+    rng = random.Random(0)
+    for n in range(8):
+        for _ in range(20):
+            # Mix equal ints and floats to check that the sort is stable.
+            items = list(dict.fromkeys(
+                rng.choice([rng.randrange(5), float(rng.randrange(5))])
+                for _ in range(n)))
+            for key in (None, abs, lambda x: -x, lambda x: x // 2):
+                for reverse in (False, True):
+                    expected = sorted(items, key=key, reverse=reverse)
+                    assert list(_sort(cls(items), key=key, reverse=reverse)) \
+                        == expected
+
+    # Already sorted sets are not rebuilt.
+    s = cls(["a", "b", "b", "c"])
+    d = s._dict
+    assert _sort(s) is s
+    assert s._dict is d
+    assert _sort(s, key=str.upper) is s
+    assert s._dict is d
+
+    result = _sort(s, reverse=True)
+    assert list(result) == ["c", "b", "a"]
+    assert type(result) is cls
+    assert list(_sort(cls(["b", "a"]), key=str.upper)) == ["a", "b"]
+
+
 @all_ordered_set_types
 def test_isinstance(cls: T_ordered_set[int]) -> None:
     from collections.abc import MutableSet as abc_MutableSet
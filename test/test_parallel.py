@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+__copyright__ = """
+Copyright (C) 2026 University of Illinois Board of Trustees
+"""
+
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from typing import Any, Type, Union
+
+import pytest
+
+from orderedsets import FrozenOrderedSet, OrderedSet, parallel
+
+T_set = Union[Type[OrderedSet[Any]], Type[FrozenOrderedSet[Any]]]
+
+ops = ("union", "intersection", "difference", "symmetric_difference")
+
+
+@pytest.fixture
+def always_parallel(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(parallel, "_MIN_PARALLEL_SIZE", 0)
+
+
+@pytest.mark.usefixtures("always_parallel")
+@pytest.mark.parametrize("cls", (OrderedSet, FrozenOrderedSet))
+@pytest.mark.parametrize("op", ops)
+@pytest.mark.parametrize("workers", (1, 2, 3))
+def test_parallel_threads(cls: T_set, op: str, workers: int) -> None:
+    a = cls(str(i) for i in range(0, 3000, 2))
+    b = cls(str(i) for i in reversed(range(0, 3000, 3)))
+
+    expected = getattr(a, op)(b)
+    result = getattr(parallel, op)(a, b, workers, use_threads=True)
+
+    assert type(result) is cls
+    assert list(result) == list(expected)
+
+    # non-set operands
+    result = getattr(parallel, op)(a, iter(list(b)), workers, use_threads=True)
+    assert list(result) == list(expected)
+    result = getattr(parallel, op)(a, dict.fromkeys(b), workers,
+                                   use_threads=True)
+    assert list(result) == list(expected)
+
+
+@pytest.mark.usefixtures("always_parallel")
+@pytest.mark.parametrize("op", ops)
+def test_parallel_processes(op: str) -> None:
+    from concurrent.futures import ProcessPoolExecutor
+
+    a = OrderedSet(range(0, 2000, 2))
+    b = OrderedSet(range(1000, 0, -3))
+
+    expected = getattr(a, op)(b)
+
+    with ProcessPoolExecutor(2) as pool:
+        result = getattr(parallel, op)(a, b, 2, executor=pool)
+    assert list(result) == list(expected)
+
+    result = getattr(parallel, op)(a, b, 2, use_threads=False)
+    assert list(result) == list(expected)
+
+
+def test_parallel_defaults() -> None:
+    a = OrderedSet(range(100))
+    b = OrderedSet(range(50, 150))
+
+    # Small inputs are processed serially.
+    assert list(parallel.intersection(a, b)) == list(range(50, 100))
+
+    with pytest.raises(ValueError):
+        parallel.union(a, b, 0)
+
+
+@pytest.mark.usefixtures("always_parallel")
+def test_parallel_default_pool(monkeypatch: pytest.MonkeyPatch) -> None:
+    a = FrozenOrderedSet(range(100))
+    b = FrozenOrderedSet(range(50, 150))
+
+    # Threads on free-threaded builds, the serial method otherwise.
+    monkeypatch.setattr(parallel, "_free_threaded", lambda: True)
+    assert list(parallel.union(a, b, 2)) == list(range(150))
+
+    monkeypatch.setattr(parallel, "_free_threaded", lambda: False)
+    monkeypatch.delattr(parallel, "_compute")
+    assert list(parallel.union(a, b, 2)) == list(range(150))
+
+
+def test_parallel_installed_operands(monkeypatch: pytest.MonkeyPatch) -> None:
+    # What the initializer of a process pool does in each worker process.
+    monkeypatch.setattr(parallel, "_operands", [])
+    parallel._set_operands([([1, 2, 3, 4], {2, 4})])
+
+    assert parallel._mask(None, 0, 1, 4, True) == bytes([1, 0, 1])
+    assert parallel._mask(None, 0, 1, 4, False) == bytes([0, 1, 0])
+
+
+def test_parallel_free_threaded() -> None:
+    import sys
+
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)
+    assert parallel._free_threaded() is not is_gil_enabled()
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+__copyright__ = """
+Copyright (C) 2026 University of Illinois Board of Trustees
+"""
+
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from orderedsets import (
+    FrozenIndexSet,
+    FrozenOrderedSet,
+    IndexSet,
+    OrderedSet,
+    profiling,
+)
+from orderedsets.profiling import Profile, disable, enable, profile
+from orderedsets.tracking import TrackedOrderedSet
+
+
+def test_profile() -> None:
+    with profile() as prof:
+        s = OrderedSet(range(10))
+        s.add(10)
+        s.add(11)
+        s.update([1, 2], {100, 200, 300})
+        s2 = s & FrozenOrderedSet(range(5))
+        assert 3 in s2
+        assert (s == 5) is False
+        with pytest.raises(KeyError):
+            s.remove(1000)
+
+    report = prof.report()
+    assert set(report) == {"OrderedSet", "FrozenOrderedSet"}
+
+    add = report["OrderedSet"]["add"]
+    assert add["calls"] == add["sampled_calls"] == 2
+    assert add["total_time"] > 0
+    assert add["size_histogram"] == {"8": 2}
+    assert add["operand_size_histogram"] == {}
+
+    assert report["OrderedSet"]["update"]["size_histogram"] == {"8": 1}
+    assert report["OrderedSet"]["update"]["operand_size_histogram"] == {"4": 1}
+    # __init__ has no set size yet
+    init = report["OrderedSet"]["__init__"]
+    assert init["size_histogram"] == {}
+    # (including the new sets created by update() and &)
+    assert init["operand_size_histogram"] == {"4": 1, "8": 1, "16": 1}
+
+    # Nested calls are also counted
+    assert report["OrderedSet"]["__and__"]["calls"] == 1
+    assert report["OrderedSet"]["intersection"]["calls"] == 1
+    assert report["OrderedSet"]["__contains__"]["calls"] == 1
+    assert report["OrderedSet"]["remove"]["calls"] == 1
+    assert report["OrderedSet"]["__eq__"]["operand_size_histogram"] == {"0": 1}
+    assert "__len__" not in report["FrozenOrderedSet"]
+
+    assert json.loads(prof.to_json(indent=1)) == report
+
+
+def test_profile_subclasses() -> None:
+    with profile() as prof:
+        iset = IndexSet([1, 2, 3])
+        assert iset[1] == 2
+        fiset = FrozenIndexSet([1, 2, 3])
+        assert hash(fiset) == hash(frozenset([1, 2, 3]))
+        tset = TrackedOrderedSet([1])
+        tset.add(2)
+        assert list(tset) == [1, 2]
+
+    report = prof.report()
+    assert report["IndexSet"]["__getitem__"]["calls"] == 1
+    # IndexSet.__init__ calls OrderedSet.__init__.
+    assert report["IndexSet"]["__init__"]["calls"] == 2
+    assert report["FrozenIndexSet"]["__hash__"]["calls"] == 1
+    # Methods overridden in subclasses outside orderedsets/__init__.py are not
+    # profiled.
+    assert "add" not in report["TrackedOrderedSet"]
+    assert report["TrackedOrderedSet"]["__iter__"]["calls"] == 1
+
+
+def test_sampling() -> None:
+    samples: list[tuple[Any, ...]] = []
+
+    def hook(cls_name: str, method: str, elapsed: float, size: int | None) \
+            -> None:
+        samples.append((cls_name, method, size))
+
+    s = OrderedSet[int]()
+    with profile(sample_every=3, hook=hook) as prof:
+        for i in range(10):
+            s.add(i)
+
+    add = prof.report()["OrderedSet"]["add"]
+    assert add["calls"] == 10
+    assert add["sampled_calls"] == 3
+    assert samples == [("OrderedSet", "add", 2), ("OrderedSet", "add", 5),
+                       ("OrderedSet", "add", 8)]
+
+    prof.reset()
+    assert prof.report() == {}
+
+    with pytest.raises(ValueError):
+        Profile(sample_every=0)
+
+
+def test_enable_disable() -> None:
+    original_add = OrderedSet.add
+    assert disable() is None
+
+    prof = enable()
+    assert OrderedSet.add is not original_add
+    with pytest.raises(RuntimeError):
+        enable()
+    wrapped_add = OrderedSet.add
+    assert disable() is prof
+
+    # No overhead when disabled
+    assert OrderedSet.add is original_add
+
+    # Wrappers that outlive the profiling session still work
+    s = OrderedSet[int]()
+    wrapped_add(s, 1)
+    assert s == {1}
+    assert prof.report() == {}
+
+
+def test_environment(tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+                     capsys: pytest.CaptureFixture[str]) -> None:
+    import atexit
+    registered: list[Any] = []
+    monkeypatch.setattr(atexit, "register",
+                        lambda *args: registered.append(args))
+
+    filename = str(tmp_path / "report.json")
+    profiling._enable_from_environment(filename)
+    try:
+        OrderedSet([1, 2]).add(3)
+    finally:
+        disable()
+
+    func, prof, destination = registered[0]
+    func(prof, destination)
+    with open(filename) as f:
+        assert json.load(f)["OrderedSet"]["add"]["calls"] == 1
+
+    func(prof, "1")
+    assert json.loads(capsys.readouterr().err)["OrderedSet"]["add"]["calls"] == 1
+
+
+def test_environment_subprocess(tmp_path: Path) -> None:
+    filename = str(tmp_path / "report.json")
+    subprocess.run(
+        [sys.executable, "-c",
+         "from orderedsets import OrderedSet; OrderedSet([1]).add(2)"],
+        env={**os.environ, "ORDEREDSETS_PROFILE": filename}, check=True)
+
+    with open(filename) as f:
+        assert json.load(f)["OrderedSet"]["add"]["calls"] == 1
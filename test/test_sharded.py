@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+__copyright__ = """
+Copyright (C) 2026 University of Illinois Board of Trustees
+"""
+
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import pickle
+import random
+
+import pytest
+
+from orderedsets import OrderedSet
+from orderedsets.sharded import ShardedOrderedSet
+
+
+def _random_update(rng: random.Random, sset: ShardedOrderedSet[int],
+                   ref: OrderedSet[int]) -> None:
+    op = rng.randrange(9)
+    other = OrderedSet(rng.randrange(100) for _ in range(rng.choice([1, 20])))
+    x = next(iter(other))
+    if op == 0:
+        sset.add(x)
+        ref.add(x)
+    elif op == 1:
+        sset.discard(x)
+        ref.discard(x)
+    elif op == 2 and x in ref:
+        sset.remove(x)
+        ref.remove(x)
+    elif op == 3 and ref:
+        assert sset.pop() == ref.pop()
+    elif op == 4:
+        sset |= other
+        ref |= other
+    elif op == 5:
+        sset -= other
+        ref -= other
+    elif op == 6:
+        sset &= other | OrderedSet(list(ref)[::2])
+        ref &= other | OrderedSet(list(ref)[::2])
+    elif op == 7:
+        sset ^= other
+        ref ^= other
+    else:
+        sset.intersection_update(list(other) + list(ref)[1::2])
+        ref.intersection_update(list(other) + list(ref)[1::2])
+
+
+@pytest.mark.parametrize("shards", [1, 7, 64])
+def test_sharded_mutations(shards: int) -> None:
+    rng = random.Random(shards)
+    sset = ShardedOrderedSet(rng.sample(range(100), 50), shards=shards)
+    ref = OrderedSet(sset)
+    for _ in range(1000):
+        _random_update(rng, sset, ref)
+        assert list(sset) == list(ref)
+        assert len(sset) == len(ref)
+        assert sset == ref
+
+    sset.clear()
+    assert not sset
+    with pytest.raises(KeyError):
+        sset.pop()
+    with pytest.raises(KeyError):
+        sset.remove(1)
+
+
+def test_sharded_balance() -> None:
+    # Consecutive ints, whose hashes only differ in their low bits, are
+    # spread evenly over the shards.
+    sset = ShardedOrderedSet(range(64_000), shards=64)
+    assert all(900 < len(shard) < 1100 for shard in sset._shards)
+    # The elements of a shard do not share their low bits.
+    assert len({e % 64 for e in sset._shards[0]}) == 64
+
+
+def test_sharded_pop_after_removals() -> None:
+    sset = ShardedOrderedSet(range(1000), shards=8)
+    for i in range(0, 1000, 3):
+        sset.discard(i)
+    ref = OrderedSet(sset)
+    while ref:
+        assert sset.pop() == ref.pop()
+        assert len(sset) == len(ref)
+    with pytest.raises(KeyError):
+        sset.pop()
+
+    # Removed elements do not grow the insertion order without bound.
+    for i in range(10_000):
+        sset.add(i)
+        sset.discard(i - 1)
+    assert list(sset) == [9999]
+    assert len(sset._order) < 100
+
+
+def test_sharded_incremental_compaction() -> None:
+    sset = ShardedOrderedSet(range(1000), shards=8)
+    ref = OrderedSet(sset)
+    i = 0
+    while sset._compacted is None:
+        if i % 3:
+            sset.discard(i)
+            ref.discard(i)
+        i += 1
+    # Compacting is spread over the following operations.
+    assert 0 < len(sset._compacted) < 10
+    assert list(sset) == list(ref)
+
+    sset.add(-1)
+    ref.add(-1)
+    sset.remove(999)
+    ref.remove(999)
+    assert list(sset) == list(ref)
+    while ref:
+        assert sset.pop() == ref.pop()
+        assert list(sset) == list(ref)
+    assert not sset
+    with pytest.raises(KeyError):
+        sset.pop()
+
+
+def test_sharded_operations() -> None:
+    sset = ShardedOrderedSet([3, 1, 2], shards=2)
+    ref = OrderedSet([3, 1, 2])
+    for other in ([2, 4], {5, 1}, OrderedSet([1, 6])):
+        for name in ("union", "intersection", "difference",
+                     "symmetric_difference", "issubset", "issuperset"):
+            result = getattr(sset, name)(other)
+            assert result == getattr(ref, name)(other)
+            if isinstance(result, ShardedOrderedSet):
+                assert list(result) == list(getattr(ref, name)(other))
+                assert len(result._shards) == 2
+
+    other_set = OrderedSet([1, 4])
+    assert list(sset & other_set) == list(ref & other_set)
+    assert list(sset | other_set) == list(ref | other_set)
+    assert list(sset - other_set) == list(ref - other_set)
+    assert list(sset ^ other_set) == list(ref ^ other_set)
+    assert sset.copy() == sset and sset.copy() is not sset
+    assert sset != [3, 1, 2]
+
+    sset.difference_update(sset)
+    assert repr(sset) == "ShardedOrderedSet()"
+    assert repr(ShardedOrderedSet()) == "ShardedOrderedSet()"
+
+    with pytest.raises(ValueError):
+        ShardedOrderedSet(shards=0)
+
+
+def test_sharded_pickle() -> None:
+    sset = ShardedOrderedSet("abcd", shards=3)
+    sset.discard("b")
+    other = pickle.loads(pickle.dumps(sset))
+    assert list(other) == ["a", "c", "d"]
+    assert len(other._shards) == 3
+    other.add("b")
+    assert list(other) == ["a", "c", "d", "b"]
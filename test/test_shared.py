@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+__copyright__ = """
+Copyright (C) 2026 University of Illinois Board of Trustees
+"""
+
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import pickle
+from typing import Any
+
+import pytest
+
+from orderedsets import FrozenIndexSet, FrozenOrderedSet
+
+pytest.importorskip("multiprocessing.shared_memory")
+
+from orderedsets.shared import SharedFrozenOrderedSet
+
+_elements: list[Any] = ["d", "a", 3, -200, 2**70, b"x", "\udcff", ""]
+
+
+def test_shared_basic() -> None:
+    with SharedFrozenOrderedSet([*_elements, "d", 3]) as sset:
+        assert len(sset) == len(_elements)
+        assert list(sset) == _elements
+        assert set(sset) == set(_elements)
+        assert sset == FrozenOrderedSet(_elements)
+        assert hash(sset) == hash(frozenset(_elements))
+        assert hash(sset) == hash(sset)
+
+        for e in _elements:
+            assert e in sset
+        assert 3.0 in sset
+        assert 3.5 not in sset
+        assert "b" not in sset
+        assert None not in sset
+        assert 4 not in sset
+
+        assert repr(sset) == repr(FrozenOrderedSet(_elements)).replace(
+            "FrozenOrderedSet", "SharedFrozenOrderedSet")
+        assert repr(SharedFrozenOrderedSet.attach(sset.name)) \
+            .startswith("SharedFrozenOrderedSet({'d'")
+
+
+def test_shared_empty() -> None:
+    sset: SharedFrozenOrderedSet[Any]
+    with SharedFrozenOrderedSet() as sset:
+        assert len(sset) == 0
+        assert list(sset) == []
+        assert "a" not in sset
+        assert repr(sset) == "SharedFrozenOrderedSet()"
+
+    with pytest.raises(TypeError):
+        SharedFrozenOrderedSet([1.5])
+
+
+def test_shared_indexing() -> None:
+    fiset = FrozenIndexSet(_elements)
+    with SharedFrozenOrderedSet(fiset) as sset:
+        for i in range(-len(fiset), len(fiset)):
+            assert sset[i] == fiset[i]
+        assert sset[1:5:2] == fiset[1:5:2]
+        assert sset[-2:-8:-2] == fiset[-2:-8:-2]
+        assert sset.index("a") == 1
+
+        with pytest.raises(IndexError):
+            sset[len(fiset)]
+        with pytest.raises(TypeError):
+            sset["a"]  # type: ignore[index]
+        with pytest.raises(ValueError):
+            sset.index("b")
+        with pytest.raises(ValueError):
+            sset.index(None)
+
+
+def test_shared_set_operations() -> None:
+    with SharedFrozenOrderedSet(["a", "b", "c"]) as sset:
+        for result in (sset | {"d"}, sset & {"b"}, sset - {"b"}, sset ^ {"b", "e"},
+                       sset.union({"d"}), sset.intersection({"b"}),
+                       sset.difference({"b"}), sset.symmetric_difference({"b"})):
+            assert isinstance(result, FrozenOrderedSet)
+
+        assert list(sset.union(["d"])) == ["a", "b", "c", "d"]
+        assert list(sset.intersection(["c", "a"])) == ["a", "c"]
+        assert list(sset.difference(["b"])) == ["a", "c"]
+        assert list(sset.symmetric_difference(["b", "e"])) == ["a", "c", "e"]
+
+        assert sset.issubset(["a", "b", "c", "d"])
+        assert not sset.issubset({"a"})
+        assert sset.issuperset(["a"])
+        assert not sset.issuperset(["a", "z"])
+        assert not sset.isdisjoint({"a"})
+
+
+def test_shared_attach_and_pickle() -> None:
+    sset = SharedFrozenOrderedSet(_elements)
+    try:
+        other: SharedFrozenOrderedSet[Any] = pickle.loads(pickle.dumps(sset))
+        assert other.name == sset.name
+        assert list(other) == _elements
+        with other:
+            pass
+        other.close()  # closing twice is fine
+
+        with pytest.raises(ValueError):
+            len(list(other))
+    finally:
+        sset.unlink()
+
+
+def test_shared_attach_invalid() -> None:
+    from multiprocessing.shared_memory import SharedMemory
+
+    from orderedsets.shared import _HEADER, _MAGIC
+
+    shm = SharedMemory(create=True, size=64)
+    try:
+        with pytest.raises(ValueError):
+            SharedFrozenOrderedSet.attach(shm.name)
+
+        assert shm.buf is not None
+        for nwords, error_rate in ((5, 0.01), (1, 0.)):
+            _HEADER.pack_into(shm.buf, 0, _MAGIC, 0, 2, nwords, error_rate)
+            with pytest.raises(ValueError, match="invalid filter"):
+                SharedFrozenOrderedSet.attach(shm.name)
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _count_members(sset: SharedFrozenOrderedSet[int], start: int) -> int:
+    return sum(1 for i in range(start, start + 100) if i in sset)
+
+
+def test_shared_multiprocessing() -> None:
+    from multiprocessing import Pool
+
+    with SharedFrozenOrderedSet(range(0, 1000, 2)) as sset, Pool(2) as pool:
+        counts = pool.starmap(_count_members, [(sset, i) for i in (0, 950, 2000)])
+
+    assert counts == [50, 25, 0]
+
+
+def test_shared_large() -> None:
+    with SharedFrozenOrderedSet(range(0, 10000, 3)) as sset:
+        assert all(i in sset for i in range(0, 10000, 3))
+        assert not any(i in sset for i in range(1, 10000, 3))
+        assert sset.index(9999) == len(sset) - 1
+
+
+def test_shared_filter() -> None:
+    with SharedFrozenOrderedSet(range(0, 10000, 3),
+                                filter_error_rate=0.01) as sset:
+        assert sset._filter is not None
+        # The filter holds the stable hashes of the elements.
+        assert all(h in sset._filter for h in sset._hashes)
+        assert all(i in sset for i in range(0, 10000, 3))
+        assert not any(i in sset for i in range(1, 10000, 3))
+        unhashable: object = [3]
+        assert 3.0 in sset and 3.5 not in sset and unhashable not in sset
+        assert sset.isdisjoint(range(1, 10000, 3))
+
+        other: SharedFrozenOrderedSet[Any] = pickle.loads(pickle.dumps(sset))
+        assert other._filter is not None
+        assert 9999 in other and 9998 not in other
+        other.close()
+
+        # Attached sets map the filter of the creator read-only.
+        other = SharedFrozenOrderedSet.attach(sset.name)
+        assert other._filter is not None
+        assert other._filter.tobytes() == sset._filter.tobytes()
+        with pytest.raises(TypeError):
+            other._filter.add(1)
+        other.close()
+
+    with SharedFrozenOrderedSet(range(10)) as sset:
+        assert sset._filter is None
+        assert SharedFrozenOrderedSet.attach(sset.name)._filter is None
+
+    with SharedFrozenOrderedSet(["a", b"b"], filter_error_rate=0.001) as sset:
+        assert "a" in sset and b"b" in sset
+        assert "b" not in sset and b"a" not in sset
+
+
+def _filter_lookups(sset: SharedFrozenOrderedSet[Any]) -> tuple[int, bool]:
+    assert sset._filter is not None
+    found = (all(f"key{i}" in sset for i in range(1000))
+             and b"x" in sset and 1.0 in sset and "x" not in sset)
+    return hash("key0"), found
+
+
+def test_shared_filter_hash_seed(monkeypatch: Any) -> None:
+    # The filter must not depend on the hashes of str and bytes, which differ
+    # between processes.
+    import os
+    from multiprocessing import get_context
+
+    seed = "2" if os.environ.get("PYTHONHASHSEED") == "1" else "1"
+    monkeypatch.setenv("PYTHONHASHSEED", seed)
+    elements = [f"key{i}" for i in range(1000)] + [b"x", 1]
+    with SharedFrozenOrderedSet(elements, filter_error_rate=0.01) as sset, \
+            get_context("spawn").Pool(1) as pool:
+        other_hash, found = pool.apply(_filter_lookups, (sset,))
+        assert other_hash != hash("key0")
+        assert found
+
+
+def test_shared_attach_unrelated_process() -> None:
+    # A process with its own resource tracker, which must not unlink the block
+    # when the process exits.
+    import subprocess
+    import sys
+
+    sset = SharedFrozenOrderedSet(_elements[:4])
+    try:
+        code = ("from orderedsets.shared import SharedFrozenOrderedSet; "
+                f"s = SharedFrozenOrderedSet.attach({sset.name!r}); "
+                "print(list(s)); s.close()")
+        out = subprocess.run([sys.executable, "-c", code], check=True,
+                             capture_output=True, text=True)
+        assert out.stdout.strip() == repr(_elements[:4])
+        assert "leaked" not in out.stderr
+
+        other: SharedFrozenOrderedSet[Any] = \
+            SharedFrozenOrderedSet.attach(sset.name)
+        assert list(other) == _elements[:4]
+        other.close()
+    finally:
+        sset.unlink()
+
+
+def test_encoding_roundtrip() -> None:
+    from orderedsets._encoding import decode, encode
+
+    for e in [*_elements, 0, -1, 127, 128, -128, -129, 2**64, -(2**64)]:
+        assert decode(encode(e)) == e
+        assert type(decode(encode(e))) is type(e)
+
+    with pytest.raises(ValueError):
+        decode(b"?abc")
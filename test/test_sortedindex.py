@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+__copyright__ = """
+Copyright (C) 2026 University of Illinois Board of Trustees
+"""
+
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import pickle
+import random
+from bisect import bisect_left, bisect_right
+from typing import Any
+
+import pytest
+
+from orderedsets import OrderedSet
+from orderedsets.sortedindex import SortedIndexedOrderedSet, _SortedList
+
+
+@pytest.fixture(params=[4, 512])
+def load(request: Any, monkeypatch: pytest.MonkeyPatch) -> int:
+    # A small load exercises splitting and merging blocks.
+    monkeypatch.setattr(_SortedList, "load", request.param)
+    return int(request.param)
+
+
+def _check(sset: SortedIndexedOrderedSet[int], ref: OrderedSet[int]) -> None:
+    assert list(sset) == list(ref)
+    expected = sorted(ref)
+    assert list(sset._sorted) == expected
+    assert len(sset._sorted) == len(expected)
+    if expected:
+        k = random.randrange(len(expected))
+        assert sset.kth_smallest(k) == expected[k]
+        assert sset.kth_smallest(-1) == expected[-1]
+
+
+def _check_queries(sset: SortedIndexedOrderedSet[int], values: list[int],
+                   x: int, y: int) -> None:
+    assert sset.bisect_left(x) == bisect_left(values, x)
+    assert sset.bisect_right(x) == sset.bisect(x) == bisect_right(values, x)
+
+    below = [v for v in values if v <= x]
+    if below:
+        assert sset.floor(x) == below[-1]
+    else:
+        with pytest.raises(KeyError):
+            sset.floor(x)
+    above = [v for v in values if v >= x]
+    if above:
+        assert sset.ceiling(x) == above[0]
+    else:
+        with pytest.raises(KeyError):
+            sset.ceiling(x)
+
+    lo, hi = min(x, y), max(x, y)
+    assert list(sset.irange(lo, hi)) == [v for v in values if lo <= v <= hi]
+    assert list(sset.irange(lo, hi, (False, False))) == \
+        [v for v in values if lo < v < hi]
+    assert list(sset.irange(lo)) == [v for v in values if v >= lo]
+    assert list(sset.irange(maximum=hi, inclusive=(True, False))) == \
+        [v for v in values if v < hi]
+
+
+def test_sortedindex_queries(load: int) -> None:
+    rng = random.Random(load)
+    values = sorted(rng.sample(range(1000), 300))
+    sset = SortedIndexedOrderedSet(rng.sample(values, len(values)))
+    for _ in range(200):
+        _check_queries(sset, values, rng.randrange(-10, 1010),
+                       rng.randrange(-10, 1010))
+    assert list(sset.irange()) == values
+
+    with pytest.raises(IndexError):
+        sset.kth_smallest(300)
+    with pytest.raises(IndexError):
+        sset.kth_smallest(-301)
+
+    empty: SortedIndexedOrderedSet[int] = SortedIndexedOrderedSet()
+    _check_queries(empty, [], 1, 2)
+
+
+def _random_update(rng: random.Random, sset: SortedIndexedOrderedSet[int],
+                   ref: OrderedSet[int]) -> None:
+    op = rng.randrange(9)
+    other = [rng.randrange(200) for _ in range(rng.choice([1, 10, 100]))]
+    x = other[0]
+    if op == 0:
+        sset.add(x)
+        ref.add(x)
+    elif op == 1:
+        sset.discard(x)
+        ref.discard(x)
+    elif op == 2 and x in ref:
+        sset.remove(x)
+        ref.remove(x)
+    elif op == 3 and ref:
+        assert sset.pop() == ref.pop()
+    elif op == 4:
+        sset |= OrderedSet(other)
+        ref |= OrderedSet(other)
+    elif op == 5:
+        sset -= OrderedSet(other)
+        ref -= OrderedSet(other)
+    elif op == 6:
+        sset &= OrderedSet(other + list(ref)[::2])
+        ref &= OrderedSet(other + list(ref)[::2])
+    elif op == 7:
+        sset ^= OrderedSet(other)
+        ref ^= OrderedSet(other)
+    else:
+        sset.intersection_update(iter(other + list(ref)[1::2]))
+        ref.intersection_update(iter(other + list(ref)[1::2]))
+
+
+def test_sortedindex_mutations(load: int) -> None:
+    rng = random.Random(load)
+    sset = SortedIndexedOrderedSet(rng.sample(range(200), 100))
+    ref = OrderedSet(sset)
+    for _ in range(1000):
+        _random_update(rng, sset, ref)
+        _check(sset, ref)
+
+    sset.clear()
+    ref.clear()
+    _check(sset, ref)
+    sset.update(range(10), range(5, 15))
+    ref.update(range(10), range(5, 15))
+    _check(sset, ref)
+
+    sset.sort(reverse=True)
+    assert list(sset) == list(range(14, -1, -1))
+    assert list(sset.irange(3, 5)) == [3, 4, 5]
+
+
+def test_sortedindex_errors() -> None:
+    sset = SortedIndexedOrderedSet([1, 2])
+    with pytest.raises(TypeError):
+        sset.add("a")  # type: ignore[arg-type]
+    assert list(sset) == [1, 2]
+    assert list(sset.irange()) == [1, 2]
+
+    # The elements before the incomparable one are added.
+    with pytest.raises(TypeError):
+        sset.update([3, "a", 4])  # type: ignore[list-item]
+    assert list(sset) == [1, 2, 3]
+    assert list(sset.irange()) == [1, 2, 3]
+
+    with pytest.raises(KeyError):
+        sset.remove(5)
+    sset.clear()
+    with pytest.raises(KeyError):
+        sset.pop()
+
+
+def test_sortedindex_pickle_copy() -> None:
+    sset = SortedIndexedOrderedSet([3, 1, 2])
+    for other in (pickle.loads(pickle.dumps(sset)), sset.copy(),
+                  sset | {0}):
+        assert isinstance(other, SortedIndexedOrderedSet)
+        assert list(other.irange()) == sorted(other)
+        assert list(other)[:3] == [3, 1, 2]
+
+
+def test_sortedlist_merge_split(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(_SortedList, "load", 4)
+    slist = _SortedList(range(8))
+    for i in range(8, 12):
+        slist.add(i)
+    assert list(map(len, slist._blocks)) == [4, 8]
+
+    # The small first block is merged with the full second one, which is too
+    # large and is split evenly.
+    for i in (3, 2, 1):
+        slist.remove(i)
+    assert list(map(len, slist._blocks)) == [4, 5]
+    assert list(slist) == [0, *range(4, 12)]
+    assert [slist.at(k) for k in range(9)] == list(slist)
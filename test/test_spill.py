@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+__copyright__ = """
+Copyright (C) 2026 University of Illinois Board of Trustees
+"""
+
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import gc
+import os
+import random
+from typing import Any
+
+import pytest
+
+from orderedsets import OrderedSet
+from orderedsets._bloom import BloomFilter
+from orderedsets.spill import SpillingOrderedSet
+
+
+def test_bloom_filter() -> None:
+    bloom = BloomFilter(1000, 0.01)
+    added = [random.getrandbits(64) for _ in range(1000)]
+    for h in added:
+        bloom.add(h)
+    assert all(h in bloom for h in added)
+    assert not bloom.full
+    false_positives = sum(random.getrandbits(64) in bloom for _ in range(10000))
+    assert false_positives < 300
+
+    bloom.add(-1)
+    assert bloom.full
+    assert -1 in bloom
+
+    with pytest.raises(ValueError):
+        BloomFilter(10, 0)
+    with pytest.raises(ValueError, match="invalid filter words"):
+        BloomFilter(10, 0.01, memoryview(bytes(8)).cast("Q"))
+
+
+@pytest.mark.parametrize("error_rate", [0.01, 0.001])
+@pytest.mark.parametrize("consecutive", [False, True])
+def test_bloom_filter_error_rate(error_rate: float, consecutive: bool) -> None:
+    # Hashes of consecutive ints only differ in their low bits.
+    rng = random.Random(0)
+    n, probes = 20_000, 200_000
+    added = range(n) if consecutive else [rng.getrandbits(64) for _ in range(n)]
+    bloom = BloomFilter(n, error_rate)
+    for h in added:
+        bloom.add(h)
+    absent = (range(n, n + probes) if consecutive
+              else [rng.getrandbits(64) for _ in range(probes)])
+    false_positives = sum(h in bloom for h in absent)
+    assert false_positives <= error_rate * probes
+
+
+def _random_update(rng: random.Random, sset: SpillingOrderedSet[Any],
+                   ref: OrderedSet[Any]) -> None:
+    op = rng.randrange(9)
+    other = OrderedSet(rng.choice([rng.randrange(60), str(rng.randrange(60))])
+                       for _ in range(rng.choice([1, 10])))
+    x = next(iter(other))
+    if op == 0:
+        sset.add(x)
+        ref.add(x)
+    elif op == 1:
+        sset.discard(x)
+        ref.discard(x)
+    elif op == 2 and x in ref:
+        sset.remove(x)
+        ref.remove(x)
+    elif op == 3 and ref:
+        assert sset.pop() == ref.pop()
+    elif op == 4:
+        sset |= other
+        ref |= other
+    elif op == 5:
+        sset -= other
+        ref -= other
+    elif op == 6:
+        sset &= other | OrderedSet(list(ref)[::2])
+        ref &= other | OrderedSet(list(ref)[::2])
+    elif op == 7:
+        sset ^= other
+        ref ^= other
+    else:
+        sset.intersection_update(list(other) + list(ref)[1::2])
+        ref.intersection_update(list(other) + list(ref)[1::2])
+
+
+@pytest.mark.parametrize("max_in_memory", [1, 8, 1000])
+def test_spill_mutations(max_in_memory: int) -> None:
+    rng = random.Random(max_in_memory)
+    with SpillingOrderedSet(range(40), max_in_memory=max_in_memory) as sset:
+        ref = OrderedSet(range(40))
+        for _ in range(600):
+            _random_update(rng, sset, ref)
+            assert list(sset) == list(ref)
+            assert len(sset) == len(ref)
+            assert len(sset._hot) <= max_in_memory
+        assert (sset.spilled > 0) == (max_in_memory < len(ref))
+
+        sset.clear()
+        assert not sset
+        with pytest.raises(KeyError):
+            sset.pop()
+        with pytest.raises(KeyError):
+            sset.remove(1)
+
+
+def test_spill_lookup(tmp_path: Any) -> None:
+    path = str(tmp_path / "set.sqlite3")
+    with SpillingOrderedSet(range(3000), max_in_memory=100, path=path,
+                            error_rate=0.001) as sset:
+        assert os.path.exists(path)
+        assert sset.spilled > 2000
+        # The Bloom filter grew with the spilled elements.
+        assert sset._bloom.capacity >= sset.spilled
+        assert 5 in sset and 5.0 in sset and 2999 in sset
+        others: list[object] = [5.5, "5", None]
+        assert not any(e in sset for e in others)
+        assert -1 not in sset
+
+        sset.add(5)
+        assert list(sset)[:3] == [0, 1, 2]
+        sset.discard(1.0)  # type: ignore[arg-type]
+        sset.discard(-1)
+        assert list(sset)[:3] == [0, 2, 3]
+        with pytest.raises(TypeError):
+            sset.add(1.5)  # type: ignore[arg-type]
+    assert os.path.exists(path)
+
+
+def test_spill_operations() -> None:
+    with SpillingOrderedSet([3, 1, 2], max_in_memory=1) as sset:
+        ref = OrderedSet([3, 1, 2])
+        for other in ([2, 4], {5, 1}, OrderedSet([1, 6])):
+            for name in ("union", "intersection", "difference",
+                         "symmetric_difference", "issubset", "issuperset"):
+                result = getattr(sset, name)(other)
+                assert result == getattr(ref, name)(other)
+                if isinstance(result, SpillingOrderedSet):
+                    assert list(result) == list(getattr(ref, name)(other))
+                    assert result._max_in_memory == 1
+                    result.close()
+
+        other_set = OrderedSet([1, 4])
+        for result, expected in [(sset & other_set, ref & other_set),
+                                 (sset | other_set, ref | other_set),
+                                 (sset - other_set, ref - other_set),
+                                 (sset ^ other_set, ref ^ other_set),
+                                 (sset.copy(), ref)]:
+            assert list(result) == list(expected)
+            result.close()
+        assert sset != [3, 1, 2]
+
+        sset.difference_update(sset)
+        assert repr(sset) == "SpillingOrderedSet()"
+        sset.update([4, 5])
+        assert repr(sset) == "SpillingOrderedSet({4, 5})"
+
+    with pytest.raises(ValueError):
+        SpillingOrderedSet(max_in_memory=0)
+
+
+def test_spill_temporary_file() -> None:
+    sset = SpillingOrderedSet(range(10), max_in_memory=2)
+    info = sset._finalizer.peek()
+    assert info is not None
+    path = info[2][1]
+    assert os.path.exists(path)
+    del sset, info
+    gc.collect()
+    assert not os.path.exists(path)
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+__copyright__ = """
+Copyright (C) 2026 University of Illinois Board of Trustees
+"""
+
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import random
+
+import pytest
+
+from orderedsets import OrderedSet
+from orderedsets.tracking import Delta, TrackedOrderedSet
+
+
+def test_tracking_coalescing() -> None:
+    tset = TrackedOrderedSet("abc")
+    token = tset.checkpoint()
+    assert tset.changes_since(token) == Delta()
+
+    tset.add("d")
+    tset.add("d")
+    tset.discard("a")
+    tset.discard("x")
+    tset.add("x")
+    tset.remove("x")
+    tset.remove("b")
+    tset.add("b")
+
+    delta = tset.changes_since(token)
+    assert delta == Delta(added=["d", "b"], removed=["a", "b"])
+    assert delta != Delta(added=["d", "b"])
+    assert delta != ("d", "b")
+    assert hash(delta) == hash(Delta(added=["d", "b"], removed=["a", "b"]))
+    assert len(delta) == 4
+    assert repr(delta) == "Delta(added=('d', 'b'), removed=('a', 'b'))"
+
+    replica = OrderedSet("abc")
+    delta.apply_to(replica)
+    assert list(replica) == list(tset) == ["c", "d", "b"]
+
+    with pytest.raises(KeyError):
+        tset.remove("q")
+
+
+def test_tracking_trim() -> None:
+    tset = TrackedOrderedSet([1, 2, 3])
+    tset.add(4)
+    token = tset.checkpoint()
+    tset.add(5)
+    tset.trim(token)
+    assert tset.changes_since(token) == Delta(added=[5])
+    assert len(tset._log) == 1
+
+    for bad_token in (0, token + 2):
+        with pytest.raises(ValueError):
+            tset.changes_since(bad_token)
+        with pytest.raises(ValueError):
+            tset.trim(bad_token)
+
+
+def test_tracking_operations() -> None:
+    tset = TrackedOrderedSet(range(10))
+    oset = OrderedSet(range(10))
+    replica = OrderedSet(range(10))
+    token = tset.checkpoint()
+
+    for s in (tset, oset):
+        s.update([3, 11], [12])
+        s.difference_update([0, 99], [1])
+        s.intersection_update(range(20), [2, 3, 4, 5, 6, 7, 11, 12])
+        s.symmetric_difference_update([2, 30, 3, 31, 30])
+        s.pop()
+        s.sort(key=lambda x: -x)
+        s.sort(key=lambda x: -x)
+    assert list(tset) == list(oset)
+    sorted_replica = OrderedSet(range(10))
+    tset.changes_since(token).apply_to(sorted_replica)
+    assert list(sorted_replica) == list(tset)
+
+    orig = tset
+    tset |= {100}
+    tset &= {4, 5, 100}
+    tset -= {5}
+    tset ^= {4, 6}
+    assert tset is orig
+    assert list(tset) == [100, 6]
+
+    tset.difference_update(tset)
+    assert not tset
+    tset.update([7, 8])
+    tset.clear()
+    assert not tset
+
+    tset.changes_since(token).apply_to(replica)
+    assert list(replica) == list(tset)
+
+
+def test_tracking_random() -> None:
+    rng = random.Random(1234)
+    tset = TrackedOrderedSet(range(50))
+    replica = OrderedSet(range(50))
+    token = tset.checkpoint()
+
+    for step in range(2000):
+        e = rng.randrange(100)
+        if rng.random() < 0.5:
+            tset.add(e)
+        else:
+            tset.discard(e)
+
+        if step % 97 == 0:
+            tset.changes_since(token).apply_to(replica)
+            assert list(replica) == list(tset)
+            token = tset.checkpoint()
+            tset.trim(token)
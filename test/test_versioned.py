@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+__copyright__ = """
+Copyright (C) 2026 University of Illinois Board of Trustees
+"""
+
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import gc
+import pickle
+import random
+
+import pytest
+
+from orderedsets import FrozenOrderedSet, OrderedSet
+from orderedsets.versioned import Snapshot, VersionedOrderedSet
+
+
+def test_versioned_snapshot() -> None:
+    vset = VersionedOrderedSet(["a", "b", "c"])
+    snap1 = vset.snapshot()
+    assert vset.snapshot()._snapshot_version is snap1._snapshot_version
+
+    vset.discard("a")
+    vset.add("d")
+    vset.discard("c")
+    vset.add("c")
+    snap2 = vset.snapshot()
+    vset.remove("b")
+    vset.pop()
+
+    assert isinstance(snap1, FrozenOrderedSet)
+    assert list(snap1) == ["a", "b", "c"]
+    assert len(snap1) == 3
+    assert "a" in snap1
+    assert "d" not in snap1
+    assert "x" not in snap1
+    assert list(snap2) == ["b", "d", "c"]
+    assert "c" in snap2
+    assert list(vset) == ["d"]
+    assert "d" in snap2
+    assert "b" in snap2
+
+    # Operations inherited from FrozenOrderedSet
+    assert snap1 == {"a", "b", "c"}
+    assert hash(snap1) == hash(frozenset("abc"))
+    assert repr(snap2) == "Snapshot({'b', 'd', 'c'})"
+    assert list(snap1.union(["x"])) == ["a", "b", "c", "x"]
+    assert list(snap1 & snap2) == ["b", "c"]
+    assert list(snap1 - snap2) == ["a"]
+    assert list(snap1 ^ {"a", "x"}) == ["b", "c", "x"]
+    assert type(snap1.copy()) is FrozenOrderedSet
+    assert snap1.copy() == snap1
+
+    snap3 = pickle.loads(pickle.dumps(snap2))
+    assert type(snap3) is FrozenOrderedSet
+    assert list(snap3) == ["b", "d", "c"]
+
+
+def test_versioned_no_snapshots() -> None:
+    vset = VersionedOrderedSet(range(5))
+    snap = vset.snapshot()
+    del snap
+    gc.collect()
+
+    vset.discard(1)
+    assert vset._version is None
+    vset.discard(2)
+    vset.add(1)
+
+    snap = vset.snapshot()
+    vset.clear()
+    assert list(snap) == [0, 3, 4, 1]
+    with pytest.raises(KeyError):
+        vset.remove(1)
+    with pytest.raises(KeyError):
+        vset.pop()
+    assert len(snap) == 4
+
+    vset2 = pickle.loads(pickle.dumps(vset))
+    assert vset2._version is None
+    vset2.update([7, 8])
+    assert list(vset2) == [7, 8]
+    assert not vset
+
+
+def test_versioned_operations() -> None:
+    vset = VersionedOrderedSet(range(10))
+    oset = OrderedSet(range(10))
+    snap = vset.snapshot()
+
+    for s in (vset, oset):
+        s.update([3, 11], [12])
+        s.difference_update([0, 99], [1])
+        s.intersection_update(range(20), [2, 3, 4, 5, 6, 7, 11, 12])
+        s.symmetric_difference_update([2, 30, 3, 31, 30])
+        s.pop()
+        s.sort(key=lambda x: -x)
+        s.sort(key=lambda x: -x)
+    assert list(vset) == list(oset)
+    assert list(snap.sorted(reverse=True)) == list(range(9, -1, -1))
+    assert list(vset.copy()) == list(oset)
+
+    orig = vset
+    vset |= {100}
+    vset &= {4, 5, 100}
+    vset -= {5}
+    vset ^= {4, 6}
+    assert vset is orig
+    assert list(vset) == [100, 6]
+    vset.difference_update(vset)
+    assert not vset
+
+    assert list(snap) == list(range(10))
+    assert list(snap.sorted(key=lambda x: -x)) == list(range(9, -1, -1))
+    assert isinstance(snap, Snapshot)
+
+
+def test_versioned_random() -> None:
+    rng = random.Random(42)
+    vset = VersionedOrderedSet(range(30))
+    snapshots = [(vset.snapshot(), list(vset))]
+
+    for step in range(3000):
+        e = rng.randrange(60)
+        r = rng.random()
+        if r < 0.45:
+            vset.add(e)
+        elif r < 0.9:
+            vset.discard(e)
+        elif vset:
+            vset.pop()
+
+        if step % 50 == 0:
+            snapshots.append((vset.snapshot(), list(vset)))
+        if step % 170 == 0:
+            del snapshots[rng.randrange(len(snapshots))]
+            gc.collect()
+
+        if step % 100 == 0:
+            for snap, expected in snapshots:
+                assert list(snap) == expected
+                assert len(snap) == len(expected)
+                for i in range(60):
+                    assert (i in snap) == (i in expected)
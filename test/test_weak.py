@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+__copyright__ = """
+Copyright (C) 2026 University of Illinois Board of Trustees
+"""
+
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import gc
+import random
+import weakref
+from typing import Any
+
+import pytest
+
+from orderedsets import OrderedSet
+from orderedsets.weak import WeakOrderedSet
+
+
+class Obj:
+    def __init__(self, value: int) -> None:
+        self.value = value
+
+    def __repr__(self) -> str:
+        return f"Obj({self.value})"
+
+    def __lt__(self, other: Obj) -> bool:
+        return self.value < other.value
+
+
+def test_weak_collect() -> None:
+    objs = [Obj(i) for i in range(10)]
+    wset = WeakOrderedSet(objs)
+    assert list(wset) == objs
+
+    del objs[3], objs[5]
+    gc.collect()
+    # The dead references are only removed by the next operation.
+    assert len(wset._pending) == 2
+    assert len(wset) == 8
+    assert list(wset) == objs
+    assert not wset._pending
+    assert len(wset._dict) == 8
+
+    wset.add(Obj(99))
+    assert list(wset) == objs
+
+    objs.clear()
+    assert len(wset) == 0
+    assert repr(wset) == "WeakOrderedSet()"
+    with pytest.raises(KeyError):
+        wset.pop()
+
+
+def test_weak_collect_while_iterating() -> None:
+    objs = [Obj(i) for i in range(10)]
+    wset = WeakOrderedSet(objs)
+    seen = []
+    it = iter(wset)
+    for i in range(5):
+        seen.append(next(it))
+        # Collect the next two elements.
+        objs[2 * i + 1] = Obj(-1)
+        if 2 * i + 2 < 10:
+            objs[2 * i + 2] = Obj(-1)
+    seen.extend(it)
+    del it
+    # The yielded elements are kept alive by seen.
+    assert [o.value for o in seen] == [0, 3, 5, 7, 9]
+    assert list(wset) == seen
+    assert not wset._pending
+
+
+def test_weak_pop_skips_dead() -> None:
+    objs = [Obj(i) for i in range(4)]
+    wset = WeakOrderedSet(objs)
+    it = iter(wset)
+    next(it)
+    del objs[2:]
+    # While iterating, the dead references are not removed yet.
+    assert len(wset._dict) == 4
+    assert wset.pop() is objs[1]
+    del it
+    assert list(wset) == [objs[0]]
+
+
+def _random_update(rng: random.Random, pool: list[Obj],
+                   wset: WeakOrderedSet[Obj], ref: OrderedSet[Obj]) -> None:
+    op = rng.randrange(10)
+    other = OrderedSet(rng.choice(pool) for _ in range(rng.choice([1, 10])))
+    x = next(iter(other))
+    if op == 0:
+        wset.add(x)
+        ref.add(x)
+    elif op == 1:
+        wset.discard(x)
+        ref.discard(x)
+    elif op == 2 and x in ref:
+        wset.remove(x)
+        ref.remove(x)
+    elif op == 3 and ref:
+        assert wset.pop() is ref.pop()
+    elif op == 4:
+        wset |= other
+        ref |= other
+    elif op == 5:
+        wset -= other
+        ref -= other
+    elif op == 6:
+        wset &= other | OrderedSet(list(ref)[::2])
+        ref &= other | OrderedSet(list(ref)[::2])
+    elif op == 7:
+        wset ^= other
+        ref ^= other
+    elif op == 8:
+        reverse = rng.random() < 0.5
+        wset.sort(reverse=reverse)
+        ref.sort(reverse=reverse)
+    else:
+        wset.intersection_update(list(other) + list(ref)[1::2])
+        ref.intersection_update(list(other) + list(ref)[1::2])
+
+
+def test_weak_mutations() -> None:
+    rng = random.Random(0)
+    pool = [Obj(i) for i in range(50)]
+    wset = WeakOrderedSet(pool[:20])
+    ref = OrderedSet(pool[:20])
+    for _ in range(1000):
+        _random_update(rng, pool, wset, ref)
+        if rng.random() < 0.05:
+            # Replace an object, so that the old one is collected.
+            i = rng.randrange(len(pool))
+            ref.discard(pool[i])
+            pool[i] = Obj(i)
+        assert list(wset) == list(ref)
+        assert len(wset) == len(ref)
+
+
+def test_weak_operations() -> None:
+    a, b, c, d = (Obj(i) for i in range(4))
+    wset = WeakOrderedSet([c, a, b])
+    ref = OrderedSet([c, a, b])
+    for other in ([b, d], {d, a}, OrderedSet([a, c])):
+        for name in ("union", "intersection", "difference",
+                     "symmetric_difference", "issubset", "issuperset"):
+            result = getattr(wset, name)(other)
+            assert result == getattr(ref, name)(other)
+            if isinstance(result, WeakOrderedSet):
+                assert list(result) == list(getattr(ref, name)(other))
+
+    other_set = OrderedSet([a, d])
+    assert list(wset & other_set) == list(ref & other_set)
+    assert list(wset | other_set) == list(ref | other_set)
+    assert list(wset - other_set) == list(ref - other_set)
+    assert list(wset ^ other_set) == list(ref ^ other_set)
+    assert wset.copy() == wset and wset.copy() is not wset
+    assert wset != [c, a, b]
+    others: list[object] = [1, []]
+    assert not any(e in wset for e in others)
+    assert repr(wset) == "WeakOrderedSet({Obj(2), Obj(0), Obj(1)})"
+
+    wset.sort()
+    assert list(wset) == [a, b, c]
+    wset.sort()
+    assert list(wset) == [a, b, c]
+
+    with pytest.raises(KeyError):
+        wset.remove(d)
+    with pytest.raises(TypeError):
+        wset.add(1)  # type: ignore[arg-type]
+
+    wset.update(wset)
+    wset.difference_update(wset)
+    assert not wset
+    wset.add(d)
+    wset.clear()
+    assert not wset
+
+
+def test_weak_set_is_collected() -> None:
+    obj = Obj(0)
+    wset: Any = WeakOrderedSet([obj])
+    wset_ref = weakref.ref(wset)
+    # The callback of the element does not keep the set alive.
+    del wset
+    assert wset_ref() is None
+    del obj